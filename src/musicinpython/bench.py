@@ -0,0 +1,321 @@
+"""Benchmarks for the package, run with ``python -m musicinpython.bench``.
+
+Benchmarks can be picked by group, e.g. ``python -m musicinpython.bench
+lookups generators``, all groups being run by default.
+
+Imports
+=======
+:mod:`statistics`: Import the median function.
+
+:mod:`subprocess`: Import the function to run fresh interpreters.
+
+:mod:`sys`: Import the path of the running interpreter.
+
+:mod:`timeit`: Import the timing of functions.
+
+:mod:`chords`: Import the chord lookups.
+
+:mod:`scales`: Import the scale lookups.
+
+:mod:`harmonies`: Import the harmonization of scales.
+
+:mod:`chordgenerator`: Import the chord generators.
+
+:mod:`scalegenerator`: Import the scale generator.
+
+Global variables
+================
+.. data:: IMPORT_MODULES
+   :type: list[str]
+
+   Modules whose cold import is timed.
+
+.. data:: IMPORT_CODE
+   :type: str
+
+   Code run in a fresh interpreter to time the import of a module.
+
+.. data:: DATA_LOADING_CODE
+   :type: dict[str, str]
+
+   Code run in a fresh interpreter to time the loading of each data.
+
+.. data:: LOOKUP_FUNCTIONS
+   :type: dict[str, Callable]
+
+   Lookups timed once their data is loaded, with the caches of chords
+   and scales and the memos of their indexes cleared on each call.
+
+.. data:: GENERATOR_FUNCTIONS
+   :type: dict[str, Callable]
+
+   Generation of all the chords of each mode and of all the scales.
+
+.. data:: BENCHMARKS
+   :type: dict[str, Callable]
+
+   The benchmark function of each group, by group name.
+
+Functions
+=========
+:func:`time_code`: Time code run in fresh interpreters.
+
+:func:`time_function`: Time calls to a function in this interpreter.
+
+:func:`benchmark_imports`: Time the cold import of the modules.
+
+:func:`benchmark_data_loading`: Time the first access to the data.
+
+:func:`benchmark_lookups`: Time the lookups of chords, scales and harmonies.
+
+:func:`benchmark_generators`: Time the generation of chords and scales.
+
+:func:`format_results`: Format benchmark results as a table.
+
+:func:`run`: Run benchmark groups and print the results.
+"""
+import statistics
+import subprocess
+import sys
+import timeit
+import musicinpython.chords as chords
+import musicinpython.scales as scales
+import musicinpython.harmonies as harmonies
+import musicinpython.generators.chordgenerator as chordgenerator
+import musicinpython.generators.scalegenerator as scalegenerator
+
+IMPORT_MODULES = [
+    "musicinpython.notes",
+    "musicinpython.intervals",
+    "musicinpython.chords",
+    "musicinpython.scales",
+    "musicinpython.harmonies",
+    "musicinpython.cache",
+    "musicinpython.datahelper",
+    "musicinpython.generators.chordgenerator",
+    "musicinpython.generators.scalegenerator",
+    "musicinpython.main",
+]
+
+IMPORT_CODE = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+DATA_LOADING_CODE = {
+    "load chord data": (
+        "import time\n"
+        "import musicinpython.chords as chords\n"
+        "start = time.perf_counter()\n"
+        "chords.get_chord_index()\n"
+        "print(time.perf_counter() - start)\n"
+    ),
+    "load scale data": (
+        "import time\n"
+        "import musicinpython.scales as scales\n"
+        "start = time.perf_counter()\n"
+        "scales.get_scale_index()\n"
+        "print(time.perf_counter() - start)\n"
+    ),
+}
+
+
+def _clear_lookups():
+    """Clear the chord and scale caches and the memos of their indexes.
+
+    The loaded tables are kept, so a lookup made afterwards is timed
+    from the table search on, as the first lookup of a chord or scale.
+    """
+    chords.CHORD_CACHE.clear()
+    scales.SCALE_CACHE.clear()
+    for index in (chords.get_chord_index(), scales.get_scale_index()):
+        for memo in vars(index).values():
+            if isinstance(memo, dict):
+                memo.clear()
+
+
+def _uncached(function):
+    """Return a function calling another after :func:`_clear_lookups`."""
+
+    def uncached_function():
+        _clear_lookups()
+        return function()
+
+    return uncached_function
+
+
+LOOKUP_FUNCTIONS = {
+    "chords.get_chord by name": _uncached(
+        lambda: chords.get_chord(name_param="Cm7(9)")
+    ),
+    "chords.get_chord by notes": _uncached(
+        lambda: chords.get_chord(notes_param="C Eb G Bb D")
+    ),
+    "scales.get_scale": _uncached(
+        lambda: scales.get_scale("C D E F G A B")
+    ),
+    "ScaleNames.get_alternative_names": _uncached(
+        lambda: scales.ScaleNames([]).get_alternative_names("C D E F G A B")
+    ),
+    "harmonies.get_scale_harmony": _uncached(
+        lambda: harmonies.get_scale_harmony("C Major")
+    ),
+}
+
+GENERATOR_FUNCTIONS = {
+    f"generate_chords {mode}": (
+        lambda generator_class=generator_class: chordgenerator.generate_chords(
+            generator_class()
+        )
+    )
+    for mode, generator_class in chordgenerator.GENERATOR_CLASSES.items()
+}
+GENERATOR_FUNCTIONS["generate_all_scales"] = scalegenerator.generate_all_scales
+
+
+def time_code(code: str, repeat=5) -> float:
+    """Time code in fresh interpreters and return the median in ms.
+
+    The code has to print the number of seconds it measured, so the
+    interpreter startup itself is left out of the measure.
+
+    :param code: The code to be run, printing its own timing.
+    :type code: str
+    :param repeat: How many interpreters to run the code in.
+    :type repeat: int
+    :returns: The median of the timings, in milliseconds.
+    :rtype: float
+    """
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        timings.append(float(output.stdout) * 1000)
+    return statistics.median(timings)
+
+
+def time_function(function, repeat=5, number=1) -> float:
+    """Time calls to a function and return the median per call in ms.
+
+    :param function: The function to be called, without arguments.
+    :type function: Callable
+    :param repeat: How many times to time the calls.
+    :type repeat: int
+    :param number: How many calls to make each time.
+    :type number: int
+    :returns: The median of the timings, per call, in milliseconds.
+    :rtype: float
+    """
+    timings = timeit.repeat(function, repeat=repeat, number=number)
+    return statistics.median(timings) / number * 1000
+
+
+def benchmark_imports(repeat=5) -> dict[str, float]:
+    """Time the cold import of each module in :data:`IMPORT_MODULES`.
+
+    :param repeat: How many times to import each module.
+    :type repeat: int
+    :returns: The median import time of each module, in milliseconds.
+    :rtype: dict[str, float]
+    """
+    results = {}
+    for module in IMPORT_MODULES:
+        code = IMPORT_CODE.format(module=module)
+        results[f"import {module}"] = time_code(code, repeat)
+    return results
+
+
+def benchmark_data_loading(repeat=5) -> dict[str, float]:
+    """Time the first access to the data in :data:`DATA_LOADING_CODE`.
+
+    :param repeat: How many times to load each data.
+    :type repeat: int
+    :returns: The median loading time of each data, in milliseconds.
+    :rtype: dict[str, float]
+    """
+    results = {}
+    for name, code in DATA_LOADING_CODE.items():
+        results[name] = time_code(code, repeat)
+    return results
+
+
+def benchmark_lookups(repeat=5, number=100) -> dict[str, float]:
+    """Time the lookups in :data:`LOOKUP_FUNCTIONS`.
+
+    Each lookup is made once before being timed, so the data it needs
+    is loaded and the time measured is the one of the lookup alone.
+    The caches and index memos are cleared before every call, so no
+    call is answered by an earlier one.
+
+    :param repeat: How many times to time each lookup.
+    :type repeat: int
+    :param number: How many lookups to make each time.
+    :type number: int
+    :returns: The median time of each lookup, in milliseconds.
+    :rtype: dict[str, float]
+    """
+    results = {}
+    for name, function in LOOKUP_FUNCTIONS.items():
+        function()
+        results[name] = time_function(function, repeat, number)
+    return results
+
+
+def benchmark_generators(repeat=3) -> dict[str, float]:
+    """Time the generation in :data:`GENERATOR_FUNCTIONS`.
+
+    :param repeat: How many times to generate the chords or scales.
+    :type repeat: int
+    :returns: The median generation time of each, in milliseconds.
+    :rtype: dict[str, float]
+    """
+    results = {}
+    for name, function in GENERATOR_FUNCTIONS.items():
+        results[name] = time_function(function, repeat)
+    return results
+
+
+BENCHMARKS = {
+    "imports": benchmark_imports,
+    "data": benchmark_data_loading,
+    "lookups": benchmark_lookups,
+    "generators": benchmark_generators,
+}
+
+
+def format_results(results: dict[str, float]) -> str:
+    """Return the benchmark results as a two-column table."""
+    width = max(len(name) for name in results)
+    lines = [f"{name:<{width}}  {ms:10.3f} ms" for name, ms in results.items()]
+    return "\n".join(lines)
+
+
+def run(groups=None):
+    """Run benchmark groups and print the results.
+
+    :param groups: Names of groups of :data:`BENCHMARKS`, all if None.
+    :type groups: list[str] | None
+    """
+    if not groups:
+        groups = list(BENCHMARKS)
+    unknown_groups = [group for group in groups if group not in BENCHMARKS]
+    if unknown_groups:
+        print(
+            f"Unknown benchmarks: {', '.join(unknown_groups)}. "
+            f"Choose from: {', '.join(BENCHMARKS)}."
+        )
+        return
+    results = {}
+    for group in groups:
+        results.update(BENCHMARKS[group]())
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    run(sys.argv[1:])
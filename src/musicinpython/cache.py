@@ -0,0 +1,109 @@
+"""Module with a bounded cache for objects that are costly to build.
+
+Imports
+=======
+:mod:`collections`: Import the ordered dictionary.
+
+Classes
+=======
+:class:`LRUCache`: Defines a cache evicting least recently used items.
+"""
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Cache keeping up to a number of items, evicting the least used.
+
+    Attributes
+    ----------
+    .. attribute:: maxsize
+       :type: int
+
+       The maximum number of items kept. Zero disables the cache.
+
+    .. attribute:: items
+       :type: OrderedDict
+
+       The cached items, from the least to the most recently used.
+
+    .. attribute:: hits
+       :type: int
+
+       How many lookups found their key in the cache.
+
+    .. attribute:: misses
+       :type: int
+
+       How many lookups didn't find their key in the cache.
+
+    Methods
+    -------
+    :meth:`get_or_build`: Get an item, building it on a miss.
+
+    :meth:`resize`: Change :attr:`maxsize`, evicting items if needed.
+
+    :meth:`clear`: Remove all items and reset the counters.
+
+    :meth:`get_info`: Return a message with the cache's statistics.
+    """
+
+    def __init__(self, maxsize=128):
+        """Instantiate an empty cache.
+
+        :param maxsize: Passed to :attr:`maxsize`.
+        :type maxsize: int
+        """
+        if maxsize < 0:
+            raise ValueError("The cache size can't be negative.")
+        self.maxsize = maxsize
+        self.items: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, key) -> bool:
+        return key in self.items
+
+    def get_or_build(self, key, builder):
+        """Get the item of a key, building and caching it on a miss.
+
+        :param key: The key of the item.
+        :type key: Hashable
+        :param builder: Function called without arguments on a miss.
+        :type builder: Callable
+        :returns: The cached or newly built item.
+        """
+        if key in self.items:
+            self.hits += 1
+            self.items.move_to_end(key)
+            return self.items[key]
+        self.misses += 1
+        item = builder()
+        if self.maxsize > 0:
+            self.items[key] = item
+            if len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+        return item
+
+    def resize(self, maxsize: int):
+        """Change :attr:`maxsize`, evicting the least used items."""
+        if maxsize < 0:
+            raise ValueError("The cache size can't be negative.")
+        self.maxsize = maxsize
+        while len(self.items) > maxsize:
+            self.items.popitem(last=False)
+
+    def clear(self):
+        """Remove all items and reset :attr:`hits` and :attr:`misses`."""
+        self.items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_info(self) -> str:
+        """Return a message with the cache's size and counters."""
+        return (
+            f"hits={self.hits}, misses={self.misses}, "
+            f"size={len(self.items)}, maxsize={self.maxsize}"
+        )
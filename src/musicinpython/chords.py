@@ -2,14 +2,21 @@
 
 Imports
 =======
+:mod:`re`: Import the regular expressions of the chord symbol grammar.
+
 :mod:`intervals`: Import functions and :class:`Interval` class.
 
 :mod:`notes`: Import the :class:`Note` class.
 
-:mod:`datahelper`: Import the :func:`get_json_file`.
+:mod:`datahelper`: Import the data tables.
+
+:mod:`cache`: Import the :class:`LRUCache` class.
 
 Global variables
 ================
+The chord data is only loaded from disk the first time one of these
+variables, or :func:`get_chord_index`, is accessed.
+
 .. data:: all_chords
    :type: dict
 
@@ -25,15 +32,73 @@ Global variables
 
    Contains all the chord notes.
 
+.. data:: CHORD_INDEX
+   :type: ChordIndex
+
+   Index over the precompiled chord data for quick lookups.
+
+.. data:: CHORD_IDENTIFIER
+   :type: ChordIdentifier
+
+   Index of the chord data by root and pitch-class set.
+
+.. data:: CHORD_CACHE
+   :type: cache.LRUCache
+
+   Cache of the chords returned by :func:`get_chord`, whose size can be
+   changed with :meth:`cache.LRUCache.resize`.
+
+.. data:: CHORD_FIFTHS
+   :type: dict[str, str]
+
+   The intervals of the altered fifths in chord names (e.g.: "5+").
+
+.. data:: CHORD_SUSPENSIONS
+   :type: dict[str, str]
+
+   The intervals replacing the third in "sus" chord names.
+
+.. data:: CHORD_SEVENTHS
+   :type: dict[str, str]
+
+   The intervals of the sevenths in chord names (e.g.: "maj7").
+
+.. data:: CHORD_EXTENSIONS
+   :type: dict[str, str]
+
+   The intervals of the tones added to chord names (e.g.: "b9").
+
+.. data:: CHORD_SYMBOL_PATTERN
+   :type: re.Pattern
+
+   The grammar of the chord names made by the chord generator, with a
+   group for each of their parts.
+
+Exceptions
+==========
+:exc:`InvalidChordNameError`: Raised when a chord name can't be parsed.
+
 Functions
 =========
+:func:`get_chord_index`: Return the chord index, loading it if needed.
+
+:func:`get_chord_identifier`: Return the chord identifier.
+
+:func:`identify_chord`: Identify chord notes in any order or spelling.
+
 :func:`get_chord_names`: Take chord notes and return their names.
 
+:func:`parse_chord_name`: Get the root and intervals of a chord name.
+
+:func:`spell_chord`: Get the notes of a chord from its root and intervals.
+
 :func:`get_chord_notes`: Take a chord name and return its notes.
 
 :func:`get_chord_intervals`: Take a chord name and return its intervals.
 
-:func:`get_chord`: Return a chord based on a name or notes.
+:func:`build_chord`: Build a chord based on a name or notes.
+
+:func:`get_chord`: Return a chord based on a name or notes, cached.
 
 :func:`chord_input`: Handle input and output of chords.
 
@@ -43,6 +108,10 @@ Functions
 
 Classes
 =======
+:class:`ChordIndex`: Index the chord data by notes and by name.
+
+:class:`ChordIdentifier`: Index the chord data by pitch-class set.
+
 :class:`ChordNames`: Handle chord names.
 
 :class:`ChordIntervals`: Handle chord intervals.
@@ -51,15 +120,326 @@ Classes
 
 :class:`Chord`: Groups the other classes in a single object.
 """
+import re
 import musicinpython.intervals as intervals
 import musicinpython.notes as notes
 import musicinpython.datahelper as datahelper
+import musicinpython.cache as cache
+
+_LAZY_GLOBALS = [
+    "all_chords",
+    "items",
+    "CHORD_NAMES_INTERVALS",
+    "CHORD_NOTES",
+]
+
+CHORD_CACHE = cache.LRUCache(512)
+
+CHORD_FIFTHS = {
+    "5-": "bV",
+    "dim": "bV",
+    "5+": "#V",
+    "aug": "#V",
+}
+
+CHORD_SUSPENSIONS = {"sus2": "II", "sus4": "IV", "sus": "IV"}
+
+CHORD_SEVENTHS = {"7": "bVII", "maj7": "VII", "7M": "VII"}
+
+CHORD_EXTENSIONS = {
+    "b9": "bII",
+    "9": "II",
+    "2": "II",
+    "#9": "#II",
+    "b11": "bIV",
+    "11": "IV",
+    "4": "IV",
+    "#11": "#IV",
+    "b13": "bVI",
+    "13": "VI",
+    "6": "VI",
+    "#13": "#VI",
+}
+
+
+_EXTENSION = notes.get_alternation(CHORD_EXTENSIONS)
+_EXTENSION_PATTERN = re.compile(_EXTENSION)
+_TRIAD = notes.get_alternation([*CHORD_FIFTHS, *CHORD_SUSPENSIONS, "5"])
+_SEVENTH = notes.get_alternation(CHORD_SEVENTHS)
+
+CHORD_SYMBOL_PATTERN = re.compile(
+    f"(?P<root>{notes.get_alternation(notes.ALL_NOTE_NAMES)})"
+    f"(?:(?P<added>{_EXTENSION})"
+    "|(?P<third>m(?!aj))?"
+    f"(?P<triad>{_TRIAD})?"
+    f"(?P<seventh>/?(?:{_SEVENTH}))?"
+    r"(?P<flat_five>\(b5\))?"
+    f"(?P<extensions>(?:/(?:{_EXTENSION})|\\((?:{_EXTENSION})\\))*))"
+)
+
+
+class InvalidChordNameError(Exception):
+    """Exception raised when a chord name doesn't follow the grammar.
+
+    Supports custom message and displaying the invalid name.
+    """
+
+    def __init__(self, message="Invalid chord name: ", name=""):
+        """Raise the exception with default parameters.
+
+        :param message: Custom messsage.
+        :type message: str
+        :param name: Invalid name.
+        :type name: str
+        """
+        self.message = f"{message}{name}"
+        super().__init__(self.message)
+
+
+class ChordIndex:
+    """Index of the chord data, memoizing lookups in dictionaries.
+
+    The dictionaries aren't built up front, which would mean decoding
+    every chord of every root when the data is loaded. They start empty
+    and each lookup is answered once by :attr:`table` and then kept, so
+    only the chords actually asked for are ever decoded. A first lookup
+    by name costs a binary search on the chord types and the spelling
+    of the notes on the root, a first lookup by notes a dictionary
+    lookup of their semitones and the spelling of the types found (the
+    very first one also decodes every type, to key them by semitones).
+    Every later lookup of the same name or notes is a dictionary lookup.
+
+    Attributes
+    ----------
+    .. attribute:: table
+       :type: datahelper.DataTable | datahelper.TypeTable
+
+       The chord data, keyed by "name (intervals)" with notes as values.
+
+    .. attribute:: names_by_notes
+       :type: dict[str, list[str]]
+
+       Chord names keyed by a string of notes (e.g.: "C Eb G Bb").
+
+    .. attribute:: notes_by_name
+       :type: dict[str, str]
+
+       String of chord notes keyed by chord name (e.g.: "Cm7").
+
+    .. attribute:: intervals_by_name
+       :type: dict[str, str]
+
+       String of chord intervals keyed by chord name.
+
+    .. attribute:: alternatives_table
+       :type: datahelper.DataTable | None
+
+       The chord types on the rotations of every pattern of notes, keyed
+       by semitones, as precomputed by the chord generator.
+
+    .. attribute:: alternatives_by_notes
+       :type: dict[str, list[str]]
+
+       Alternative chord names keyed by a string of notes.
+
+    Methods
+    -------
+    :meth:`find_name`: Search the table for a chord name.
+
+    :meth:`get_names`: Get the chord names of a string of notes.
+
+    :meth:`get_notes`: Get the string of notes of a chord name.
+
+    :meth:`get_intervals`: Get the string of intervals of a chord name.
+
+    :meth:`get_alternative_names`: Get the names of a chord's rotations.
+    """
+
+    def __init__(self, chord_table, alternatives_table=None):
+        """Instantiate the index with empty dictionaries.
+
+        :param chord_table: Passed to :attr:`table`.
+        :type chord_table: datahelper.DataTable | datahelper.TypeTable
+        :param alternatives_table: Passed to :attr:`alternatives_table`.
+        :type alternatives_table: datahelper.DataTable | None
+        """
+        self.table = chord_table
+        self.alternatives_table = alternatives_table
+        self.names_by_notes: dict[str, list[str]] = {}
+        self.notes_by_name: dict[str, str] = {}
+        self.intervals_by_name: dict[str, str] = {}
+        self.alternatives_by_notes: dict[str, list[str]] = {}
+
+    def find_name(self, name_str: str):
+        """Search the table for a chord name and memoize its data."""
+        found = self.table.find_prefix(name_str + " (")
+        if found:
+            name_interval, notes_str = found[-1]
+            interval_str = name_interval.split("(")[-1][:-1]
+            self.notes_by_name[name_str] = notes_str
+            self.intervals_by_name[name_str] = interval_str
+
+    def get_names(self, notes_str: str) -> list[str]:
+        """Return a new list with the names of a string of notes."""
+        if notes_str not in self.names_by_notes:
+            name_intervals = self.table.find_value(notes_str)
+            if not name_intervals:
+                return []
+            names = [item.split()[0] for item in name_intervals]
+            self.names_by_notes[notes_str] = names
+        return list(self.names_by_notes[notes_str])
+
+    def get_notes(self, name_str: str) -> str:
+        """Return the string of notes of a chord name, if any."""
+        if name_str not in self.notes_by_name:
+            self.find_name(name_str)
+        return self.notes_by_name.get(name_str, "")
+
+    def get_intervals(self, name_str: str) -> str:
+        """Return the string of intervals of a chord name, if any."""
+        if name_str not in self.intervals_by_name:
+            self.find_name(name_str)
+        return self.intervals_by_name.get(name_str, "")
+
+    def get_alternative_names(self, notes_str: str) -> list[str]:
+        """Return a new sorted list with the names of a chord's rotations.
+
+        With :attr:`alternatives_table`, the names take a single lookup
+        of the semitones of the notes, with
+        :func:`datahelper.find_rotation_names`. Without it, the names of
+        each rotation are searched for with :meth:`get_names`.
+        """
+        if notes_str not in self.alternatives_by_notes:
+            names = set()
+            if self.alternatives_table is not None:
+                for name_group in datahelper.find_rotation_names(
+                    notes_str, self.alternatives_table
+                ):
+                    names.update(name_group)
+            else:
+                for rotation in notes.get_note_rotations(notes_str):
+                    names.update(self.get_names(rotation))
+            self.alternatives_by_notes[notes_str] = sorted(names)
+        return list(self.alternatives_by_notes[notes_str])
+
+
+def _load_chord_data():
+    """Decode all the chord data and store it in the module's globals."""
+    items = list(get_chord_index().table.items())
+    globals().update(
+        all_chords=dict(items),
+        items=items,
+        CHORD_NAMES_INTERVALS=[i[0] for i in items],
+        CHORD_NOTES=[i[1] for i in items],
+    )
+
+
+def __getattr__(name: str):
+    """Load the chord data on first access to one of its globals."""
+    if name in _LAZY_GLOBALS:
+        _load_chord_data()
+        return globals()[name]
+    if name == "CHORD_INDEX":
+        return get_chord_index()
+    if name == "CHORD_IDENTIFIER":
+        return get_chord_identifier()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_chord_index() -> ChordIndex:
+    """Return :data:`CHORD_INDEX`, loading the chord table if needed."""
+    if "CHORD_INDEX" not in globals():
+        type_table = datahelper.get_data_table("extendedtypes.json")
+        chord_table = datahelper.TypeTable(type_table)
+        alternatives_table = datahelper.get_data_table(
+            "extendedalternatives.json"
+        )
+        globals()["CHORD_INDEX"] = ChordIndex(chord_table, alternatives_table)
+    return globals()["CHORD_INDEX"]
+
+
+class ChordIdentifier:
+    """Identify chords by their pitch classes, with dictionaries.
 
-all_chords = datahelper.get_json_file("extendedchords.json")
-items = list(all_chords.items())
+    Every chord is keyed by its root's pitch class and its pitch-class
+    set (from :func:`notes.get_pitch_class_set`), so a chord is found
+    with a single lookup whatever the order or spelling of its notes.
 
-CHORD_NAMES_INTERVALS = [i[0] for i in items]
-CHORD_NOTES = [i[1] for i in items]
+    Attributes
+    ----------
+    .. attribute:: names_by_root_set
+       :type: dict[tuple[int, int], list[str]]
+
+       Chord names keyed by root pitch class and pitch-class set.
+
+    .. attribute:: roots_names_by_set
+       :type: dict[int, list[tuple[int, str]]]
+
+       Root pitch classes and names of the chords, keyed by their
+       pitch-class set.
+
+    Methods
+    -------
+    :meth:`identify`: Get the names of the chord of some notes.
+    """
+
+    def __init__(self, chord_items):
+        """Build the identifier from the chord data.
+
+        :param chord_items: Pairs of "name (intervals)" and notes.
+        :type chord_items: Iterable[tuple[str, str]]
+        """
+        self.names_by_root_set: dict[tuple[int, int], list[str]] = {}
+        self.roots_names_by_set: dict[int, list[tuple[int, str]]] = {}
+
+        for name_interval, notes_str in chord_items:
+            note_names = notes_str.split()
+            name = name_interval.split()[0]
+            root = notes.PITCH_CLASSES[note_names[0]]
+            pitch_class_set = notes.get_pitch_class_set(note_names)
+            root_set = (root, pitch_class_set)
+            self.names_by_root_set.setdefault(root_set, []).append(name)
+            roots_names = self.roots_names_by_set.setdefault(
+                pitch_class_set, []
+            )
+            roots_names.append((root, name))
+
+    def identify(self, notes_str: str, root_name="") -> list[str]:
+        """Get the names of the chords with the same notes as a string.
+
+        The notes may come in any order, spelling or inversion. If no
+        root is given, the names of the chords rooted on the first note
+        come first, followed by the names the notes have as an inverted
+        chord.
+
+        :param notes_str: The notes of the chord in a string.
+        :type notes_str: str
+        :param root_name: The root of the chord, if known.
+        :type root_name: str
+        :returns: The names of the chord.
+        :rtype: list[str]
+        """
+        note_names = notes_str.split()
+        if not note_names:
+            return []
+        pitch_class_set = notes.get_pitch_class_set(note_names)
+        if root_name:
+            root_set = (notes.Note(root_name).pitch_class, pitch_class_set)
+            return list(self.names_by_root_set.get(root_set, []))
+
+        bass = notes.PITCH_CLASSES[note_names[0]]
+        roots_names = self.roots_names_by_set.get(pitch_class_set, [])
+        names = [name for (root, name) in roots_names if root == bass]
+        names += [name for (root, name) in roots_names if root != bass]
+        return names
+
+
+def get_chord_identifier() -> ChordIdentifier:
+    """Return :data:`CHORD_IDENTIFIER`, building it if needed."""
+    if "CHORD_IDENTIFIER" not in globals():
+        chord_items = get_chord_index().table.items()
+        globals()["CHORD_IDENTIFIER"] = ChordIdentifier(chord_items)
+    return globals()["CHORD_IDENTIFIER"]
 
 
 class ChordNames:
@@ -90,22 +470,16 @@ class ChordNames:
     def get_alternative_names(self, notes_str: str):
         """Get the chord's names with different note orders.
 
-        Takes a string of chord notes, iterates through it, changes
-        their place using their index and uses :func:`get_chord_names`
-        to get the names using the new note order.
+        Adds the names of every rotation of the string of chord notes,
+        retrieved with :meth:`ChordIndex.get_alternative_names` from the
+        types on the rotations precomputed by the chord generator, then
+        sorts :attr:`items`.
 
         :param notes_str: The string of notes of the chord.
         :type notes_str: str
         """
-        notes_list = notes_str.split()
-
-        for note in notes_list:
-            index = notes_list.index(note)
-            notes_list = notes_list[index:] + notes_list[:index]
-            notes_str = " ".join(notes_list)
-            alternative_names = get_chord_names(notes_str)
-            self.items.extend(alternative_names.items)
-        self.items = list(set(self.items))
+        alternative_names = get_chord_index().get_alternative_names(notes_str)
+        self.items = sorted(set(self.items + alternative_names))
 
     def get_names_information(self) -> str:
         """Return a message with all the chord names."""
@@ -238,6 +612,10 @@ class Chord:
        :type: ChordNotes
 
        The chord's notes.
+
+    Methods
+    -------
+    :meth:`copy`: Copy the chord and its components.
     """
 
     def __init__(
@@ -265,36 +643,143 @@ class Chord:
         self.intervals.assign_notes_to_intervals(self.notes.items)
         self.names.get_alternative_names(self.notes.get_notes_str())
 
+    def copy(self) -> "Chord":
+        """Return a copy of the chord whose components can be changed.
+
+        The components are copied as they are, without calling
+        :meth:`__init__`, so nothing is looked up again.
+
+        :returns: The copy of the chord.
+        :rtype: Chord
+        """
+        chord_copy = Chord.__new__(Chord)
+        chord_copy.names = ChordNames(list(self.names.items))
+        chord_copy.intervals = ChordIntervals(
+            [
+                intervals.Interval(
+                    interval.name, interval.note1, interval.note2
+                )
+                for interval in self.intervals.items
+            ]
+        )
+        chord_copy.notes = ChordNotes(list(self.notes.items))
+        return chord_copy
+
 
 def get_chord_names(notes_str: str) -> ChordNames:
     """Get chord names using notes in a string.
 
-    Obtains the index of the string notes in :data:`CHORD_NOTES` and
-    uses it on :data:`CHORD_NAMES_INTERVALS` to get the corresponding
-    names.
+    Looks up the string of notes with :func:`get_chord_index` to get the
+    corresponding names.
 
     :param notes_str: The notes of a chord in a string.
     :type notes_str: str
     :returns: The names of the chord.
     :rtype: ChordNames
     """
-    names = []
-    index = 0
-    all_chord_notes = CHORD_NOTES.copy()
-    for item in all_chord_notes:
-        if item == notes_str:
-            name_interval = CHORD_NAMES_INTERVALS[index]
-            names.append(name_interval.split()[0])
-        index += 1
+    names = get_chord_index().get_names(notes_str)
     return ChordNames(names)
 
 
+def identify_chord(notes_str: str, root_name="") -> ChordNames:
+    """Get chord names using notes in any order, spelling or inversion.
+
+    Uses :meth:`ChordIdentifier.identify` from
+    :func:`get_chord_identifier`.
+
+    :param notes_str: The notes of a chord in a string.
+    :type notes_str: str
+    :param root_name: The root of the chord, if known.
+    :type root_name: str
+    :returns: The names of the chord.
+    :rtype: ChordNames
+    """
+    names = get_chord_identifier().identify(notes_str, root_name)
+    return ChordNames(names)
+
+
+def parse_chord_name(name_str: str) -> tuple[str, list[str]]:
+    """Get the root and intervals of a chord from its name alone.
+
+    The name is matched against :data:`CHORD_SYMBOL_PATTERN`, which
+    follows the rules the chord generator names chords by: a root, then
+    either a single added tone (e.g.: "C9") or an optional "m", a fifth,
+    "sus" or power chord particle, a seventh, a "(b5)" if there's no such
+    particle and any number of tones, each after a slash or between
+    parenthesis. "dim" chords are minor, and "dim7" chords are left out
+    like the generator does, as their seventh isn't a minor one.
+
+    Raises :exc:`InvalidChordNameError` if the name can't be parsed.
+
+    :param name_str: The name of the chord (e.g.: "Cm7(9)").
+    :type name_str: str
+    :returns: The root of the chord and its intervals, in order.
+    :rtype: tuple[str, list[str]]
+    """
+    match = CHORD_SYMBOL_PATTERN.fullmatch(name_str)
+    if match is None:
+        raise InvalidChordNameError(name=name_str)
+    third, triad, seventh = match.group("third", "triad", "seventh")
+    if match.group("added"):
+        added = CHORD_EXTENSIONS[match.group("added")]
+        chord_intervals = {"I", "III", "V", added}
+    elif triad in CHORD_SUSPENSIONS or triad == "5":
+        if third:
+            raise InvalidChordNameError(name=name_str)
+        chord_intervals = {"I", "V"}
+        if triad in CHORD_SUSPENSIONS:
+            chord_intervals.add(CHORD_SUSPENSIONS[triad])
+    else:
+        minor = third or triad == "dim"
+        fifth = CHORD_FIFTHS.get(triad, "V")
+        chord_intervals = {"I", "bIII" if minor else "III", fifth}
+    if seventh:
+        if triad == "dim" and seventh == "7":
+            raise InvalidChordNameError(name=name_str)
+        chord_intervals.add(CHORD_SEVENTHS[seventh.lstrip("/")])
+    if match.group("flat_five"):
+        if triad:
+            raise InvalidChordNameError(name=name_str)
+        chord_intervals.discard("V")
+        chord_intervals.add("bV")
+    extensions = match.group("extensions") or ""
+    for tone in _EXTENSION_PATTERN.findall(extensions):
+        chord_intervals.add(CHORD_EXTENSIONS[tone])
+
+    ordered_intervals = [
+        interval
+        for interval in intervals.ALL_INTERVAL_NAMES_UNPACKED
+        if interval in chord_intervals
+    ]
+    return match.group("root"), ordered_intervals
+
+
+def spell_chord(root_name: str, interval_names: list[str]) -> list[str]:
+    """Get the notes of a chord from its root and intervals.
+
+    Notes are spelled in the key of the root, as in the chord data.
+
+    :param root_name: The name of the root of the chord.
+    :type root_name: str
+    :param interval_names: The names of the intervals of the chord.
+    :type interval_names: list[str]
+    :returns: The names of the notes of the chord.
+    :rtype: list[str]
+    """
+    chromatic_scale = notes.CHROMATIC_SCALES[root_name]
+    return [
+        chromatic_scale[intervals.INTERVAL_SEMITONES[interval]].name
+        for interval in interval_names
+    ]
+
+
 def get_chord_notes(name_str: str) -> ChordNotes:
     """Get the notes of a chord using a name on a string.
 
-    Gets the index of the string name in :data:`CHORD_NAMES_INTERVALS`
-    and uses it on :data:`CHORD_NOTES` to get the corresponding notes.
-    Afterwards, use a list comprehension instantiating each note as a
+    Works the notes out from the name with :func:`parse_chord_name` and
+    :func:`spell_chord`, so the chord data is only looked up with
+    :func:`get_chord_index` for names that can't be parsed. Afterwards,
+    use a list comprehension instantiating each note as a
     :class:`notes.Note` object and returns the list as a
     :class:`ChordNotes` object.
 
@@ -303,13 +788,10 @@ def get_chord_notes(name_str: str) -> ChordNotes:
     :returns: The notes of the chord.
     :rtype: ChordNotes
     """
-    note_str = ""
-    all_chord_names = CHORD_NAMES_INTERVALS.copy()
-    for item in all_chord_names:
-        if name_str == item.split()[0]:
-            index = all_chord_names.index(item)
-            note_str = CHORD_NOTES[index]
-    note_list = note_str.split()
+    try:
+        note_list = spell_chord(*parse_chord_name(name_str))
+    except InvalidChordNameError:
+        note_list = get_chord_index().get_notes(name_str).split()
     chord_notes = [notes.Note(i) for i in note_list]
     return ChordNotes(chord_notes)
 
@@ -317,11 +799,10 @@ def get_chord_notes(name_str: str) -> ChordNotes:
 def get_chord_intervals(name_str: str) -> ChordIntervals:
     """Get the chord's intervals using its name on a string.
 
-    Finds the intervals iterating on :data:`CHORD_NAMES_INTERVALS` and
-    comparing each item with the string name, then split the item to
-    get the portion of the string corresponding to the intervals.
-    Last, uses a list comprehension instantiating each interval as an
-    :class:`intervals.Interval` object and turns the list into a
+    Works the intervals out from the name with :func:`parse_chord_name`,
+    looking the name up with :func:`get_chord_index` only if it can't be
+    parsed. Then uses a list comprehension instantiating each interval
+    as an :class:`intervals.Interval` object and turns the list into a
     :class:`ChordIntervals` object.
 
     :param name_str: The name of the chord in a string.
@@ -329,23 +810,24 @@ def get_chord_intervals(name_str: str) -> ChordIntervals:
     :returns: The intervals of the chord.
     :rtype: ChordIntervals
     """
-    interval_str = ""
-    all_chord_names = CHORD_NAMES_INTERVALS.copy()
-    for item in all_chord_names:
-        if name_str == item.split()[0]:
-            interval_str = item.split("(")[-1]
-            interval_str = interval_str[:-1]
-    interval_list = interval_str.split()
+    try:
+        interval_list = parse_chord_name(name_str)[1]
+    except InvalidChordNameError:
+        interval_list = get_chord_index().get_intervals(name_str).split()
     chord_intervals = [intervals.Interval(i) for i in interval_list]
     return ChordIntervals(chord_intervals)
 
 
-def get_chord(name_param="", notes_param="") -> Chord:
-    """Take either a chord's name or notes and returns its object.
+def build_chord(name_param="", notes_param="") -> Chord:
+    """Take either a chord's name or notes and build its object.
 
     Uses the :func:`get_chord_names`, :func:`get_chord_intervals` and
     :func:`get_chord_notes` functions to retrieve the components of the
-    chord, then instantiates and returns it.
+    chord, then instantiates and returns it. Notes that don't match a
+    chord exactly are identified with :func:`identify_chord`, and the
+    chord returned has the notes of the first name found. A name that
+    :func:`parse_chord_name` parses but whose notes aren't in the chord
+    data is kept as the chord's only name.
 
     :param name_param: The name of the chord in a string.
     :type name_param: str
@@ -358,17 +840,55 @@ def get_chord(name_param="", notes_param="") -> Chord:
         chord_intervals = get_chord_intervals(name_param)
         chord_notes = get_chord_notes(name_param)
         chord_names = get_chord_names(chord_notes.get_notes_str())
+        if not chord_names.items:
+            try:
+                parse_chord_name(name_param)
+            except InvalidChordNameError:
+                pass
+            else:
+                chord_names = ChordNames([name_param])
         chord = Chord(chord_names, chord_intervals, chord_notes)
         return chord
 
     elif notes_param:
         chord_names = get_chord_names(notes_param)
+        if not chord_names.items:
+            identified_names = identify_chord(notes_param)
+            chord_notes = get_chord_notes(identified_names.items[0])
+            chord_names = get_chord_names(chord_notes.get_notes_str())
         chord_intervals = get_chord_intervals(chord_names.items[0])
         chord_notes = get_chord_notes(chord_names.items[0])
         chord = Chord(chord_names, chord_intervals, chord_notes)
         return chord
 
 
+def get_chord(name_param="", notes_param="") -> Chord:
+    """Take either a chord's name or notes and returns its object.
+
+    Returns a copy of the chord in :data:`CHORD_CACHE`, built with
+    :func:`build_chord` the first time it's asked for, so changing it
+    doesn't change the chords returned afterwards.
+
+    Raises :exc:`ValueError` if neither a name nor notes are given.
+
+    :param name_param: The name of the chord in a string.
+    :type name_param: str
+    :param notes_param: The notes of the chord in a string.
+    :type notes_param: str
+    :returns: The chord object.
+    :rtype: Chord
+    """
+    name_param = name_param.strip()
+    notes_param = " ".join(notes_param.split())
+    if not name_param and not notes_param:
+        raise ValueError("A chord name or notes must be given.")
+    chord = CHORD_CACHE.get_or_build(
+        (name_param, notes_param),
+        lambda: build_chord(name_param, notes_param),
+    )
+    return chord.copy()
+
+
 def chord_input(mode="") -> Chord:
     """Handle input of chords.
 
@@ -382,7 +902,11 @@ def chord_input(mode="") -> Chord:
             note_input = input(
                 "Enter the notes of the chord separated by spaces: "
             )
-            if note_input in CHORD_NOTES:
+            try:
+                names = identify_chord(note_input).items
+            except notes.InvalidNoteNameError:
+                names = []
+            if names:
                 break
             else:
                 print("No matching chord found in our data, please try again.")
@@ -391,12 +915,8 @@ def chord_input(mode="") -> Chord:
 
     if mode == "A":
         while True:
-            found = False
             name_input = input("Enter the name of the chord: ")
-            for name_interval in CHORD_NAMES_INTERVALS:
-                if name_input == name_interval.split()[0]:
-                    found = True
-            if found is True:
+            if get_chord_notes(name_input).items:
                 break
             else:
                 print("No matching chord found in our data, please try again.")
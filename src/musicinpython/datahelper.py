@@ -1,8 +1,520 @@
 import os
+import gzip
 import json
+import mmap
+import stat
+import struct
+import tempfile
+import musicinpython.intervals as intervals
+import musicinpython.notes as notes
 
 _ROOT = os.path.abspath(os.path.dirname(__file__))
 
+BINARY_MAGIC = b"MIPD"
+BINARY_VERSION = 1
+
+_HEADER = struct.Struct("<4sII")
+_RECORD = struct.Struct("<IIII")
+_POSITION = struct.Struct("<I")
+
+
+class DataTable:
+    """Read-only table of string keys and values in a binary buffer.
+
+    The buffer starts with a header (magic, version and item count),
+    followed by fixed-width records sorted by key, each holding the
+    offset and length of its key and value in the string table. Next
+    come the record positions sorted by value, then the string table
+    itself, in which every distinct string is stored once. Strings are
+    only decoded when a lookup needs them, so a memory-mapped file can
+    be queried without loading it and its pages are shared between
+    processes.
+
+    Attributes
+    ----------
+    .. attribute:: buffer
+       :type: bytes | mmap.mmap
+
+       The binary contents of the table.
+
+    .. attribute:: count
+       :type: int
+
+       The number of items in the table.
+
+    Methods
+    -------
+    :meth:`from_items`: Build a table in memory from pairs of strings.
+
+    :meth:`items`: Iterate through the items in key order.
+
+    :meth:`get`: Get the value of a key.
+
+    :meth:`find_prefix`: Get the items whose keys start with a prefix.
+
+    :meth:`find_value`: Get the keys that have a given value.
+    """
+
+    def __init__(self, buffer):
+        """Instantiate a table over a buffer, checking its header.
+
+        :param buffer: The binary contents of the table.
+        :type buffer: bytes | mmap.mmap
+        """
+        magic, version, count = _HEADER.unpack_from(buffer, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("Invalid binary data file.")
+        self.buffer = buffer
+        self.count = count
+        self._records_start = _HEADER.size
+        self._positions_start = self._records_start + count * _RECORD.size
+        self._strings_start = self._positions_start + count * _POSITION.size
+
+    @classmethod
+    def from_items(cls, items) -> "DataTable":
+        """Build a table in memory from pairs of key and value strings."""
+        return cls(pack_table(items))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _record(self, index: int) -> tuple:
+        offset = self._records_start + index * _RECORD.size
+        return _RECORD.unpack_from(self.buffer, offset)
+
+    def _position(self, index: int) -> int:
+        offset = self._positions_start + index * _POSITION.size
+        return _POSITION.unpack_from(self.buffer, offset)[0]
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._strings_start + offset
+        return self.buffer[start : start + length]
+
+    def _key(self, index: int) -> bytes:
+        key_offset, key_length, _, _ = self._record(index)
+        return self._string(key_offset, key_length)
+
+    def _value(self, index: int) -> bytes:
+        _, _, value_offset, value_length = self._record(index)
+        return self._string(value_offset, value_length)
+
+    def _bisect(self, target: bytes, get_bytes) -> int:
+        """Return the first index whose bytes aren't less than target."""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if get_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def items(self):
+        """Yield every key and value as strings, in key order."""
+        for index in range(self.count):
+            key = self._key(index).decode()
+            yield key, self._value(index).decode()
+
+    def get(self, key: str, default=None):
+        """Return the value of a key, or default if it isn't there."""
+        key_bytes = key.encode()
+        index = self._bisect(key_bytes, self._key)
+        if index < self.count and self._key(index) == key_bytes:
+            return self._value(index).decode()
+        return default
+
+    def find_prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return the items whose keys start with prefix, in key order."""
+        prefix_bytes = prefix.encode()
+        index = self._bisect(prefix_bytes, self._key)
+        found = []
+        while index < self.count:
+            key = self._key(index)
+            if not key.startswith(prefix_bytes):
+                break
+            found.append((key.decode(), self._value(index).decode()))
+            index += 1
+        return found
+
+    def find_value(self, value: str) -> list[str]:
+        """Return the keys that have the given value, in key order."""
+        value_bytes = value.encode()
+
+        def get_value(position: int) -> bytes:
+            return self._value(self._position(position))
+
+        position = self._bisect(value_bytes, get_value)
+        found = []
+        while position < self.count:
+            index = self._position(position)
+            if self._value(index) != value_bytes:
+                break
+            found.append(self._key(index).decode())
+            position += 1
+        return found
+
+
+class TypeTable:
+    """Read-only table of the chords or scales of every root, from types.
+
+    The chords or scales of every root share the same types, so each
+    type is stored once in a :class:`DataTable`, as its name without the
+    root (e.g.: "m7" or "Dorian") and its intervals. The items of each
+    root in :data:`notes.ALL_NOTE_NAMES` are made from it when they're
+    looked up, with notes spelled in the key of the root. The table has
+    the lookups of :class:`DataTable`, keyed by "name (intervals)" with
+    notes as values.
+
+    Attributes
+    ----------
+    .. attribute:: types
+       :type: DataTable
+
+       The intervals of the types, keyed by type name.
+
+    .. attribute:: separator
+       :type: str
+
+       What goes between the root and the type name in names (e.g.: ""
+       for "Cm7" and " " for "C Dorian").
+
+    .. attribute:: type_items
+       :type: list[tuple[str, str, tuple[int, ...]]]
+
+       The name, intervals and semitones of the intervals of each type,
+       in key order, decoded from :attr:`types` once.
+
+    .. attribute:: types_by_semitones
+       :type: dict[tuple[int, ...], list[tuple[str, str]]]
+
+       The names and intervals of the types, keyed by the semitones of
+       their intervals.
+
+    Methods
+    -------
+    :meth:`get_type_items`: Return :attr:`type_items`, decoding it once.
+
+    :meth:`get_item`: Make the item of a root and type.
+
+    :meth:`split_name`: Split a name into its root and type name.
+
+    :meth:`root_items`: Iterate through the items of a root in key order.
+
+    :meth:`items`: Iterate through the items of every root in key order.
+
+    :meth:`get`: Get the notes of a "name (intervals)" key.
+
+    :meth:`find_prefix`: Get the items whose keys start with a prefix.
+
+    :meth:`find_value`: Get the keys that have a given string of notes.
+    """
+
+    def __init__(self, type_table: DataTable, separator=""):
+        """Instantiate the table over the types.
+
+        :param type_table: Passed to :attr:`types`.
+        :type type_table: DataTable
+        :param separator: Passed to :attr:`separator`.
+        :type separator: str
+        """
+        self.types = type_table
+        self.separator = separator
+        self.type_items: list = []
+        self.types_by_semitones: dict = {}
+
+    def __len__(self) -> int:
+        return len(notes.ALL_NOTE_NAMES) * len(self.types)
+
+    def get_type_items(self) -> list:
+        """Return :attr:`type_items`, also indexing them by semitones.
+
+        Types are sorted as in the keys, where their names are followed
+        by the intervals, so a name comes after the longer names that
+        continue it with an accidental (e.g.: "Major #2" and "Major").
+        """
+        if not self.type_items:
+            type_items = sorted(
+                self.types.items(), key=lambda item: f"{item[0]} ({item[1]}"
+            )
+            for type_name, interval_str in type_items:
+                semitones = tuple(
+                    [
+                        intervals.INTERVAL_SEMITONES[interval]
+                        for interval in interval_str.split()
+                    ]
+                )
+                self.type_items.append((type_name, interval_str, semitones))
+                type_list = self.types_by_semitones.setdefault(semitones, [])
+                type_list.append((type_name, interval_str))
+        return self.type_items
+
+    def get_item(
+        self, root_name: str, type_name: str, interval_str: str
+    ) -> tuple[str, str]:
+        """Return the key and notes of the item of a root and type."""
+        scale = notes.CHROMATIC_SCALES[root_name]
+        notes_str = " ".join(
+            [
+                scale[intervals.INTERVAL_SEMITONES[interval]].name
+                for interval in interval_str.split()
+            ]
+        )
+        name = root_name + self.separator + type_name
+        return f"{name} ({interval_str})", notes_str
+
+    def split_name(self, name_str: str):
+        """Return the root and type name of a name, or None.
+
+        No type name starts with an accidental, so the root is the
+        longest note name the name starts with.
+        """
+        for root_name in (name_str[:2], name_str[:1]):
+            if root_name in notes.ALL_NOTE_NAMES:
+                type_name = name_str[len(root_name) :]
+                if not type_name.startswith(self.separator):
+                    return None
+                return root_name, type_name[len(self.separator) :]
+        return None
+
+    def root_items(self, root_name: str):
+        """Yield every item of a root as key and notes, in key order."""
+        scale = [note.name for note in notes.CHROMATIC_SCALES[root_name]]
+        prefix = root_name + self.separator
+        for type_name, interval_str, semitones in self.get_type_items():
+            notes_str = " ".join([scale[semitone] for semitone in semitones])
+            yield f"{prefix}{type_name} ({interval_str})", notes_str
+
+    def items(self):
+        """Yield every item of every root as key and notes, in key order."""
+        return iter(
+            sorted(
+                item
+                for root_name in notes.ALL_NOTE_NAMES
+                for item in self.root_items(root_name)
+            )
+        )
+
+    def get(self, key: str, default=None):
+        """Return the notes of a key, or default if it isn't there."""
+        name_str, _, interval_str = key.partition(" (")
+        root_type = self.split_name(name_str)
+        if root_type is None:
+            return default
+        root_name, type_name = root_type
+        if self.types.get(type_name) != interval_str[:-1]:
+            return default
+        return self.get_item(root_name, type_name, interval_str[:-1])[1]
+
+    def find_prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return the items whose keys start with prefix, in key order."""
+        found = []
+        for root_name in notes.ALL_NOTE_NAMES:
+            root_prefix = root_name + self.separator
+            if root_prefix.startswith(prefix):
+                type_items = self.types.find_prefix("")
+            elif prefix.startswith(root_prefix):
+                rest = prefix[len(root_prefix) :]
+                type_name, complete, _ = rest.partition(" (")
+                if not complete:
+                    type_items = self.types.find_prefix(type_name)
+                elif self.types.get(type_name) is not None:
+                    type_items = [(type_name, self.types.get(type_name))]
+                else:
+                    type_items = []
+            else:
+                continue
+            for type_name, interval_str in type_items:
+                item = self.get_item(root_name, type_name, interval_str)
+                if item[0].startswith(prefix):
+                    found.append(item)
+        return sorted(found)
+
+    def find_value(self, value: str) -> list[str]:
+        """Return the keys that have the given notes, in key order."""
+        semitones = get_note_semitones(value)
+        if semitones is None:
+            return []
+        self.get_type_items()
+        note_names = value.split()
+        found = []
+        for type_name, interval_str in self.types_by_semitones.get(
+            semitones, []
+        ):
+            key, notes_str = self.get_item(
+                note_names[0], type_name, interval_str
+            )
+            if notes_str == value:
+                found.append(key)
+        return found
+
+
+def get_note_semitones(value: str):
+    """Return the semitones of some notes above the first one, or None.
+
+    :param value: A string of notes (e.g.: "C Eb G").
+    :type value: str
+    :returns: The semitones of each note, or None if there are no notes
+        or one of them isn't in :data:`notes.ALL_NOTE_NAMES`.
+    :rtype: tuple[int, ...] | None
+    """
+    note_names = value.split()
+    if not note_names:
+        return None
+    if any(name not in notes.PITCH_CLASSES for name in note_names):
+        return None
+    root = notes.PITCH_CLASSES[note_names[0]]
+    return tuple(
+        (notes.PITCH_CLASSES[name] - root) % 12 for name in note_names
+    )
+
+
+def get_semitones_key(semitones) -> str:
+    """Return semitones as the key of a rotation table (e.g.: "0 4 7")."""
+    return " ".join([str(semitone) for semitone in semitones])
+
+
+def get_rotation_types(type_semitones) -> dict[str, list[tuple[int, str]]]:
+    """Get the types found on the rotations of every pattern of notes.
+
+    A type found on the rotation of some notes that starts on their
+    note at a given index is kept under the semitones of the notes,
+    with that index. The semitones don't depend on the root, so the
+    table has the rotations of the notes of every root.
+
+    :param type_semitones: Pairs of type name and semitones of the
+        intervals of the type.
+    :type type_semitones: Iterable[tuple[str, tuple[int, ...]]]
+    :returns: The index of the rotation and the name of the types, keyed
+        by semitones from :func:`get_semitones_key`.
+    :rtype: dict[str, list[tuple[int, str]]]
+    """
+    rotation_types = {}
+    for type_name, semitones in type_semitones:
+        count = len(semitones)
+        for index in range(count):
+            rotated = semitones[count - index :] + semitones[: count - index]
+            key = get_semitones_key(
+                [(semitone - rotated[0]) % 12 for semitone in rotated]
+            )
+            rotation_types.setdefault(key, []).append((index, type_name))
+    return rotation_types
+
+
+def format_rotation_types(*type_groups) -> str:
+    """Format groups of rotation types as a value of a rotation table.
+
+    Each rotation type is written as "index:type name", separated by
+    commas, and the groups are separated by semicolons (e.g.:
+    "0:m7, 1:6; 0:m(#13)").
+
+    :param type_groups: Lists of pairs of rotation index and type name,
+        from :func:`get_rotation_types`.
+    :type type_groups: list[tuple[int, str]]
+    :returns: The value of the rotation table.
+    :rtype: str
+    """
+    return "; ".join(
+        [
+            ", ".join([f"{index}:{type_name}" for index, type_name in group])
+            for group in type_groups
+        ]
+    )
+
+
+def parse_rotation_types(value: str) -> list[list[tuple[int, str]]]:
+    """Parse a value of :func:`format_rotation_types` into its groups."""
+    type_groups = []
+    for group in value.split("; "):
+        rotation_types = []
+        for rotation_type in group.split(", ") if group else []:
+            index, _, type_name = rotation_type.partition(":")
+            rotation_types.append((int(index), type_name))
+        type_groups.append(rotation_types)
+    return type_groups
+
+
+def find_rotation_names(
+    value: str, rotation_table: DataTable, separator=""
+) -> list[list[str]]:
+    """Return the names of the types on the rotations of some notes.
+
+    The rotation types of the notes are found with a single lookup of
+    their semitones in a table of :func:`format_rotation_types` values,
+    keyed as in :func:`get_rotation_types`. A rotation only has names
+    if it's one of :func:`notes.get_note_rotations` and its notes are
+    spelled in the key of its first note, as in a :class:`TypeTable`.
+
+    :param value: A string of notes.
+    :type value: str
+    :param rotation_table: The rotation types keyed by semitones.
+    :type rotation_table: DataTable
+    :param separator: What goes between the root and the type name, as
+        in :attr:`TypeTable.separator`.
+    :type separator: str
+    :returns: The names of each group of rotation types, or no groups if
+        no type is on the rotations of the notes.
+    :rtype: list[list[str]]
+    """
+    semitones = get_note_semitones(value)
+    if semitones is None:
+        return []
+    types_str = rotation_table.get(get_semitones_key(semitones))
+    if types_str is None:
+        return []
+    note_names = value.split()
+    rotations = set(notes.get_note_rotations(value))
+    named_roots = {}
+    for index, note_name in enumerate(note_names):
+        rotation = note_names[index:] + note_names[:index]
+        chromatic_indexes = notes.CHROMATIC_INDEXES[note_name]
+        if " ".join(rotation) in rotations and all(
+            [name in chromatic_indexes for name in rotation]
+        ):
+            named_roots[index] = note_name + separator
+    name_groups = []
+    for group in parse_rotation_types(types_str):
+        name_groups.append(
+            [
+                named_roots[index] + type_name
+                for index, type_name in group
+                if index in named_roots
+            ]
+        )
+    return name_groups
+
+
+def pack_table(items) -> bytes:
+    """Pack pairs of key and value strings in the binary table format.
+
+    :param items: Pairs of strings, with unique keys.
+    :type items: Iterable[tuple[str, str]]
+    :returns: The contents of a :class:`DataTable`.
+    :rtype: bytes
+    """
+    encoded_items = sorted((k.encode(), v.encode()) for (k, v) in items)
+    strings = bytearray()
+    string_offsets = {}
+
+    def add_string(string: bytes) -> int:
+        if string not in string_offsets:
+            string_offsets[string] = len(strings)
+            strings.extend(string)
+        return string_offsets[string]
+
+    records = bytearray()
+    for key, value in encoded_items:
+        key_offset = add_string(key)
+        value_offset = add_string(value)
+        records += _RECORD.pack(key_offset, len(key), value_offset, len(value))
+
+    value_order = sorted(
+        range(len(encoded_items)),
+        key=lambda i: (encoded_items[i][1], encoded_items[i][0]),
+    )
+    positions = b"".join(_POSITION.pack(i) for i in value_order)
+    header = _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(encoded_items))
+    return header + bytes(records) + positions + bytes(strings)
+
 
 def get_data_folder():
     return os.path.join(_ROOT, "data")
@@ -10,6 +522,133 @@ def get_data_folder():
 
 def get_json_file(file_name: str):
     file_path = os.path.join(get_data_folder(), file_name)
-    with open(file_path, "r") as file_obj:
+    opener = gzip.open if file_name.endswith(".gz") else open
+    with opener(file_path, "rt") as file_obj:
+        if file_name.endswith((".jsonl", ".jsonl.gz")):
+            file_contents = {}
+            for line in file_obj:
+                if line.strip():
+                    file_contents.update(json.loads(line))
+            return file_contents
         file_contents = json.load(file_obj)
         return file_contents
+
+
+def get_json_path(json_path: str, lines=False, compress=False) -> str:
+    """Return the path of a .json file in the format it's dumped in.
+
+    :param json_path: The path of the file, ending in .json.
+    :type json_path: str
+    :param lines: Whether the file is in JSON Lines format (.jsonl).
+    :type lines: bool
+    :param compress: Whether the file is compressed with gzip (.gz).
+    :type compress: bool
+    :returns: The path with the extension of the format.
+    :rtype: str
+    """
+    if lines:
+        json_path = os.path.splitext(json_path)[0] + ".jsonl"
+    if compress:
+        json_path += ".gz"
+    return json_path
+
+
+def dump_json_items(
+    items, file_path: str, indent=4, lines=False, compress=False
+) -> int:
+    """Write pairs of strings as a .json object, one at a time.
+
+    The items are written in their order, as they come, so they don't
+    have to be gathered in a dictionary first. With an indent, the
+    layout is the one of ``json.dump``, otherwise nothing but the
+    strings and the separators is written. In JSON Lines format, every
+    item is written as a compact object on its own line.
+
+    :param items: Pairs of key and value strings.
+    :type items: Iterable[tuple[str, str]]
+    :param file_path: The path of the file.
+    :type file_path: str
+    :param indent: Spaces before each item, or None for a compact file.
+    :type indent: int | None
+    :param lines: Whether to write in JSON Lines format.
+    :type lines: bool
+    :param compress: Whether to compress the file with gzip.
+    :type compress: bool
+    :returns: How many items were written.
+    :rtype: int
+    """
+    if lines:
+        entry_format = "{{{0}:{1}}}\n"
+    elif indent is None:
+        entry_format = "{0}:{1}"
+    else:
+        entry_format = "\n" + " " * indent + "{0}: {1}"
+    separator = "" if lines else ","
+
+    count = 0
+    opener = gzip.open if compress else open
+    with opener(file_path, "wt") as file_obj:
+        if not lines:
+            file_obj.write("{")
+        for key, value in items:
+            if count:
+                file_obj.write(separator)
+            entry = entry_format.format(json.dumps(key), json.dumps(value))
+            file_obj.write(entry)
+            count += 1
+        if not lines:
+            file_obj.write("\n}" if count and indent is not None else "}")
+    return count
+
+
+def get_binary_file(file_name: str) -> DataTable:
+    """Memory-map a binary data file and return it as a table."""
+    file_path = os.path.join(get_data_folder(), file_name)
+    with open(file_path, "rb") as file_obj:
+        buffer = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+    return DataTable(buffer)
+
+
+def dump_binary_file(data: dict, file_path: str):
+    """Write a dictionary of strings to disk in the binary format.
+
+    The table is written to a temporary file next to the target, which
+    then replaces it, so processes that have the old file memory-mapped
+    keep reading it instead of seeing it truncated. The file keeps the
+    permissions of the one it replaces, or gets read and write
+    permissions for its owner and read permissions for everyone else.
+    """
+    folder = os.path.dirname(os.path.abspath(file_path))
+    try:
+        file_mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        file_mode = 0o644
+    file_descriptor, temp_path = tempfile.mkstemp(suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file_obj:
+            file_obj.write(pack_table(data.items()))
+        os.chmod(temp_path, file_mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def get_binary_path(json_path: str) -> str:
+    """Return the path of the binary counterpart of a .json file."""
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+def get_data_table(file_name: str) -> DataTable:
+    """Return the table of a data file, memory-mapped from its .bin file.
+
+    The tables are named after the .json files of the generators, but
+    only their precompiled binary counterparts ship with the package
+    (e.g.: "triadtypes.bin" for "triadtypes.json").
+
+    :param file_name: Name of the .json file in the data folder.
+    :type file_name: str
+    :returns: The data in the file.
+    :rtype: DataTable
+    """
+    return get_binary_file(get_binary_path(file_name))
@@ -6,9 +6,11 @@ Imports
 
 :mod:`sys`: Import the arguments from the command-line.
 
-:mod:`copy`: Import function to deepcopy objects.
+:mod:`itertools`: Import the repetition of an argument.
 
-:mod:`json`: Import json dumping.
+:mod:`concurrent.futures`: Import the process pool.
+
+:mod:`datahelper`: Import the binary data dumping.
 
 Global variables
 ================
@@ -17,14 +19,83 @@ Global variables
 
    List containing all chord roots/tonics.
 
+.. data:: DUMP_FILE_NAMES
+   :type: dict[str, tuple[str, str, str]]
+
+   Names of the chord, chord type and alternative type files of each
+   mode.
+
+.. data:: EXTENSIONS
+   :type: list[dict[str, list[str]]]
+
+   The ninth, eleventh and thirteenth extensions, with their intervals
+   and chord tones.
+
+.. data:: INTERVALS
+   :type: list[str]
+
+   All interval names in order, each given a bit in interval masks.
+
+.. data:: INTERVAL_BITS
+   :type: dict[str, int]
+
+   The bit of each interval name in interval masks.
+
+.. data:: INTERVAL_INDEXES
+   :type: list[int]
+
+   The chromatic scale index of each interval of :data:`INTERVALS`.
+
+.. data:: GENERATOR_CLASSES
+   :type: dict[str, type]
+
+   The generator class of each mode.
+
+.. data:: MODE_LEVELS
+   :type: dict[str, int]
+
+   The chord level of each mode, as taken by :func:`iter_chords`.
+
+.. data:: DUMP_OPTIONS
+   :type: list[str]
+
+   The command-line options choosing the format of the chord dump and
+   whether to generate the chords in worker processes.
+
 Functions
 =========
 :func:`make_chromatic_scale`: Makes a chromatic scale.
 
 :func:`get_all_intervals_index`: Gets an interval index from a list.
 
+:func:`get_interval_mask`: Gets the bit mask of some intervals.
+
+:func:`get_mask_intervals`: Gets the intervals of a bit mask.
+
+:func:`get_mask_notes`: Gets the notes of a bit mask.
+
+:func:`get_chord_item`: Formats a chord to dump.
+
+:func:`format_chords`: Formats the chords of a generator to dump.
+
+:func:`iter_chords`: Yields the chords of a root up to a level.
+
+:func:`get_root_chord_items`: Gets the chords of a root to dump.
+
+:func:`iter_chord_items`: Yields the chords of every root to dump.
+
+:func:`stream_chords_to_json`: Writes chords to disk as they're made.
+
 :func:`generate_chords`: Generates all chords.
 
+:func:`generate_root_chords`: Generates all chords of a root.
+
+:func:`generate_chords_parallel`: Generates all chords in processes.
+
+:func:`generate_chord_types`: Gets the chord types of the chords.
+
+:func:`generate_alternative_types`: Gets the types of chord rotations.
+
 :func:`dump_chords_to_json`: Dump chords to disk in .json format.
 
 :func:`run`: Runs script.
@@ -43,8 +114,9 @@ Classes
 """
 import os
 import sys
-import copy
-import json
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import musicinpython.datahelper as datahelper
 
 ROOTS = [
     "C",
@@ -66,6 +138,26 @@ ROOTS = [
     "B",
 ]
 
+DUMP_FILE_NAMES = {
+    "-t": ("triadchords.json", "triadtypes.json", "triadalternatives.json"),
+    "-s": (
+        "seventhchords.json",
+        "seventhtypes.json",
+        "seventhalternatives.json",
+    ),
+    "-e": (
+        "extendedchords.json",
+        "extendedtypes.json",
+        "extendedalternatives.json",
+    ),
+}
+
+EXTENSIONS = [
+    {"bII": ["b9"], "II": ["2", "9"], "#II": ["#9"]},
+    {"bIV": ["b11"], "IV": ["4", "11"], "#IV": ["#11"]},
+    {"bVI": ["b13"], "VI": ["6", "13"], "#VI": ["#13"]},
+]
+
 
 def make_chromatic_scale(root: str) -> list:
     """Make a chromatic scale based on a given root.
@@ -122,6 +214,75 @@ def get_all_intervals_index(interv: str) -> int:
     return index
 
 
+INTERVALS = [
+    "I",
+    "bII",
+    "II",
+    "#II",
+    "bIII",
+    "III",
+    "bIV",
+    "IV",
+    "#IV",
+    "bV",
+    "V",
+    "#V",
+    "bVI",
+    "VI",
+    "#VI",
+    "bVII",
+    "VII",
+]
+
+INTERVAL_BITS = {interval: 1 << i for (i, interval) in enumerate(INTERVALS)}
+
+INTERVAL_INDEXES = [get_all_intervals_index(i) for i in INTERVALS]
+
+
+def get_interval_mask(intervals) -> int:
+    """Get the bit mask of some intervals, a bit per interval name.
+
+    Bit ``n`` of the mask is set when :data:`INTERVALS` ``[n]`` is one
+    of the intervals, so "#II" and "bIII" are told apart.
+
+    :param intervals: The names of the intervals.
+    :type intervals: Iterable[str]
+    :returns: The interval mask.
+    :rtype: int
+    """
+    interval_mask = 0
+    for interval in intervals:
+        interval_mask |= INTERVAL_BITS[interval]
+    return interval_mask
+
+
+def get_mask_intervals(interval_mask: int) -> list[str]:
+    """Get the intervals of an interval mask, in order."""
+    return [
+        interval
+        for (i, interval) in enumerate(INTERVALS)
+        if interval_mask >> i & 1
+    ]
+
+
+def get_mask_notes(interval_mask: int, chromatic_scale: list) -> str:
+    """Get the notes of an interval mask, ordered by intervals.
+
+    :param interval_mask: The intervals of the chord.
+    :type interval_mask: int
+    :param chromatic_scale: The chromatic scale of the chord's root,
+        from :func:`make_chromatic_scale`.
+    :type chromatic_scale: list
+    :returns: The notes of the chord, separated by spaces.
+    :rtype: str
+    """
+    return " ".join(
+        chromatic_scale[INTERVAL_INDEXES[i]]
+        for i in range(len(INTERVALS))
+        if interval_mask >> i & 1
+    )
+
+
 class Chord:
     """Class defining chords and their methods.
 
@@ -247,8 +408,18 @@ class Chord:
 class ChordNameFormatter:
     """Class that groups methods to format chord names.
 
+    The ``get_*_name`` methods format a name string and return it, for
+    chords generated as (name, interval mask) tuples, while the
+    ``format_*_name`` methods format the name of a :class:`Chord`.
+
     Methods
     -------
+    :meth:`get_triad_name`: Returns a formatted triad name.
+
+    :meth:`get_seventh_chord_name`: Returns a formatted seventh name.
+
+    :meth:`get_extended_chord_name`: Returns a formatted extended name.
+
     :meth:`format_triad_name`: Formats triad chord names.
 
     :meth:`format_seventh_chord_name`: Formats seventh chord names.
@@ -260,58 +431,108 @@ class ChordNameFormatter:
         pass
 
     @staticmethod
-    def format_triad_name(chord: Chord):
-        """Format triad names using replace().
+    def get_triad_name(name: str, interval_mask: int) -> str:
+        """Format a triad name using replace().
 
         Formats diminished chords to not have "mdim" suffix.
 
-        :param chord: Chord to be formatted.
-        :type chord: Chord
+        :param name: Name of the chord to be formatted.
+        :type name: str
+        :param interval_mask: Intervals of the chord, from
+            :func:`get_interval_mask`.
+        :type interval_mask: int
+        :returns: The formatted name.
+        :rtype: str
         """
-        if "bIII" in chord.intervals and "dim" in chord.name:
-            chord.name = chord.name.replace("m", "", 1)
+        if interval_mask & INTERVAL_BITS["bIII"] and "dim" in name:
+            return name.replace("m", "", 1)
+        return name
 
     @staticmethod
-    def format_seventh_chord_name(chord: Chord):
-        """Format seventh chord names using replace().
+    def get_seventh_chord_name(name: str) -> str:
+        """Format a seventh chord name using replace().
 
         Formats "(b5)" chords to have the suffix at the end of the name.
         Formats "sus" chords to have a slash between their suffix and a
         "7".
 
-        :param chord: Chord to be formatted.
-        :type chord: Chord
+        :param name: Name of the chord to be formatted.
+        :type name: str
+        :returns: The formatted name.
+        :rtype: str
         """
-        if "(b5)" in chord.name:
-            chord.name = chord.name.replace("(b5)", "") + "(b5)"
-        elif "sus27" in chord.name:
-            chord.name = chord.name.replace("sus27", "sus2/7")
-        elif "sus47" in chord.name:
-            chord.name = chord.name.replace("sus47", "sus4/7")
+        if "(b5)" in name:
+            return name.replace("(b5)", "") + "(b5)"
+        elif "sus27" in name:
+            return name.replace("sus27", "sus2/7")
+        elif "sus47" in name:
+            return name.replace("sus47", "sus4/7")
+        return name
 
     @staticmethod
-    def format_extended_chord_name(chord: Chord):
-        """Format extended chord names using replace().
+    def get_extended_chord_name(name: str, root: str) -> str:
+        """Format an extended chord name using replace().
 
         Format the chords to either not have a slash or have
         parenthesis in its place, where applicable.
 
-        :param chord: Chord to be formatted.
-        :type chord: Chord
+        :param name: Name of the chord to be formatted.
+        :type name: str
+        :param root: Root of the chord.
+        :type root: str
+        :returns: The formatted name.
+        :rtype: str
         """
-        root = chord.get_root()
         for tone in ["2", "4", "6", "9", "11", "13"]:
-            if chord.name == root + "/" + tone:
-                chord.name = chord.name.replace("/", "")
-            elif chord.name.count("/") == 1 and (
-                "(b5)" not in chord.name and tone in chord.name
+            if name == root + "/" + tone:
+                name = name.replace("/", "")
+            elif name.count("/") == 1 and (
+                "(b5)" not in name and tone in name
             ):
-                chord.name = chord.name.replace("/", "(") + ")"
+                name = name.replace("/", "(") + ")"
+        return name
+
+    @staticmethod
+    def format_triad_name(chord: Chord):
+        """Format triad names with :meth:`get_triad_name`.
+
+        :param chord: Chord to be formatted.
+        :type chord: Chord
+        """
+        interval_mask = get_interval_mask(chord.intervals)
+        chord.name = ChordNameFormatter.get_triad_name(
+            chord.name, interval_mask
+        )
+
+    @staticmethod
+    def format_seventh_chord_name(chord: Chord):
+        """Format seventh chord names with :meth:`get_seventh_chord_name`.
+
+        :param chord: Chord to be formatted.
+        :type chord: Chord
+        """
+        chord.name = ChordNameFormatter.get_seventh_chord_name(chord.name)
+
+    @staticmethod
+    def format_extended_chord_name(chord: Chord):
+        """Format extended chord names with :meth:`get_extended_chord_name`.
+
+        :param chord: Chord to be formatted.
+        :type chord: Chord
+        """
+        chord.name = ChordNameFormatter.get_extended_chord_name(
+            chord.name, chord.get_root()
+        )
 
 
 class TriadChordGenerator:
     """Class that defines a triad generator and its methods.
 
+    Chords are generated as (name, interval mask) tuples, the interval
+    mask being made by :func:`get_interval_mask`, and those that aren't
+    standard are left out as they're generated. Only the chords kept
+    are turned into :class:`Chord` objects, by :meth:`generate`.
+
     Attributes
     ----------
     .. attribute:: chords_generated
@@ -330,9 +551,17 @@ class TriadChordGenerator:
 
     :meth:`generate_sus_chords`: Generate all "sus" chords.
 
+    :meth:`get_power_chord`: Create the power chord of the root.
+
     :meth:`generate_power_chord`: Generate the power chord of the root.
 
-    :meth:`remove_unstandard_triad_chords`: Remove selected triads.
+    :meth:`is_standard_triad_chord`: Tell if a triad is standard.
+
+    :meth:`generate_chord_tuples`: Generate the formatted chord tuples.
+
+    :meth:`iter_chord_tuples`: Yield the formatted chord tuples.
+
+    :meth:`iter_chords`: Yield the chords with their notes.
 
     :meth:`generate`: Combines all methods and formats the chords.
     """
@@ -350,83 +579,124 @@ class TriadChordGenerator:
         self.chords_generated: list[Chord] = []
         self.root = root
 
-    def generate_triads(self):
+    def generate_triads(self) -> list[tuple[str, int]]:
         """Generate all triad chords with the generator's root.
 
         Declares dictionaries containing thirds and fifths (the
         components of a triad chord), with both intervals and chord
-        tones, then iterate through them. At the end, instantiate an
-        empty chord and use :meth:`add_interval_and_tone` to add the
-        elements to it, finally appending it to the
-        :attr:`chords_generated`.
+        tones, then iterate through them, adding the tones to the name
+        and the intervals to the mask of the root.
 
         :var dict thirds: Dictionary containing both thirds.
         :var dict fifths: Dictionary containing all fifths.
+        :returns: The triads, as (name, interval mask) tuples.
+        :rtype: list[tuple[str, int]]
         """
         thirds = {"bIII": "m", "III": ""}
         fifths = {"bV": ["5-", "dim", "(b5)"], "V": [""], "#V": ["5+", "aug"]}
 
+        triads = []
         for third in thirds:
             for fifth in fifths:
                 for tone in fifths[fifth]:
-                    chord_obj = Chord(self.root, {"I"})
-                    chord_obj.name += thirds[third]
-                    chord_obj.intervals.add(third)
-                    chord_obj.add_interval_and_tone(fifth, tone)
-                    self.chords_generated.append(chord_obj)
+                    name = self.root + thirds[third] + tone
+                    interval_mask = get_interval_mask(["I", third, fifth])
+                    triads.append((name, interval_mask))
+        return triads
 
-    def generate_sus_chords(self):
+    def generate_sus_chords(self) -> list[tuple[str, int]]:
         """Generate all "sus" chords of the generator's root.
 
         Similar to :meth:`generate_triads`, declares a dictionary with
-        intervals and chord tones, then iterate through it, adding the
-        elements to the chord in the process.
+        intervals and chord tones, then iterate through it.
 
         :var dict sus_chords_dict: Contains "sus" chord information.
+        :returns: The "sus" chords, as (name, interval mask) tuples.
+        :rtype: list[tuple[str, int]]
         """
         sus_chords_dict = {"sus2": "II", "sus4": "IV", "sus": "IV"}
+        sus_chords = []
         for suffix in sus_chords_dict:
-            chord_intervals = {"I", sus_chords_dict[suffix], "V"}
-            chord_obj = Chord(self.root + suffix, chord_intervals)
-            self.chords_generated.append(chord_obj)
+            chord_intervals = ["I", sus_chords_dict[suffix], "V"]
+            interval_mask = get_interval_mask(chord_intervals)
+            sus_chords.append((self.root + suffix, interval_mask))
+        return sus_chords
 
-    def generate_power_chord(self):
-        """Create a power (5) chord and adds it to the list."""
+    def get_power_chord(self) -> Chord:
+        """Create the power (5) chord of the root, with its notes."""
         chord_obj = Chord(self.root, {"I"})
         chord_obj.add_interval_and_tone("V", "5")
         chord_obj.get_chord_notes()
-        self.chords_generated.append(chord_obj)
+        return chord_obj
+
+    def generate_power_chord(self):
+        """Create a power (5) chord and adds it to the list."""
+        self.chords_generated.append(self.get_power_chord())
 
-    def remove_unstandard_triad_chords(self):
-        """Remove unstandard triads from the list of chords generated.
+    @staticmethod
+    def is_standard_triad_chord(chord: tuple[str, int]) -> bool:
+        """Tell if a triad is standard.
+
+        Major chords that have "dim" in their names and minor chords
+        that have augmented particles in them aren't.
+
+        :param chord: The (name, interval mask) tuple of the triad.
+        :type chord: tuple[str, int]
+        :rtype: bool
+        """
+        name, interval_mask = chord
+        if interval_mask & INTERVAL_BITS["III"] and "dim" in name:
+            return False
+        if interval_mask & INTERVAL_BITS["bIII"] and (
+            "aug" in name or "5+" in name
+        ):
+            return False
+        return True
+
+    def generate_chord_tuples(self) -> list[tuple[str, int]]:
+        """Generate the standard triads and "sus" chords, formatted.
+
+        :returns: The chords, as (name, interval mask) tuples.
+        :rtype: list[tuple[str, int]]
+        """
+        chords = self.generate_triads() + self.generate_sus_chords()
+        return [
+            (ChordNameFormatter.get_triad_name(*chord), chord[1])
+            for chord in chords
+            if self.is_standard_triad_chord(chord)
+        ]
+
+    def iter_chord_tuples(self):
+        """Yield the tuples of :meth:`generate_chord_tuples`, one by one.
 
-        Copies :attr:`chords_generated` so the removing doesn't mess
-        up the iteration that ensues. First, remove major chords that
-        have "dim" in their names, then remove minor chords that have
-        augmented particles in them.
+        :returns: The chords, as (name, interval mask) tuples.
+        :rtype: Iterator[tuple[str, int]]
         """
-        previous_chord_list = self.chords_generated.copy()
-        for chord_obj in previous_chord_list:
-            if "III" in chord_obj.intervals and "dim" in chord_obj.name:
-                self.chords_generated.remove(chord_obj)
+        yield from self.generate_chord_tuples()
 
-            for tone in ["aug", "5+"]:
-                if "bIII" in chord_obj.intervals and tone in chord_obj.name:
-                    self.chords_generated.remove(chord_obj)
+    def iter_chords(self):
+        """Yield the chords generated one by one, with their notes.
+
+        Turns the tuples from :meth:`iter_chord_tuples` into
+        :class:`Chord` objects as they come, getting their notes with
+        :func:`get_mask_notes`.
+
+        :returns: The chords generated.
+        :rtype: Iterator[Chord]
+        """
+        chromatic_scale = make_chromatic_scale(self.root)
+        for name, interval_mask in self.iter_chord_tuples():
+            chord_obj = Chord(name, set(get_mask_intervals(interval_mask)))
+            chord_obj.notes = get_mask_notes(interval_mask, chromatic_scale)
+            yield chord_obj
 
     def generate(self):
-        """Combine all generation methods and formats the chords.
+        """Generate the chords and add them to the list with their notes.
 
-        Generates triad chords, "sus" chords, removes the unstandard
-        ones, format them and get their notes.
+        Adds the chords from :meth:`iter_chords` to
+        :attr:`chords_generated`.
         """
-        self.generate_triads()
-        self.generate_sus_chords()
-        self.remove_unstandard_triad_chords()
-        formatter = ChordNameFormatter()
-        for chord_obj in self.chords_generated:
-            formatter.format_triad_name(chord_obj)
-            chord_obj.get_chord_notes()
+        self.chords_generated.extend(self.iter_chords())
 
 
 class SeventhChordGenerator(TriadChordGenerator):
@@ -436,151 +706,373 @@ class SeventhChordGenerator(TriadChordGenerator):
     -------
     :meth:`generate_seventh_chords`: Generates all seventh chords.
 
-    :meth:`remove_unstandard_seventh_chords`: Removes selected chords.
+    :meth:`is_standard_seventh_chord`: Tells if a chord is standard.
 
-    :meth:`generate`: Generates, gets notes and format seventh chords.
+    :meth:`generate_chord_tuples`: Generates the formatted chord tuples.
     """
 
     def __init__(self, root=""):
         super().__init__(root)
 
-    def generate_seventh_chords(self):
-        """Generate all seventh chords using the generator's root.
+    @staticmethod
+    def generate_seventh_chords(chords: list) -> list[tuple[str, int]]:
+        """Add every seventh to some chords.
 
         Declares a variable containing seventh intervals and tones, then
-        uses the parent class's :meth:`TriadChordGenerator.generate` to
-        establish the base chords. Finally, iterates through the chords
-        and the variable and adds its elements to a deepcopy of the
-        chords, appending them to :attr:`chords_generated`.
+        iterates through the chords and the variable, making a new tuple
+        for each seventh. The standard ones are kept.
 
+        :param chords: The (name, interval mask) tuples of the chords.
+        :type chords: list[tuple[str, int]]
         :var dict sevenths: Dictionary containing seventh elements.
+        :returns: The seventh chords, as (name, interval mask) tuples.
+        :rtype: list[tuple[str, int]]
         """
         sevenths = {"bVII": ["7"], "VII": ["maj7", "7M"]}
-        super().generate()
-        previous_chords = self.chords_generated.copy()
-        for chord in previous_chords:
+        seventh_chords = []
+        for name, interval_mask in chords:
             for seventh in sevenths:
+                seventh_bit = INTERVAL_BITS[seventh]
                 for tone in sevenths[seventh]:
-                    chord_obj = copy.deepcopy(chord)
-                    chord_obj.add_interval_and_tone(seventh, tone)
-                    self.chords_generated.append(chord_obj)
+                    chord = (name + tone, interval_mask | seventh_bit)
+                    if SeventhChordGenerator.is_standard_seventh_chord(chord):
+                        seventh_chords.append(chord)
+        return seventh_chords
+
+    @staticmethod
+    def is_standard_seventh_chord(chord: tuple[str, int]) -> bool:
+        """Tell if a chord is in the musical standard.
 
-    def remove_unstandard_seventh_chords(self):
-        """Remove chords out of the musical standard.
+        "mmaj7", "susmaj7", "augmaj7" and "dim7" chords aren't.
 
-        Iterates through a copy of the list of chords and remove
-        "mmaj7", "susmaj7", "augmaj7" and "dim7" chords from the
-        original.
+        :param chord: The (name, interval mask) tuple of the chord.
+        :type chord: tuple[str, int]
+        :rtype: bool
         """
-        previous_chord_list = self.chords_generated.copy()
-        for chord_obj in previous_chord_list:
-            if (
-                "mmaj7" in chord_obj.name
-                or "susmaj7" in chord_obj.name
-                or "augmaj7" in chord_obj.name
-                or "dim7" in chord_obj.name
-            ):
-                self.chords_generated.remove(chord_obj)
+        name = chord[0]
+        return not (
+            "mmaj7" in name
+            or "susmaj7" in name
+            or "augmaj7" in name
+            or "dim7" in name
+        )
 
-    def generate(self):
-        """Generate seventh chords, format names and get notes."""
-        self.generate_seventh_chords()
-        self.remove_unstandard_seventh_chords()
-        formatter = ChordNameFormatter()
-        for chord_obj in self.chords_generated:
-            formatter.format_seventh_chord_name(chord_obj)
-            chord_obj.get_chord_notes()
+    def generate_chord_tuples(self) -> list[tuple[str, int]]:
+        """Generate the triads and seventh chords, formatted.
+
+        :returns: The chords, as (name, interval mask) tuples.
+        :rtype: list[tuple[str, int]]
+        """
+        chords = super().generate_chord_tuples()
+        chords += self.generate_seventh_chords(chords)
+        return [
+            (ChordNameFormatter.get_seventh_chord_name(name), interval_mask)
+            for name, interval_mask in chords
+        ]
 
 
 class ExtendedChordGenerator(SeventhChordGenerator):
     """Class to generate all extended chords.
 
+    Attributes
+    ==========
+    .. attribute:: extension_count
+       :type: int
+
+       How many of the :data:`EXTENSIONS` are added to the chords.
+
     Methods
     =======
-    :meth:`generate_nth_chords`: Adds any given extension to chords.
+    :meth:`iter_nth_chords`: Adds any given extension to chords.
+
+    :meth:`iter_extended_chords`: Yields the extended chords.
+
+    :meth:`iter_chord_extensions`: Yields a chord and its extensions.
 
     :meth:`generate_extended_chords`: Generates all extended chords.
 
-    :meth:`remove_unstandard_extended_chords`: Remove selected chords.
+    :meth:`is_standard_extended_chord`: Tells if a chord is standard.
 
-    :meth:`generate`: Combine previous methods and gets chords' notes.
+    :meth:`iter_chord_tuples`: Yields the formatted chord tuples.
+
+    :meth:`generate_chord_tuples`: Generates the formatted chord tuples.
     """
 
-    def __init__(self, root=""):
+    def __init__(self, root="", extension_count=None):
+        """Instantiates a generator.
+
+        :param root: Root of the chords to be generated.
+        :type root: str
+        :param extension_count: Passed to :attr:`extension_count`, all
+            of the :data:`EXTENSIONS` if None.
+        :type extension_count: int | None
+        """
         super().__init__(root)
+        if extension_count is None:
+            extension_count = len(EXTENSIONS)
+        self.extension_count = extension_count
 
-    def generate_nth_chords(self, extension_dict: dict):
-        """Add to chords a given extension.
+    def iter_nth_chords(self, chords, extension_dict: dict):
+        """Add to chords a given extension, yielding the new chords.
 
-        Similar to :meth:`generate_seventh_chords` this method uses
-        iteration and deepcopying, with the addition of a separator
-        between chord tones and the passing of a parameter to choose
-        which extension to use.
+        Similar to :meth:`generate_seventh_chords`, with the addition of
+        a separator between chord tones and the passing of a parameter
+        to choose which extension to use. As no extension makes a chord
+        standard again, only the standard chords are extended.
 
+        :param chords: The (name, interval mask) tuples of the chords.
+        :type chords: Iterable[tuple[str, int]]
         :param extension_dict: Dictionary containing an extension.
         :type extension_dict: dict
+        :returns: The extended chords.
+        :rtype: Iterator[tuple[str, int]]
         """
-        previous_chords = self.chords_generated.copy()
-        for chord in previous_chords:
+        for name, interval_mask in chords:
             for extension in extension_dict:
+                extension_bit = INTERVAL_BITS[extension]
                 for tone in extension_dict[extension]:
-                    chord_obj = copy.deepcopy(chord)
-                    chord_obj.name += "/"
-                    chord_obj.add_interval_and_tone(extension, tone)
-                    self.chords_generated.append(chord_obj)
-
-    def generate_extended_chords(self):
+                    chord = (f"{name}/{tone}", interval_mask | extension_bit)
+                    if self.is_standard_extended_chord(chord):
+                        yield chord
+
+    def iter_extended_chords(self, extension_count: int):
+        """Yield the chords with up to a number of extensions.
+
+        Each standard chord from the parent class's
+        :meth:`generate_chord_tuples` is followed by its extensions from
+        :meth:`iter_chord_extensions`, depth first, so only the seventh
+        chords and the extensions of one chord at a time are in memory.
+
+        :param extension_count: How many extensions to add.
+        :type extension_count: int
+        :returns: The standard chords, as (name, interval mask) tuples.
+        :rtype: Iterator[tuple[str, int]]
+        """
+        for chord in super().generate_chord_tuples():
+            if self.is_standard_extended_chord(chord):
+                yield from self.iter_chord_extensions(
+                    chord, 0, extension_count
+                )
+
+    def iter_chord_extensions(
+        self, chord: tuple[str, int], first: int, extension_count: int
+    ):
+        """Yield a chord, then the chords it makes with later extensions.
+
+        Every extension of :data:`EXTENSIONS` from the first index up
+        to the extension count is added to the chord, and each new chord
+        is extended in turn with the extensions after its own, the
+        chords waiting to be yielded being kept on a stack. Every chord
+        is made once, in time proportional to the chords yielded.
+
+        :param chord: The (name, interval mask) tuple of the chord.
+        :type chord: tuple[str, int]
+        :param first: The index of the first extension to add.
+        :type first: int
+        :param extension_count: How many extensions there are to add.
+        :type extension_count: int
+        :returns: The chord and its extended chords.
+        :rtype: Iterator[tuple[str, int]]
+        """
+        pending = [(chord, first)]
+        while pending:
+            chord, first = pending.pop()
+            yield chord
+            for index in range(extension_count - 1, first - 1, -1):
+                extended_chords = list(
+                    self.iter_nth_chords([chord], EXTENSIONS[index])
+                )
+                for extended_chord in reversed(extended_chords):
+                    pending.append((extended_chord, index + 1))
+
+    def generate_extended_chords(self) -> list[tuple[str, int]]:
         """Generate all extended chords with the generator's root.
 
-        Declares three variables containing the three types of extension
-        and uses first the parent class's :meth:`generate` then the
-        :meth:`generate_nth_chords` method with the variables to
-        generate.
-
-        :var dict ninths: Contains the ninth extensions.
-        :var dict elevenths: Contains the eleventh extensions.
-        :var dict thirteenths: Contains the thirteenth extensions.
+        :returns: The standard chords with :attr:`extension_count`
+            extensions, from :meth:`iter_extended_chords`.
+        :rtype: list[tuple[str, int]]
         """
-        ninths = {"bII": ["b9"], "II": ["2", "9"], "#II": ["#9"]}
-        elevenths = {"bIV": ["b11"], "IV": ["4", "11"], "#IV": ["#11"]}
-        thirteenths = {"bVI": ["b13"], "VI": ["6", "13"], "#VI": ["#13"]}
+        return list(self.iter_extended_chords(self.extension_count))
 
-        super().generate()
-        self.generate_nth_chords(ninths)
-        self.generate_nth_chords(elevenths)
-        self.generate_nth_chords(thirteenths)
+    def is_standard_extended_chord(self, chord: tuple[str, int]) -> bool:
+        """Tell if a chord is up to standards.
 
-    def remove_unstandard_extended_chords(self):
-        """Remove chords not up to standards.
+        "2", "4", and "6" chords that aren't only major aren't.
 
-        Removes "2", "4", and "6" chords that aren't only major.
+        :param chord: The (name, interval mask) tuple of the chord.
+        :type chord: tuple[str, int]
+        :rtype: bool
         """
-        previous_chord_list = self.chords_generated.copy()
-        for chord_obj in previous_chord_list:
-            root = chord_obj.get_root()
-
-            if (
-                ("2" in chord_obj.name and chord_obj.name != f"{root}2")
-                or ("4" in chord_obj.name and chord_obj.name != f"{root}4")
-                or ("6" in chord_obj.name and chord_obj.name != f"{root}6")
-            ):
-                self.chords_generated.remove(chord_obj)
-                continue
+        name = chord[0]
+        for tone in ["2", "4", "6"]:
+            if tone in name and name != self.root + tone:
+                return False
+        return True
 
-    def generate(self):
-        """Generate extended chords, format names and get notes."""
-        self.generate_extended_chords()
-        self.remove_unstandard_extended_chords()
-        formatter = ChordNameFormatter()
-        for chord_obj in self.chords_generated:
-            formatter.format_extended_chord_name(chord_obj)
-            chord_obj.get_chord_notes()
+    def iter_chord_tuples(self):
+        """Yield the standard extended chords, formatted.
+
+        :returns: The chords, as (name, interval mask) tuples.
+        :rtype: Iterator[tuple[str, int]]
+        """
+        extended_chords = self.iter_extended_chords(self.extension_count)
+        for name, interval_mask in extended_chords:
+            name = ChordNameFormatter.get_extended_chord_name(name, self.root)
+            yield name, interval_mask
+
+    def generate_chord_tuples(self) -> list[tuple[str, int]]:
+        """Generate the standard extended chords, formatted.
+
+        :returns: The chords, as (name, interval mask) tuples.
+        :rtype: list[tuple[str, int]]
+        """
+        return list(self.iter_chord_tuples())
 
 
 Generator = (
     TriadChordGenerator | SeventhChordGenerator | ExtendedChordGenerator
 )
 
+GENERATOR_CLASSES = {
+    "-t": TriadChordGenerator,
+    "-s": SeventhChordGenerator,
+    "-e": ExtendedChordGenerator,
+}
+
+MODE_LEVELS = {"-t": 3, "-s": 7, "-e": 13}
+
+DUMP_OPTIONS = ["--compact", "--lines", "--gzip", "--parallel"]
+
+
+def get_chord_item(chord_obj: Chord) -> tuple[str, str]:
+    """Format a chord as a "name (intervals)" and notes pair to dump."""
+    interval_string = " ".join(chord_obj.order_intervals())
+    return f"{chord_obj.name} ({interval_string})", chord_obj.notes
+
+
+def format_chords(chord_generator: Generator) -> dict:
+    """Format the chords generated by a generator to dump.
+
+    :param chord_generator: The generator with the chords generated.
+    :type chord_generator: Generator
+    :returns: The notes of the chords keyed by name and intervals.
+    :rtype: dict
+    """
+    return dict(map(get_chord_item, chord_generator.chords_generated))
+
+
+def iter_chords(root: str, level=13):
+    """Yield the chords of a root one by one, up to a level.
+
+    :param root: The root of the chords.
+    :type root: str
+    :param level: 3 for triads, 7 for seventh chords, and 9, 11 or 13
+        for extended chords up to that extension.
+    :type level: int
+    :returns: The chords, with their notes.
+    :rtype: Iterator[Chord]
+    """
+    if level == 3:
+        chord_generator = TriadChordGenerator(root)
+    elif level == 7:
+        chord_generator = SeventhChordGenerator(root)
+    elif level in [9, 11, 13]:
+        chord_generator = ExtendedChordGenerator(root, (level - 7) // 2)
+    else:
+        raise ValueError(f"Invalid chord level: {level}.")
+    yield from chord_generator.iter_chords()
+
+
+def get_root_chord_items(level: int, root: str) -> list[tuple[str, str]]:
+    """Get the chords of a root up to a level, formatted to dump.
+
+    The root is followed by its power chord, as in
+    :func:`generate_chords`.
+
+    :param level: Passed to :func:`iter_chords`.
+    :type level: int
+    :param root: The root of the chords.
+    :type root: str
+    :returns: Pairs of "name (intervals)" and notes.
+    :rtype: list[tuple[str, str]]
+    """
+    chord_items = [get_chord_item(c) for c in iter_chords(root, level)]
+    chord_items.append(
+        get_chord_item(TriadChordGenerator(root).get_power_chord())
+    )
+    return chord_items
+
+
+def iter_chord_items(level=13, max_workers=1):
+    """Yield the chords of every root up to a level, formatted to dump.
+
+    The chords come in the same order as in :func:`generate_chords`,
+    root by root, from :func:`get_root_chord_items`. With more than one
+    worker, the roots are generated by a pool of processes and each is
+    yielded as soon as it and the ones before it are done, so only a few
+    roots are in memory at once.
+
+    :param level: Passed to :func:`iter_chords`.
+    :type level: int
+    :param max_workers: How many processes to use, one per CPU if None.
+        With 1, the chords are generated one by one in the current
+        process.
+    :type max_workers: int | None
+    :returns: Pairs of "name (intervals)" and notes.
+    :rtype: Iterator[tuple[str, str]]
+    """
+    if max_workers == 1:
+        for root in ROOTS:
+            for chord_obj in iter_chords(root, level):
+                yield get_chord_item(chord_obj)
+            power_chord = TriadChordGenerator(root).get_power_chord()
+            yield get_chord_item(power_chord)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        root_items = executor.map(
+            get_root_chord_items, itertools.repeat(level), ROOTS
+        )
+        for chord_items in root_items:
+            yield from chord_items
+
+
+def stream_chords_to_json(
+    file_path: str,
+    level=13,
+    indent=4,
+    lines=False,
+    compress=False,
+    max_workers=1,
+) -> int:
+    """Write the chords up to a level to a .json file as they're made.
+
+    The chords from :func:`iter_chord_items` are written one by one
+    with :func:`datahelper.dump_json_items`, so they're never all in
+    memory. They are written in generation order, not sorted.
+
+    :param file_path: The path of the file.
+    :type file_path: str
+    :param level: Passed to :func:`iter_chords`.
+    :type level: int
+    :param indent: Passed to :func:`datahelper.dump_json_items`.
+    :type indent: int | None
+    :param lines: Passed to :func:`datahelper.dump_json_items`.
+    :type lines: bool
+    :param compress: Passed to :func:`datahelper.dump_json_items`.
+    :type compress: bool
+    :param max_workers: Passed to :func:`iter_chord_items`.
+    :type max_workers: int | None
+    :returns: How many chords were written.
+    :rtype: int
+    """
+    return datahelper.dump_json_items(
+        iter_chord_items(level, max_workers),
+        file_path,
+        indent,
+        lines,
+        compress,
+    )
+
 
 def generate_chords(chord_generator: Generator) -> dict:
     """Generate all chords of a given type and format them to dump.
@@ -602,52 +1094,160 @@ def generate_chords(chord_generator: Generator) -> dict:
         chord_generator.root = root
         chord_generator.generate()
         chord_generator.generate_power_chord()
-        for chord_obj in chord_generator.chords_generated:
-            interval_string = " ".join(chord_obj.order_intervals())
-            name_interval = f"{chord_obj.name} ({interval_string})"
-            chord_dump[name_interval] = chord_obj.notes
+        chord_dump.update(format_chords(chord_generator))
         chord_generator.chords_generated.clear()
     return chord_dump
 
 
-def dump_chords_to_json(chord_dump: dict, mode: str, path="../data"):
-    """Dumps the generated chords in .json format to disk.
+def generate_root_chords(generator_class: type, root: str) -> dict:
+    """Generate all chords of a given type on a single root.
+
+    :param generator_class: The class of the generator to be used.
+    :type generator_class: type
+    :param root: The root of the chords.
+    :type root: str
+    :returns: The chord dump variable of the root.
+    :rtype: dict
+    """
+    chord_generator = generator_class(root)
+    chord_generator.generate()
+    chord_generator.generate_power_chord()
+    return format_chords(chord_generator)
+
+
+def generate_chords_parallel(generator_class: type, max_workers=None) -> dict:
+    """Generate all chords of a given type, a root per worker process.
+
+    Each root of :data:`ROOTS` is generated with
+    :func:`generate_root_chords` in a pool of processes, and the chords
+    are merged in the order of :data:`ROOTS`, so the dump is the same as
+    the one of :func:`generate_chords`.
+
+    :param generator_class: The class of the generator to be used.
+    :type generator_class: type
+    :param max_workers: How many processes to use, one per CPU if None.
+    :type max_workers: int | None
+    :returns: The chord dump variable.
+    :rtype: dict
+    """
+    chord_dump = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        root_dumps = executor.map(
+            generate_root_chords, itertools.repeat(generator_class), ROOTS
+        )
+        for root_dump in root_dumps:
+            chord_dump.update(root_dump)
+    return chord_dump
+
+
+def generate_chord_types(chord_dump: dict) -> dict:
+    """Get the chord types of every chord in a dump.
+
+    The chords of every root share the same suffixes (e.g.: "m7") and
+    intervals, so each suffix is kept once, with its intervals, and the
+    chords of any root can be made from it.
 
     :param chord_dump: The dump variable containing chord information.
     :type chord_dump: dict
+    :returns: The intervals, separated by spaces, keyed by suffix.
+    :rtype: dict
+    """
+    chord_types = {}
+    for name_interval, chord_notes in chord_dump.items():
+        name, interval_str = name_interval[:-1].split(" (")
+        root = chord_notes.split()[0]
+        chord_types.setdefault(name[len(root) :], interval_str)
+    return chord_types
+
+
+def generate_alternative_types(chord_types: dict) -> dict:
+    """Get the chord types on the rotations of the notes of every chord.
+
+    The types are grouped by the semitones of the notes they're on the
+    rotations of with :func:`datahelper.get_rotation_types`, so the
+    alternative names of a chord on any root can be found with a single
+    lookup of the semitones of its notes.
+
+    :param chord_types: The chord types, from :func:`generate_chord_types`.
+    :type chord_types: dict
+    :returns: The rotation types, formatted by
+        :func:`datahelper.format_rotation_types`, keyed by semitones.
+    :rtype: dict
+    """
+    type_semitones = [
+        (suffix, tuple(map(get_all_intervals_index, interval_str.split())))
+        for suffix, interval_str in chord_types.items()
+    ]
+    rotation_types = datahelper.get_rotation_types(type_semitones)
+    return {
+        key: datahelper.format_rotation_types(sorted(types))
+        for key, types in rotation_types.items()
+    }
+
+
+def dump_chords_to_json(
+    mode: str,
+    path="../data",
+    indent=4,
+    lines=False,
+    compress=False,
+    max_workers=1,
+):
+    """Dumps the chords of a mode in .json format to disk.
+
+    The chords are written with :func:`stream_chords_to_json` as they're
+    generated, in the format given by its parameters, and named by
+    :func:`datahelper.get_json_path`. They're generator output only, as
+    the chords module reads the chord types from
+    :func:`generate_chord_types`, which are dumped next to them in the
+    precompiled binary format of :func:`datahelper.dump_binary_file`,
+    along with the types on their rotations from
+    :func:`generate_alternative_types`. The types are the same on every
+    root, so they're taken from the chords of the first root of
+    :data:`ROOTS`.
+
     :param mode: The mode used in the script.
     :type mode: str
     :param path: The directory to dump the chords in.
     :type path: str
+    :param indent: Passed to :func:`datahelper.dump_json_items`.
+    :type indent: int | None
+    :param lines: Passed to :func:`datahelper.dump_json_items`.
+    :type lines: bool
+    :param compress: Passed to :func:`datahelper.dump_json_items`.
+    :type compress: bool
+    :param max_workers: Passed to :func:`iter_chord_items`. The chords
+        are generated in the current process by default.
+    :type max_workers: int | None
     """
-    if mode == "-t":
-        chords_path = os.path.join(os.path.abspath(path), "triadchords.json")
-        with open(chords_path, "w") as chords_file:
-            json.dump(chord_dump, chords_file, indent=4, sort_keys=True)
-
-    if mode == "-s":
-        chords_path = os.path.join(os.path.abspath(path), "seventhchords.json")
-        with open(chords_path, "w") as chords_file:
-            json.dump(chord_dump, chords_file, indent=4, sort_keys=True)
-
-    if mode == "-e":
-        chords_path = os.path.join(
-            os.path.abspath(path), "extendedchords.json"
-        )
-        with open(chords_path, "w") as chords_file:
-            json.dump(chord_dump, chords_file, indent=4, sort_keys=True)
+    chords_name, types_name, alternatives_name = DUMP_FILE_NAMES[mode]
+    chords_path = os.path.join(os.path.abspath(path), chords_name)
+    chords_path = datahelper.get_json_path(chords_path, lines, compress)
+    stream_chords_to_json(
+        chords_path, MODE_LEVELS[mode], indent, lines, compress, max_workers
+    )
+    root_chords = generate_root_chords(GENERATOR_CLASSES[mode], ROOTS[0])
+    chord_types = generate_chord_types(root_chords)
+    types_path = os.path.join(os.path.abspath(path), types_name)
+    datahelper.dump_binary_file(
+        chord_types, datahelper.get_binary_path(types_path)
+    )
+    alternatives_path = os.path.join(os.path.abspath(path), alternatives_name)
+    datahelper.dump_binary_file(
+        generate_alternative_types(chord_types),
+        datahelper.get_binary_path(alternatives_path),
+    )
     print(f"Success! Chords dumped to {chords_path}.\n")
 
 
-def run(mode: str):
-    if mode == "-t":
-        cgen = TriadChordGenerator()
-    if mode == "-s":
-        cgen = SeventhChordGenerator()
-    if mode == "-e":
-        cgen = ExtendedChordGenerator()
-    chord_dump = generate_chords(cgen)
-    dump_chords_to_json(chord_dump, mode)
+def run(mode: str, indent=4, lines=False, compress=False, max_workers=1):
+    dump_chords_to_json(
+        mode,
+        indent=indent,
+        lines=lines,
+        compress=compress,
+        max_workers=max_workers,
+    )
 
 
 if __name__ == "__main__":
@@ -657,7 +1257,11 @@ if __name__ == "__main__":
         "to 'triadchords.json'.\nPass '-s' to generate all seventh "
         "and underlying chords and write them to 'seventhchords"
         ".json'.\nPass '-e' to generate all extended and underlying "
-        "chords and write them to 'extendedchords.json'.\n"
+        "chords and write them to 'extendedchords.json'.\nAfter the "
+        "mode, pass '--compact' to write the chords without spaces, "
+        "'--lines' to write them in JSON Lines format (.jsonl) and "
+        "'--gzip' to compress them (.gz).\nPass '--parallel' to "
+        "generate the chords in a process per CPU.\n"
     )
 
     if len(sys.argv) > 1:
@@ -666,9 +1270,18 @@ if __name__ == "__main__":
         mode_input = "-h"
     if mode_input not in ["-t", "-s", "-e", "-h", "-help"]:
         mode_input = "-h"
+    dump_options = sys.argv[2:]
+    if any(option not in DUMP_OPTIONS for option in dump_options):
+        mode_input = "-h"
 
     if mode_input in ["-h", "-help"]:
         print(help_message)
     else:
-        run(mode_input)
+        run(
+            mode_input,
+            None if "--compact" in dump_options else 4,
+            "--lines" in dump_options,
+            "--gzip" in dump_options,
+            None if "--parallel" in dump_options else 1,
+        )
     exit()
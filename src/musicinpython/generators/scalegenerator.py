@@ -4,9 +4,13 @@ Imports
 =======
 :mod:`os`: Used to obtain path to .json file.
 
+:mod:`sys`: Used to get the arguments from the command-line.
+
 :mod:`copy`: Used to deepcopy objects.
 
-:mod:`json`: Used to dump all the scales to .json format.
+:mod:`datahelper`: Used to dump all the scales to .json and binary format.
+
+:mod:`scales`: Used to tell the scale variants apart.
 
 Global variables
 ================
@@ -35,14 +39,29 @@ Global variables
 
    Contains all notes to be used as scale roots.
 
+.. data:: FORMAT_OPTIONS
+   :type: list[str]
+
+   The command-line options choosing the format of the scale dump.
+
 Functions
 =========
 :func:`make_chromatic_scale`: Generates a chromatic scale.
 
 :func:`get_interval_index`: Gets an interval's index from a list.
 
+:func:`get_scale_item`: Formats a scale to dump.
+
+:func:`generate_root_scales`: Generates all scales of a root.
+
+:func:`iter_all_scales`: Yields all scales, root by root.
+
 :func:`generate_all_scales`: Generates all scales using all roots.
 
+:func:`generate_scale_types`: Gets the scale types of the scales.
+
+:func:`generate_alternative_types`: Gets the types of scale rotations.
+
 :func:`dump_scales`: Dumps scales in .json format.
 
 Classes
@@ -52,8 +71,10 @@ Classes
 :class:`ScaleGenerator`: Generates scales.
 """
 import os
+import sys
 import copy
-import json
+import musicinpython.datahelper as datahelper
+import musicinpython.scales as scales
 
 BASE_SCALES = {
     "Major": "I II III IV V VI VII",
@@ -100,6 +121,8 @@ ROOTS = [
     "B",
 ]
 
+FORMAT_OPTIONS = ["--compact", "--lines", "--gzip"]
+
 
 def make_chromatic_scale(root: str) -> list:
     """Make a chromatic scale with a given root.
@@ -325,59 +348,188 @@ class ScaleGenerator:
         self.add_variation(seventh_variations)
 
 
+def get_scale_item(scale: Scale) -> tuple[str, str]:
+    """Get the notes of a scale and format it to dump.
+
+    :param scale: A scale without its notes yet.
+    :type scale: Scale
+    :returns: The "name (intervals)" and notes pair of the scale.
+    :rtype: tuple[str, str]
+    """
+    scale.get_scale_notes()
+    return f"{scale.name} ({scale.intervals})", scale.notes
+
+
+def generate_root_scales(root: str) -> list[Scale]:
+    """Generate all possible scales on a single root.
+
+    Uses :meth:`generate` on module scale constants
+    :data:`DIATONIC_SCALES` and :data:`PENTATONICS`, then
+    :meth:`generate_variations` to add all variations.
+
+    :param root: The root of the scales.
+    :type root: str
+    :returns: The scales of the root with variations included.
+    :rtype: list[Scale]
+    """
+    scale_generator_obj = ScaleGenerator(root)
+    scale_generator_obj.generate(DIATONIC_SCALES)
+    scale_generator_obj.generate(PENTATONICS)
+    scale_generator_obj.generate_variations()
+    return scale_generator_obj.scales_generated
+
+
+def iter_all_scales():
+    """Yield all possible scales, one root of :data:`ROOTS` at a time.
+
+    Only the scales of the current root, from
+    :func:`generate_root_scales`, are kept in memory.
+
+    :returns: All scales with variations included.
+    :rtype: Iterator[Scale]
+    """
+    for root in ROOTS:
+        yield from generate_root_scales(root)
+
+
 def generate_all_scales() -> list[Scale]:
     """Generate all possible scales using constants and classes.
 
-    Instantiates a generic scale generator and an empty scale list,
-    then iterates through :data:`ROOTS`, setting the generator's root
-    to be the current iteration value. Then, uses :meth:`generate` on
-    module scale constants :data:`DIATONIC_SCALES` and
-    :data:`PENTATONICS`, then :meth:`generate_variations` to add all
-    variations. After, extends the scale list with the scales generated
-    so far and returns it at the end.
+    Gathers the scales of every root of :data:`ROOTS` yielded by
+    :func:`iter_all_scales` in a list.
 
     :returns: All scales with variations included.
     :rtype: list[Scale]
     """
-    scale_generator_obj = ScaleGenerator("C")
-    all_scales = []
-    for root in ROOTS:
-        scale_generator_obj.root = root
-        scale_generator_obj.generate(DIATONIC_SCALES)
-        scale_generator_obj.generate(PENTATONICS)
-        scale_generator_obj.generate_variations()
-        all_scales.extend(scale_generator_obj.scales_generated)
-        scale_generator_obj.scales_generated.clear()
-    return all_scales
+    return list(iter_all_scales())
 
 
-def dump_scales(all_scales: list[Scale], dump_path="../data"):
-    """Dump scales generated to a .json file.
+def generate_scale_types(scale_dump: dict) -> dict:
+    """Get the scale types of every scale in a dump.
 
-    Declares a dictionary to put all scales in, then gets the notes
-    of all scales and format said scales for putting in the variable.
-    Afterwards, get the path of the dump using the :mod:`os` module and
-    finally dumps the variable to a .json file.
+    The scales of every root share the same names after the root (e.g.:
+    "Dorian b2") and intervals, so each type is kept once, with its
+    intervals, and the scales of any root can be made from it.
 
-    :param all_scales: List containing all scales generated.
-    :type all_scales: list[Scale]
+    :param scale_dump: Variable containing all formatted scales.
+    :type scale_dump: dict
+    :returns: The intervals, separated by spaces, keyed by type name.
+    :rtype: dict
+    """
+    scale_types = {}
+    for name_intervals, scale_notes in scale_dump.items():
+        name, interval_str = name_intervals[:-1].split(" (")
+        root = scale_notes.split()[0]
+        scale_types.setdefault(name[len(root) + 1 :], interval_str)
+    return scale_types
+
+
+def generate_alternative_types(scale_types: dict) -> dict:
+    """Get the scale types on the rotations of the notes of every scale.
+
+    The types are grouped by the semitones of the notes they're on the
+    rotations of with :func:`datahelper.get_rotation_types`, then split
+    into scales and variants with
+    :meth:`scales.ScaleNames.filter_variants`, so the alternative names
+    of a scale on any root can be found with a single lookup of the
+    semitones of its notes.
+
+    :param scale_types: The scale types, from :func:`generate_scale_types`.
+    :type scale_types: dict
+    :returns: The rotation types, formatted by
+        :func:`datahelper.format_rotation_types` as a group of scales
+        and a group of variants, keyed by semitones.
+    :rtype: dict
+    """
+    type_semitones = [
+        (type_name, tuple(map(get_interval_index, interval_str.split())))
+        for type_name, interval_str in scale_types.items()
+    ]
+    rotation_types = datahelper.get_rotation_types(type_semitones)
+    alternative_types = {}
+    for key, types in rotation_types.items():
+        scale_types = []
+        variant_types = []
+        for index, type_name in sorted(types):
+            name = f"{ROOTS[0]} {type_name}"
+            if scales.ScaleNames.filter_variants([name]):
+                scale_types.append((index, type_name))
+            else:
+                variant_types.append((index, type_name))
+        alternative_types[key] = datahelper.format_rotation_types(
+            scale_types, variant_types
+        )
+    return alternative_types
+
+
+def dump_scales(
+    all_scales,
+    dump_path="../data",
+    indent=4,
+    lines=False,
+    compress=False,
+):
+    """Dump scales generated to a .json file.
+
+    Gets the path of the dump using the :mod:`os` module, then gets the
+    notes of the scales and writes them one by one, as they come, with
+    :func:`get_scale_item` and :func:`datahelper.dump_json_items`, in
+    the format given by its parameters. They're generator output only,
+    as the scales module reads the scale types from
+    :func:`generate_scale_types`, which are dumped next to them in the
+    precompiled binary format of :func:`datahelper.dump_binary_file`.
+    The types on their rotations, from
+    :func:`generate_alternative_types`, are dumped along with them. The
+    types are the same on every root, so they're taken from the scales
+    of the first root of :data:`ROOTS`.
+
+    :param all_scales: The scales generated, e.g.: from
+        :func:`iter_all_scales`.
+    :type all_scales: Iterable[Scale]
     :param dump_path: Directory to dump scales in.
     :type dump_path: str
-    :var dict scale_dump: Variable to contain all formatted scales.
+    :param indent: Passed to :func:`datahelper.dump_json_items`.
+    :type indent: int | None
+    :param lines: Passed to :func:`datahelper.dump_json_items`.
+    :type lines: bool
+    :param compress: Passed to :func:`datahelper.dump_json_items`.
+    :type compress: bool
+    :var dict root_dump: The formatted scales of the first root.
     """
-    scale_dump = {}
-    for scale in all_scales:
-        scale.get_scale_notes()
-        name_intervals = f"{scale.name} ({scale.intervals})"
-        scale_dump[name_intervals] = scale.notes
-
     data_folder = os.path.abspath(dump_path)
-    file_path = os.path.join(data_folder, "all_scales.json")
-    with open(file_path, "w") as scales_file:
-        json.dump(scale_dump, scales_file, indent=4, sort_keys=True)
+    scales_path = os.path.join(data_folder, "all_scales.json")
+    scales_path = datahelper.get_json_path(scales_path, lines, compress)
+    datahelper.dump_json_items(
+        map(get_scale_item, all_scales), scales_path, indent, lines, compress
+    )
+    root_dump = dict(map(get_scale_item, generate_root_scales(ROOTS[0])))
+    scale_types = generate_scale_types(root_dump)
+    datahelper.dump_binary_file(
+        scale_types, os.path.join(data_folder, "scaletypes.bin")
+    )
+    datahelper.dump_binary_file(
+        generate_alternative_types(scale_types),
+        os.path.join(data_folder, "scalealternatives.bin"),
+    )
 
 
 if __name__ == "__main__":
-    all_scales = generate_all_scales()
-    dump_scales(all_scales)
-    print("Scales generated!")
+    help_message = (
+        "This is the scale generator script.\nIt generates all scales "
+        "and writes them to 'all_scales.json'.\nPass '--compact' to "
+        "write the scales without spaces, '--lines' to write them in "
+        "JSON Lines format (.jsonl) and '--gzip' to compress them "
+        "(.gz).\n"
+    )
+
+    format_options = sys.argv[1:]
+    if any(option not in FORMAT_OPTIONS for option in format_options):
+        print(help_message)
+    else:
+        dump_scales(
+            iter_all_scales(),
+            indent=None if "--compact" in format_options else 4,
+            lines="--lines" in format_options,
+            compress="--gzip" in format_options,
+        )
+        print("Scales generated!")
@@ -1,28 +1,307 @@
+"""Module with code related to the harmonization of scales.
+
+Imports
+=======
+:mod:`sys`: Import the arguments from the command-line.
+
+:mod:`notes`: Import the pitch classes of the note names.
+
+:mod:`scales`: Import the scale index.
+
+:mod:`chords`: Import the chord index.
+
+The process pool of :mod:`concurrent.futures` and the json dumping of
+:mod:`json` are only imported when the harmonies of many scales are
+computed or dumped, as importing the pool takes longer than the rest of
+the module.
+
+Global variables
+================
+.. data:: CHORD_NAME_REPLACEMENTS
+   :type: list[tuple[str, str]]
+
+   Replacements made to the chord qualities of the data, the first
+   found being used (e.g.: "dim(#13)" is named "m7(b5)").
+
+.. data:: HARMONY_CHUNK_SIZE
+   :type: int
+
+   How many scales each worker process harmonizes at once.
+
+.. data:: HARMONIZER
+   :type: Harmonizer
+
+   Chord qualities of the chord data, built the first time it or
+   :func:`get_harmonizer` is accessed.
+
+Functions
+=========
+:func:`get_harmonizer`: Return the harmonizer, building it if needed.
+
+:func:`get_scale_harmony`: Get the harmony of a scale as a string.
+
+:func:`harmonize_scales`: Get the harmony of many scales at once.
+
+:func:`get_scale_names`: Get the names of all scales.
+
+:func:`iter_scale_harmonies`: Harmonize scales in worker processes.
+
+:func:`dump_scale_harmonies`: Dump the harmonies of scales in .jsonl.
+
+Classes
+=======
+:class:`Harmonizer`: Name the chords of scale degrees by their intervals.
+"""
+import sys
 import musicinpython.notes as notes
 import musicinpython.scales as scales
 import musicinpython.chords as chords
 
+CHORD_NAME_REPLACEMENTS = [("dim(#13)", "m7(b5)"), ("(#13)", "7")]
+
+HARMONY_CHUNK_SIZE = 256
+
+
+class Harmonizer:
+    """Harmonize scales with pitch-class arithmetic and a quality table.
+
+    The chord on each degree of a scale stacks every other note of the
+    scale from the degree, so it's known by the semitones between its
+    root and its other notes. These are looked up in :attr:`qualities`,
+    which holds the chord quality the chord data has for them, whatever
+    the root.
+
+    Attributes
+    ----------
+    .. attribute:: qualities
+       :type: dict[tuple[int, ...], str]
+
+       Chord qualities (e.g.: "m7") keyed by the semitones from the
+       root of the chord to each of its other notes, in order.
+
+    Methods
+    -------
+    :meth:`get_chord_quality`: Make the replacements of a chord quality.
+
+    :meth:`harmonize`: Get the chord names of the degrees of a scale.
+    """
+
+    def __init__(self, chord_items):
+        """Build the quality table from the chord data.
+
+        Keeps, for each chord structure, the quality of the first name
+        found, with the replacements of :data:`CHORD_NAME_REPLACEMENTS`.
+
+        :param chord_items: Pairs of "name (intervals)" and notes.
+        :type chord_items: Iterable[tuple[str, str]]
+        """
+        self.qualities: dict[tuple[int, ...], str] = {}
+        for name_interval, notes_str in chord_items:
+            note_names = notes_str.split()
+            pitch_classes = [notes.PITCH_CLASSES[n] for n in note_names]
+            semitones = tuple(
+                (pitch_class - pitch_classes[0]) % 12
+                for pitch_class in pitch_classes[1:]
+            )
+            if semitones not in self.qualities:
+                name = name_interval.split()[0]
+                quality = name[len(note_names[0]) :]
+                self.qualities[semitones] = self.get_chord_quality(quality)
+
+    @staticmethod
+    def get_chord_quality(quality: str) -> str:
+        """Return a chord quality with its first replacement made."""
+        for old, new in CHORD_NAME_REPLACEMENTS:
+            if old in quality:
+                return quality.replace(old, new)
+        return quality
+
+    def harmonize(self, note_names: list[str]) -> list:
+        """Get the names of the chords on each degree of a scale.
+
+        Each chord is made of every other note of the scale starting on
+        the degree, as a seventh chord for diatonic scales and a triad
+        for pentatonics. A note found twice in the scale has the chord
+        of its first degree on both.
+
+        :param note_names: The names of the notes of the scale.
+        :type note_names: list[str]
+        :returns: The chord names, or None for the chords that aren't in
+            the chord data.
+        :rtype: list[str | None]
+        """
+        pitch_classes = [notes.PITCH_CLASSES[n] for n in note_names]
+        count = len(pitch_classes)
+        chord_names = []
+        for note_name in note_names:
+            degree = note_names.index(note_name)
+            root = pitch_classes[degree]
+            semitones = tuple(
+                (pitch_classes[(degree + step) % count] - root) % 12
+                for step in range(2, count, 2)
+            )
+            quality = self.qualities.get(semitones)
+            if quality is None:
+                chord_names.append(None)
+            else:
+                chord_names.append(note_name + quality)
+        return chord_names
+
+
+def __getattr__(name: str):
+    """Build the harmonizer on first access to :data:`HARMONIZER`."""
+    if name == "HARMONIZER":
+        return get_harmonizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_harmonizer() -> Harmonizer:
+    """Return :data:`HARMONIZER`, building it if needed.
+
+    Chord qualities don't depend on the root, so the harmonizer is built
+    from the chords of a single root of the chord data.
+    """
+    if "HARMONIZER" not in globals():
+        chord_items = chords.get_chord_index().table.root_items("C")
+        globals()["HARMONIZER"] = Harmonizer(chord_items)
+    return globals()["HARMONIZER"]
+
 
 def get_scale_harmony(scale_name: str) -> str:
+    """Get the names of the chords on each degree of a scale.
+
+    Raises :exc:`IndexError` if the chord of a degree isn't in the
+    chord data.
+
+    :param scale_name: The name of the scale (e.g.: "C Major").
+    :type scale_name: str
+    :returns: The chord names, each followed by a space.
+    :rtype: str
+    """
+    note_names = scales.get_scale_index().get_notes(scale_name).split()
     harmony = ""
-    scale_notes = scales.get_scale_notes(scale_name).items
-    note_names = [n.name for n in scale_notes]
-    for n in note_names:
-        index = note_names.index(n)
-        rooted_scale = note_names[index:] + note_names[:index]
-        chromatic_gen = notes.ChromaticScaleGenerator(notes.Note(n))
-        chromatic_gen.generate()
-        chromatic_scale = [n.name for n in chromatic_gen.notes]
-        for note in rooted_scale:
-            if note not in chromatic_scale:
-                index = rooted_scale.index(note)
-                enharmonized_note = notes.enharmonize_note(notes.Note(note))
-                rooted_scale[index] = enharmonized_note.name
-        chord_notes = " ".join(rooted_scale[::2])
-        chord_name = chords.get_chord_names(chord_notes).items[0]
-        if "dim(#13)" in chord_name:
-            chord_name = chord_name.replace("dim(#13)", "m7(b5)")
-        elif "(#13)" in chord_name:
-            chord_name = chord_name.replace("(#13)", "7")
+    for chord_name in get_harmonizer().harmonize(note_names):
+        if chord_name is None:
+            raise IndexError(f"A chord of {scale_name} has no name.")
         harmony += chord_name + " "
     return harmony
+
+
+def harmonize_scales(scale_names=None) -> dict:
+    """Get the chords on each degree of many scales in one call.
+
+    :param scale_names: The names of the scales, all scales if None.
+    :type scale_names: Iterable[str] | None
+    :returns: The chord names of each scale, keyed by scale name, with
+        None for the chords that aren't in the chord data.
+    :rtype: dict[str, list[str | None]]
+    """
+    scale_index = scales.get_scale_index()
+    if scale_names is None:
+        scale_items = (
+            (name_intervals.split("(")[0][:-1], notes_str)
+            for name_intervals, notes_str in scale_index.table.items()
+        )
+    else:
+        scale_items = ((n, scale_index.get_notes(n)) for n in scale_names)
+
+    harmonizer = get_harmonizer()
+    return {
+        name: harmonizer.harmonize(notes_str.split())
+        for name, notes_str in scale_items
+    }
+
+
+def get_scale_names() -> list[str]:
+    """Return the names of all scales, in the order of the data."""
+    scale_table = scales.get_scale_index().table
+    return [key.split("(")[0][:-1] for key, _ in scale_table.items()]
+
+
+def _harmonize_chunk(scale_names: list[str]) -> list:
+    """Harmonize scales in a worker, returning pairs of name and chords."""
+    return list(harmonize_scales(scale_names).items())
+
+
+def iter_scale_harmonies(
+    scale_names=None, max_workers=None, chunk_size=HARMONY_CHUNK_SIZE
+):
+    """Yield the chords of each degree of many scales, in order.
+
+    The scales are split in chunks harmonized by a pool of worker
+    processes, each building its own :data:`HARMONIZER` once. Results
+    are yielded as soon as their chunk and the ones before it are done,
+    so they can be written while the others are still being computed.
+
+    :param scale_names: The names of the scales, all scales if None.
+    :type scale_names: Iterable[str] | None
+    :param max_workers: How many processes to use, one per CPU if None.
+        With 1, the scales are harmonized in the current process.
+    :type max_workers: int | None
+    :param chunk_size: How many scales to send to a worker at once.
+    :type chunk_size: int
+    :returns: Pairs of scale name and chord names, with None for the
+        chords that aren't in the chord data.
+    :rtype: Iterator[tuple[str, list[str | None]]]
+    """
+    if scale_names is None:
+        scale_names = get_scale_names()
+    scale_names = list(scale_names)
+    chunks = [
+        scale_names[start : start + chunk_size]
+        for start in range(0, len(scale_names), chunk_size)
+    ]
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _harmonize_chunk(chunk)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_harmonies in executor.map(_harmonize_chunk, chunks):
+            yield from chunk_harmonies
+
+
+def dump_scale_harmonies(
+    file_path: str,
+    scale_names=None,
+    max_workers=None,
+    chunk_size=HARMONY_CHUNK_SIZE,
+) -> int:
+    """Dump the harmonies of many scales in JSON Lines format.
+
+    Writes one line per scale, as an object with its name under
+    "scale" and the chord names from :func:`iter_scale_harmonies` under
+    "chords", as they come.
+
+    :param file_path: The path of the .jsonl file.
+    :type file_path: str
+    :param scale_names: The names of the scales, all scales if None.
+    :type scale_names: Iterable[str] | None
+    :param max_workers: Passed to :func:`iter_scale_harmonies`.
+    :type max_workers: int | None
+    :param chunk_size: Passed to :func:`iter_scale_harmonies`.
+    :type chunk_size: int
+    :returns: How many scales were dumped.
+    :rtype: int
+    """
+    import json
+
+    count = 0
+    with open(file_path, "w") as harmonies_file:
+        for scale_name, chord_names in iter_scale_harmonies(
+            scale_names, max_workers, chunk_size
+        ):
+            line = json.dumps({"scale": scale_name, "chords": chord_names})
+            harmonies_file.write(line + "\n")
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        harmonies_path = sys.argv[1]
+    else:
+        harmonies_path = "scale_harmonies.jsonl"
+    scale_count = dump_scale_harmonies(harmonies_path)
+    print(f"Success! {scale_count} harmonies dumped to {harmonies_path}.")
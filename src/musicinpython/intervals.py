@@ -5,6 +5,10 @@ Imports
 
 :mod:`notes`: Import the classes and exception of the module.
 
+The bulk functions, which work on arrays of pitch classes, need
+:mod:`numpy`, installed with the ``numpy`` extra of the package. It's
+only imported when one of them is called.
+
 Global variables
 ================
 .. data:: ALL_INTERVAL_NAMES
@@ -17,12 +21,36 @@ Global variables
 
    All names of intervals in order.
 
+.. data:: INTERVAL_SEMITONES
+   :type: dict[str, int]
+
+   The number of semitones of each interval name.
+
+.. data:: SEMITONE_INTERVAL_NAMES
+   :type: list[str]
+
+   The interval name chosen for each number of semitones (0 to 11).
+
 Exceptions
 ==========
 :exc:`InvalidIntervalAttributeError`: Raised when an interval's invalid.
 
 Functions
 =========
+:func:`interval_between`: Get the name of the interval between notes.
+
+:func:`transpose`: Get the note an interval away from another.
+
+:func:`get_pitch_classes`: Turn note names into an array.
+
+:func:`get_interval_classes`: Get the intervals of arrays in bulk.
+
+:func:`transpose_pitch_classes`: Transpose an array in bulk.
+
+:func:`get_interval_names`: Turn an array into interval names.
+
+:func:`get_note_names`: Turn an array into note names of a key.
+
 :func:`all_about_interval`: Return a message with data on an interval.
 
 :func:`interval_input`: Receive input and transforms into an interval.
@@ -74,6 +102,27 @@ ALL_INTERVAL_NAMES_UNPACKED = [
     "VII",
 ]
 
+INTERVAL_SEMITONES = {
+    name: semitones
+    for (semitones, item) in enumerate(ALL_INTERVAL_NAMES)
+    for name in (item if type(item) == tuple else (item,))
+}
+
+SEMITONE_INTERVAL_NAMES = [
+    "I",
+    "bII",
+    "II",
+    "bIII",
+    "III",
+    "IV",
+    "bV",
+    "V",
+    "#V",
+    "VI",
+    "bVII",
+    "VII",
+]
+
 
 class InvalidIntervalAttributeError(Exception):
     """Raised when there's an invalid setting of an interval attribute.
@@ -200,22 +249,8 @@ class Interval:
             return False
 
     def get_second_note(self):
-        """Get the second note of the interval.
-
-        Generates a chromatic scale using
-        :class:`notes.ChromaticScaleGenerator`, then the index of the
-        interval's :attr:`name` in :data:`ALL_INTERVAL_NAMES` on the
-        generated scale to retrieve the second note.
-        """
-        chromatic_generator = notes.ChromaticScaleGenerator(self.note1)
-        chromatic_generator.generate()
-        for item in ALL_INTERVAL_NAMES:
-            if self.name == item:
-                index = ALL_INTERVAL_NAMES.index(self.name)
-            elif type(item) == tuple:
-                if self.name in item:
-                    index = ALL_INTERVAL_NAMES.index(item)
-        self.note2 = chromatic_generator.notes[index]
+        """Get the second note of the interval using :func:`transpose`."""
+        self.note2 = transpose(self.note1, self.name)
 
     def choose_name_for_interval(self):
         """Choose between two enharmonics to name the interval."""
@@ -232,28 +267,154 @@ class Interval:
     def get_name(self):
         """Get the name of the interval based on its two notes.
 
-        First, generates a chromatic scale using
-        :class:`notes.ChromaticScaleGenerator`, then extracts the note
-        names using a list comprehension. Afterwards, gets the index of
-        the interval's second note in the scale and use it on
-        :data:`ALL_INTERVAL_NAMES` to get the corresponding interval's
-        name, calling :meth:`choose_name_for_interval` if the interval's
-        name has an enharmonic.
+        Uses :func:`interval_between` to get the name. If the second
+        note isn't spelled as in the chromatic scale of :attr:`note1`
+        (from :data:`notes.CHROMATIC_INDEXES`), it's enharmonized.
         """
-        chromatic_generator = notes.ChromaticScaleGenerator(self.note1)
-        chromatic_generator.generate()
-        chromatic_scale_names = [
-            note.name for note in chromatic_generator.notes
-        ]
-        if self.note2.name in chromatic_scale_names:
-            index = chromatic_scale_names.index(self.note2.name)
-            self.name = ALL_INTERVAL_NAMES[index]
-        else:
+        if self.note2.name not in notes.CHROMATIC_INDEXES[self.note1.name]:
             self.note2 = notes.enharmonize_note(self.note2)
-            index = chromatic_scale_names.index(self.note2.name)
-            self.name = ALL_INTERVAL_NAMES[index]
-        if type(self.name) == tuple:
-            self.choose_name_for_interval()
+        self.name = interval_between(self.note1, self.note2)
+
+
+def interval_between(note1: notes.Note, note2: notes.Note) -> str:
+    """Get the name of the interval from one note to another.
+
+    Subtracts the pitch classes of the notes and uses the result on
+    :data:`SEMITONE_INTERVAL_NAMES`.
+
+    :param note1: The first note of the interval.
+    :type note1: notes.Note
+    :param note2: The second note of the interval.
+    :type note2: notes.Note
+    :returns: The name of the interval (e.g.: "bIII").
+    :rtype: str
+    """
+    semitones = (note2.pitch_class - note1.pitch_class) % 12
+    return SEMITONE_INTERVAL_NAMES[semitones]
+
+
+def transpose(note: notes.Note, interval_name: str) -> notes.Note:
+    """Get the note an interval above another.
+
+    Uses the interval's semitones from :data:`INTERVAL_SEMITONES` on
+    the note's scale from :data:`notes.CHROMATIC_SCALES`, so the note
+    returned is spelled in the key of the first one. Raises
+    :exc:`InvalidIntervalAttributeError` if the interval's invalid.
+
+    :param note: The first note of the interval.
+    :type note: notes.Note
+    :param interval_name: The name of the interval (e.g.: "bIII").
+    :type interval_name: str
+    :returns: The second note of the interval.
+    :rtype: notes.Note
+    """
+    if interval_name not in INTERVAL_SEMITONES:
+        raise InvalidIntervalAttributeError("name", interval_name)
+    semitones = INTERVAL_SEMITONES[interval_name]
+    return notes.CHROMATIC_SCALES[note.name][semitones]
+
+
+def _import_numpy():
+    """Import :mod:`numpy`, explaining how to install it if missing."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "The bulk interval functions need numpy, install it with "
+            "'pip install musicinpython[numpy]'."
+        ) from error
+    return numpy
+
+
+def get_pitch_classes(note_names):
+    """Turn a sequence of note names into an array of pitch classes.
+
+    Converts each distinct name once with :data:`notes.PITCH_CLASSES`
+    and spreads the results, so long sequences aren't looped through
+    in Python. Raises :exc:`notes.InvalidNoteNameError` on an invalid
+    name.
+
+    :param note_names: The note names (e.g.: ["C", "Eb", "G"]).
+    :type note_names: Sequence[str] | numpy.ndarray
+    :returns: The pitch classes of the notes.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+    note_names = np.asarray(note_names, dtype=str)
+    unique_names, inverse = np.unique(note_names, return_inverse=True)
+    unique_pitch_classes = []
+    for name in unique_names:
+        if name not in notes.PITCH_CLASSES:
+            raise notes.InvalidNoteNameError(name=name)
+        unique_pitch_classes.append(notes.PITCH_CLASSES[name])
+    pitch_classes = np.asarray(unique_pitch_classes, dtype=np.int8)
+    return pitch_classes[inverse].reshape(note_names.shape)
+
+
+def get_interval_classes(first, second=None):
+    """Get in bulk the semitones between arrays of pitch classes.
+
+    With two arrays (or an array and a single pitch class), gets the
+    semitones from each pitch class of the first to the one of the
+    second, like :func:`interval_between`. With a single array, gets
+    the semitones between each pitch class and the next along its last
+    axis, as in the intervals of a melody.
+
+    :param first: Pitch classes of the first notes.
+    :type first: numpy.typing.ArrayLike
+    :param second: Pitch classes of the second notes.
+    :type second: numpy.typing.ArrayLike
+    :returns: The intervals, in semitones from 0 to 11.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+    first = np.asarray(first, dtype=np.int64)
+    if second is None:
+        semitones = np.diff(first)
+    else:
+        semitones = np.asarray(second, dtype=np.int64) - first
+    return np.mod(semitones, 12).astype(np.int8)
+
+
+def transpose_pitch_classes(pitch_classes, interval):
+    """Transpose an array of pitch classes in bulk.
+
+    :param pitch_classes: The pitch classes to be transposed.
+    :type pitch_classes: numpy.typing.ArrayLike
+    :param interval: An interval name, or semitones (may be an array).
+    :type interval: str | numpy.typing.ArrayLike
+    :returns: The transposed pitch classes.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+    if isinstance(interval, str):
+        if interval not in INTERVAL_SEMITONES:
+            raise InvalidIntervalAttributeError("name", interval)
+        interval = INTERVAL_SEMITONES[interval]
+    semitones = np.asarray(pitch_classes, dtype=np.int64) + interval
+    return np.mod(semitones, 12).astype(np.int8)
+
+
+def get_interval_names(interval_classes):
+    """Turn an array of semitones into :data:`SEMITONE_INTERVAL_NAMES`."""
+    np = _import_numpy()
+    interval_names = np.asarray(SEMITONE_INTERVAL_NAMES)
+    return interval_names[np.mod(interval_classes, 12)]
+
+
+def get_note_names(pitch_classes, key_name="C"):
+    """Turn an array of pitch classes into note names.
+
+    :param pitch_classes: The pitch classes of the notes.
+    :type pitch_classes: numpy.typing.ArrayLike
+    :param key_name: Note whose key is used to spell the names.
+    :type key_name: str
+    :returns: The note names, spelled as in :meth:`notes.Note.transpose`.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+    note_names = np.asarray(notes.Note(key_name).get_key_names())
+    return note_names[np.mod(pitch_classes, 12)]
 
 
 def all_about_interval(interval: Interval) -> str:
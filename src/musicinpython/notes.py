@@ -1,5 +1,9 @@
 """Module containing the Note class and related variables and functions.
 
+Imports
+=======
+:mod:`re`: Import the escaping of tokens in regular expressions.
+
 Global variables
 ================
 .. data:: NATURAL_NOTES
@@ -27,12 +31,56 @@ Global variables
 
    Contains scale keys that have sharps.
 
+.. data:: NATURAL_PITCH_CLASSES
+   :type: dict[str, int]
+
+   Contains the pitch class (0 to 11, C being 0) of each natural note.
+
+.. data:: ACCIDENT_OFFSETS
+   :type: dict[str, int]
+
+   Contains the semitones each accident sign adds to a natural note.
+
+.. data:: PITCH_CLASSES
+   :type: dict[str, int]
+
+   Contains the pitch class of each note name.
+
+.. data:: SHARP_NOTE_NAMES
+   :type: list[str]
+
+   Contains the note names without flats, indexed by pitch class.
+
+.. data:: FLAT_NOTE_NAMES
+   :type: list[str]
+
+   Contains the note names without sharps, indexed by pitch class.
+
+.. data:: CHROMATIC_SCALES
+   :type: dict[str, tuple[Note]]
+
+   Contains the chromatic scale of each note name, rooted on it.
+
+.. data:: CHROMATIC_INDEXES
+   :type: dict[str, dict[str, int]]
+
+   Contains, for each root, the index of each note of its chromatic
+   scale (e.g.: ``CHROMATIC_INDEXES["D"]["F#"] == 4``).
+
 Exceptions
 ==========
 :exc:`InvalidNoteNameError`: Exception raised by an invalid note name.
 
 Functions
 =========
+:func:`make_chromatic_scale`: Make the chromatic scale of a root.
+
+:func:`get_pitch_class_set`: Get the pitch-class set of some notes.
+
+:func:`get_note_rotations`: Get the note orders of a chord or scale.
+
+:func:`get_alternation`: Get a regular expression matching any token.
+
 :func:`enharmonize_note`: Get a note's enharmonic.
 
 :func:`note_input`: Receive input and turns into a Note object.
@@ -49,6 +97,8 @@ Classes
 
 :class:`ChromaticScaleGenerator`: Defines a base scale generator.
 """
+import re
+
 NATURAL_NOTES = ["C", "D", "E", "F", "G", "A", "B"]
 ACCIDENTAL_NOTES = [
     ("C#", "Db"),
@@ -81,6 +131,24 @@ ALL_NOTE_NAMES = [
 SHARP_KEYS = ["G", "D", "A", "E", "B", "F#", "C#", "G#", "D#", "A#"]
 FLAT_KEYS = ["C", "F", "Bb", "Eb", "Ab", "Db", "Gb"]
 
+NATURAL_PITCH_CLASSES = {
+    "C": 0,
+    "D": 2,
+    "E": 4,
+    "F": 5,
+    "G": 7,
+    "A": 9,
+    "B": 11,
+}
+ACCIDENT_OFFSETS = {"": 0, "#": 1, "b": -1}
+
+PITCH_CLASSES = {
+    name: (NATURAL_PITCH_CLASSES[name[0]] + ACCIDENT_OFFSETS[name[1:]]) % 12
+    for name in ALL_NOTE_NAMES
+}
+SHARP_NOTE_NAMES = [name for name in ALL_NOTE_NAMES if "b" not in name]
+FLAT_NOTE_NAMES = [name for name in ALL_NOTE_NAMES if "#" not in name]
+
 
 class InvalidNoteNameError(Exception):
     """Exception raised when a note is instantiated with invalid name.
@@ -100,9 +168,18 @@ class InvalidNoteNameError(Exception):
         super().__init__(self.message)
 
 
+_NOTE_INSTANCES: dict = {}
+
+
 class Note:
     """Class that define notes and their methods.
 
+    A note is a pitch class (0 to 11, C being 0) plus its spelling, so
+    enharmonic notes share their pitch class but not their name. Notes
+    are immutable and there's a single instance of each name, so
+    instantiating a note already created doesn't allocate nor validate
+    anything.
+
     Attributes
     ----------
     .. attribute:: name
@@ -115,6 +192,11 @@ class Note:
 
        The symbol of the accident the note has (e.g.: "#").
 
+    .. attribute:: pitch_class
+       :type: int
+
+       The pitch class of the note (e.g.: 3 for "D#").
+
     Methods
     -------
     :meth:`is_accidental`: Check if the note has an accident.
@@ -122,70 +204,211 @@ class Note:
     :meth:`is_flat`: Check if the note is flat.
 
     :meth:`is_sharp`: Check if the note is sharp.
+
+    :meth:`is_enharmonic`: Check if two notes have the same pitch class.
+
+    :meth:`get_key_names`: Get the note names used in the note's key.
+
+    :meth:`transpose`: Get the note a number of semitones away.
     """
 
-    def __init__(self, name: str):
-        """Instantiate a note.
+    __slots__ = ("name", "accident_sign", "pitch_class")
+
+    def __new__(cls, name: str):
+        """Return the note with the given name.
 
-        Raises an exception if the note's name not in
-        :data:`ALL_NOTE_NAMES`, and initializes an empty
-        :attr:`accident_sign`.
+        Returns the shared instance if the note was already created.
+        Otherwise raises an exception if the note's name not in
+        :data:`ALL_NOTE_NAMES`, then takes the :attr:`accident_sign`
+        from the name and the :attr:`pitch_class` from
+        :data:`PITCH_CLASSES` and keeps the new instance.
 
         :param name: Passed to :attr:`name`.
         :type name: str
         """
-        if name not in ALL_NOTE_NAMES:
+        note_obj = _NOTE_INSTANCES.get(name)
+        if note_obj is not None:
+            return note_obj
+        if name not in PITCH_CLASSES:
             raise InvalidNoteNameError(name=name)
-        self.name = name
-        self.accident_sign = ""
+        note_obj = super().__new__(cls)
+        object.__setattr__(note_obj, "name", name)
+        object.__setattr__(note_obj, "accident_sign", name[1:])
+        object.__setattr__(note_obj, "pitch_class", PITCH_CLASSES[name])
+        _NOTE_INSTANCES[name] = note_obj
+        return note_obj
 
-    def is_accidental(self) -> bool:
-        """Check if the note has an accident in its name.
+    def __setattr__(self, attr: str, value):
+        raise AttributeError("Note objects are immutable.")
+
+    def __delattr__(self, attr: str):
+        raise AttributeError("Note objects are immutable.")
+
+    def __reduce__(self):
+        return (Note, (self.name,))
+
+    def __repr__(self) -> str:
+        return f"Note({self.name!r})"
+
+    def __eq__(self, other) -> bool:
+        """Compare notes by name, so enharmonics aren't equal."""
+        if not isinstance(other, Note):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
 
-        If the note has an accident, sets :attr:`accident_sign` to it.
+    def __add__(self, semitones: int) -> "Note":
+        """Transpose the note up, same as :meth:`transpose`."""
+        if not isinstance(semitones, int):
+            return NotImplemented
+        return self.transpose(semitones)
+
+    def __sub__(self, other):
+        """Transpose the note down, or get the semitones to a note.
+
+        :param other: Semitones to go down or a note below this one.
+        :type other: int | Note
+        :returns: The transposed note or the semitones (0 to 11).
+        :rtype: Note | int
         """
-        for accident in ACCIDENTAL_NOTES:
-            if self.name in accident:
-                self.accident_sign = self.name[1]
-                return True
-        return False
+        if isinstance(other, Note):
+            return (self.pitch_class - other.pitch_class) % 12
+        if isinstance(other, int):
+            return self.transpose(-other)
+        return NotImplemented
+
+    def is_accidental(self) -> bool:
+        """Check if the note has an accident in its name."""
+        return self.accident_sign != ""
 
     def is_flat(self) -> bool:
         """Check if the note is flat using its accident sign."""
-        if self.is_accidental():
-            if self.accident_sign == "b":
-                return True
-            else:
-                return False
-        else:
-            return False
+        return self.accident_sign == "b"
 
     def is_sharp(self) -> bool:
         """Check if the note is sharp using its accident sign."""
-        if self.is_accidental():
-            if self.accident_sign == "#":
-                return True
-            else:
-                return False
-        else:
-            return False
+        return self.accident_sign == "#"
+
+    def is_enharmonic(self, other: "Note") -> bool:
+        """Check if the note has the same pitch class as another."""
+        return self.pitch_class == other.pitch_class
+
+    def get_key_names(self) -> list[str]:
+        """Return the note names, by pitch class, of the note's key.
+
+        Keys in :data:`SHARP_KEYS` use :data:`SHARP_NOTE_NAMES` and the
+        ones in :data:`FLAT_KEYS` use :data:`FLAT_NOTE_NAMES`.
+        """
+        if self.name in SHARP_KEYS:
+            return SHARP_NOTE_NAMES
+        return FLAT_NOTE_NAMES
+
+    def transpose(self, semitones: int) -> "Note":
+        """Get the note some semitones away, spelled in this note's key.
+
+        :param semitones: Semitones to go up (or down, if negative).
+        :type semitones: int
+        :returns: The transposed note.
+        :rtype: Note
+        """
+        pitch_class = (self.pitch_class + semitones) % 12
+        return Note(self.get_key_names()[pitch_class])
+
+
+def make_chromatic_scale(root_name: str) -> tuple[Note]:
+    """Make the chromatic scale of a root, spelled in the root's key.
+
+    :param root_name: Name of the root of the scale.
+    :type root_name: str
+    :returns: The 12 notes of the scale, starting by the root.
+    :rtype: tuple[Note]
+    """
+    root = Note(root_name)
+    return tuple(root.transpose(semitones) for semitones in range(12))
+
+
+CHROMATIC_SCALES = {
+    name: make_chromatic_scale(name) for name in ALL_NOTE_NAMES
+}
+CHROMATIC_INDEXES = {
+    root_name: {note.name: index for (index, note) in enumerate(scale)}
+    for (root_name, scale) in CHROMATIC_SCALES.items()
+}
+
+
+def get_pitch_class_set(note_names: list[str]) -> int:
+    """Get the pitch classes of some notes as a 12-bit mask.
+
+    Bit ``n`` of the mask is set when a note has pitch class ``n``, so
+    the order and spelling of the notes don't change the result (e.g.:
+    "C Eb G" and "G D# C" both give ``0b10001001``). Raises
+    :exc:`InvalidNoteNameError` on an invalid note name.
+
+    :param note_names: The names of the notes.
+    :type note_names: list[str]
+    :returns: The pitch-class set of the notes.
+    :rtype: int
+    """
+    pitch_class_set = 0
+    for name in note_names:
+        if name not in PITCH_CLASSES:
+            raise InvalidNoteNameError(name=name)
+        pitch_class_set |= 1 << PITCH_CLASSES[name]
+    return pitch_class_set
+
+
+def get_note_rotations(notes_str: str) -> list[str]:
+    """Get the rotations of a string of notes, one per note.
+
+    Each note in turn is brought to the front of the notes rotated so
+    far, at the place it's first found (e.g.: "C E G" gives "C E G",
+    "E G C" and "G C E"). These are the note orders under which a chord
+    or scale has alternative names.
+
+    :param notes_str: The notes in a string.
+    :type notes_str: str
+    :returns: The rotated strings of notes, the first unchanged.
+    :rtype: list[str]
+    """
+    notes_list = notes_str.split()
+    rotations = []
+    for note in notes_list:
+        index = notes_list.index(note)
+        notes_list = notes_list[index:] + notes_list[:index]
+        rotations.append(" ".join(notes_list))
+    return rotations
+
+
+def get_alternation(tokens) -> str:
+    """Return a regular expression matching any token, longest first.
+
+    Used to match note names and the other parts of chord and scale
+    names, so a name isn't cut short (e.g.: "C#" instead of "C").
+
+    :param tokens: The strings to match.
+    :type tokens: Iterable[str]
+    :returns: The tokens, escaped and separated by "|".
+    :rtype: str
+    """
+    tokens = sorted(tokens, key=len, reverse=True)
+    return "|".join(re.escape(token) for token in tokens)
 
 
 def enharmonize_note(note_obj: Note) -> Note:
     """Get the enharmonic of a note.
 
-    If the argument note is accidental, returns a note object
-    corresponding to the note name's pair in :data:`ACCIDENTAL_NOTES`.
+    If the argument note is accidental, returns a note object with the
+    same pitch class and the opposite accident.
 
     :returns: The note's enharmonic (same sound, opposite accident).
     :rtype: Note
     """
-    if note_obj.is_accidental():
-        for item in ACCIDENTAL_NOTES:
-            if note_obj.name in item[0]:
-                return Note(item[1])
-            elif note_obj.name in item[1]:
-                return Note(item[0])
+    if note_obj.is_sharp():
+        return Note(FLAT_NOTE_NAMES[note_obj.pitch_class])
+    elif note_obj.is_flat():
+        return Note(SHARP_NOTE_NAMES[note_obj.pitch_class])
     else:
         return note_obj
 
@@ -193,6 +416,9 @@ def enharmonize_note(note_obj: Note) -> Note:
 class ChromaticScaleGenerator:
     """Defines a generator for chromatic scales.
 
+    The scales are taken from the precomputed :data:`CHROMATIC_SCALES`,
+    so generating them doesn't build anything.
+
     Attributes
     ----------
     .. attribute:: root
@@ -223,29 +449,11 @@ class ChromaticScaleGenerator:
 
     def generate_base_scale(self):
         """Generate a scale with proper accidents and root in C."""
-        if self.root.name in SHARP_KEYS:
-            for note_name in ALL_NOTE_NAMES:
-                if "b" not in note_name:
-                    self.notes.append(Note(note_name))
-
-        elif self.root.name in FLAT_KEYS:
-            for note_name in ALL_NOTE_NAMES:
-                if "#" not in note_name:
-                    self.notes.append(Note(note_name))
+        self.notes = [Note(name) for name in self.root.get_key_names()]
 
     def generate(self):
-        """Generate the root's chromatic scale.
-
-        Calls :meth:`generate_base_scale` and then iterates through the
-        notes to find the root's index, manipulating the list to start
-        it by the root.
-        """
-        self.generate_base_scale()
-        for note in self.notes:
-            if note.name == self.root.name:
-                index = self.notes.index(note)
-        chromatic_scale = self.notes[index:] + self.notes[:index]
-        self.notes = chromatic_scale
+        """Generate the root's chromatic scale from the table."""
+        self.notes = list(CHROMATIC_SCALES[self.root.name])
 
 
 def note_input(message="Insert the note you want to know about: ") -> Note:
@@ -273,18 +481,18 @@ def note_input(message="Insert the note you want to know about: ") -> Note:
 def display_chromatic_scale(note_obj: Note) -> str:
     """Display a message containing the chromatic scale of a given note.
 
-    First, generates a chromatic scale using :meth:`generate`. Then
-    extracts the note names using a list comprehension and join them
-    to a message, returning it after.
+    First, takes the chromatic scale from :data:`CHROMATIC_SCALES`.
+    Then extracts the note names using a list comprehension and join
+    them to a message, returning it after.
 
     :param note_obj: Chosen note to make the scale upon.
     :type note_obj: Note
     :returns: A message containing the note's scale.
     :rtype: str
     """
-    chroma_gen = ChromaticScaleGenerator(note_obj)
-    chroma_gen.generate()
-    chromatic_scale_names = [note.name for note in chroma_gen.notes]
+    chromatic_scale_names = [
+        note.name for note in CHROMATIC_SCALES[note_obj.name]
+    ]
     chromatic_scale = " ".join(chromatic_scale_names)
     chromatic_scale_message = (
         "This note's chromatic scale is:\n" + chromatic_scale
@@ -2,14 +2,28 @@
 
 Imports
 =======
+:mod:`re`: Import the regular expression of the scale name grammar.
+
 :mod:`datahelper`: Import json data getter.
 
 :mod:`intervals`: Import :class:`Intervals` class and related functions.
 
 :mod:`notes`: Import :class:`Note` class and related functions.
 
+:mod:`chords`: Import the chord notes getter.
+
+:mod:`cache`: Import the :class:`LRUCache` class.
+
 Global variables
 ================
+The scale data is only loaded from disk the first time one of these
+variables, or :func:`get_scale_index`, is accessed.
+
+.. data:: all_scales
+   :type: dict
+
+   Contains all scale names and intervals as keys and notes as values.
+
 .. data:: SCALE_NAMES_INTERVALS
    :type: list[str]
 
@@ -20,15 +34,69 @@ Global variables
 
    Contains strings of chord notes (e.g.: "C E G").
 
+.. data:: SCALE_INDEX
+   :type: ScaleIndex
+
+   Index over the precompiled scale data for quick lookups.
+
+.. data:: SCALE_IDENTIFIER
+   :type: ScaleIdentifier
+
+   Index of the scale data by root and pitch-class set.
+
+.. data:: SCALE_CACHE
+   :type: cache.LRUCache
+
+   Cache of the scales returned by :func:`get_scale`, whose size can be
+   changed with :meth:`cache.LRUCache.resize`.
+
+.. data:: SCALE_FORMULAS
+   :type: dict[str, str]
+
+   The intervals of the diatonic and pentatonic scales every other
+   scale is a variation of, keyed by name (e.g.: "Dorian").
+
+.. data:: SCALE_VARIATIONS
+   :type: dict[str, tuple[str, str]]
+
+   The interval each variation suffix of scale names (e.g.: "b2")
+   replaces, and the interval replacing it.
+
+.. data:: SCALE_NAME_PATTERN
+   :type: re.Pattern
+
+   The grammar of the scale names made by the scale generator: a root,
+   a scale of :data:`SCALE_FORMULAS` and variation suffixes.
+
+Exceptions
+==========
+:exc:`InvalidScaleNameError`: Raised when a scale name can't be parsed.
+
 Functions
 =========
+:func:`get_scale_index`: Return the scale index, loading it if needed.
+
+:func:`get_scale_identifier`: Return the scale identifier.
+
+:func:`identify_scale`: Identify scale notes in any order or spelling.
+
+:func:`find_scales_containing`: Find the scales containing some notes.
+
+:func:`find_scales_for_chord`: Find the scales containing a chord.
+
 :func:`get_scale_names`: Return a :class:`ScaleNames` object.
 
+:func:`parse_scale_name`: Get the root and intervals of a scale name.
+
+:func:`spell_scale`: Get the notes of a scale from its root and intervals.
+
 :func:`get_scale_notes`: Return a :class:`ScaleNotes` object.
 
 :func:`get_scale_intervals`: Return a :class:`ScaleIntervals` object.
 
-:func:`get_scale`: Return a full :class:`Scale` object.
+:func:`build_scale`: Build a full :class:`Scale` object.
+
+:func:`get_scale`: Return a full :class:`Scale` object, cached.
 
 :func:`scale_input`: Handle the input of a scale.
 
@@ -38,6 +106,10 @@ Functions
 
 Classes
 =======
+:class:`ScaleIndex`: Index the scale data by notes and by name.
+
+:class:`ScaleIdentifier`: Index the scale data by pitch-class set.
+
 :class:`ScaleNames`: Class pertaining to scale names.
 
 :class:`ScaleIntervals`: Class pertaining to scale intervals.
@@ -46,15 +118,389 @@ Classes
 
 :class:`Scale`: Class containing all scale components.
 """
+import re
 import musicinpython.datahelper as datahelper
 import musicinpython.intervals as intervals
 import musicinpython.notes as notes
+import musicinpython.chords as chords
+import musicinpython.cache as cache
+
+_LAZY_GLOBALS = [
+    "all_scales",
+    "items",
+    "SCALE_NAMES_INTERVALS",
+    "SCALE_NOTES",
+]
+
+SCALE_CACHE = cache.LRUCache(512)
+
+SCALE_FORMULAS = {
+    "Major": "I II III IV V VI VII",
+    "Minor": "I II bIII IV V bVI bVII",
+    "Harmonic minor": "I II bIII IV V bVI VII",
+    "Melodic minor": "I II III IV V bVI VII",
+    "Ionian": "I II III IV V VI VII",
+    "Dorian": "I II bIII IV V VI bVII",
+    "Phrygian": "I bII bIII IV V bVI bVII",
+    "Lydian": "I II III #IV V VI VII",
+    "Mixolydian": "I II III IV V VI bVII",
+    "Aeolian": "I II bIII IV V bVI bVII",
+    "Locrian": "I bII bIII IV bV bVI bVII",
+    "Major pentatonic": "I II III V VI",
+    "Minor pentatonic": "I bIII IV V bVII",
+}
+
+SCALE_VARIATIONS = {
+    "b2": ("II", "bII"),
+    "#2": ("II", "#II"),
+    "b4": ("IV", "bIV"),
+    "#4": ("IV", "#IV"),
+    "b6": ("VI", "bVI"),
+    "#6": ("VI", "#VI"),
+    "b7": ("VII", "bVII"),
+    "maj7": ("II", "VII"),
+}
+
+
+SCALE_NAME_PATTERN = re.compile(
+    f"(?P<root>{notes.get_alternation(notes.ALL_NOTE_NAMES)})"
+    f" (?P<scale>{notes.get_alternation(SCALE_FORMULAS)})"
+    f"(?P<variations>(?: (?:{notes.get_alternation(SCALE_VARIATIONS)}))*)"
+)
+
+
+class InvalidScaleNameError(Exception):
+    """Exception raised when a scale name doesn't follow the grammar.
+
+    Supports custom message and displaying the invalid name.
+    """
+
+    def __init__(self, message="Invalid scale name: ", name=""):
+        """Raise the exception with default parameters.
+
+        :param message: Custom messsage.
+        :type message: str
+        :param name: Invalid name.
+        :type name: str
+        """
+        self.message = f"{message}{name}"
+        super().__init__(self.message)
+
+
+class ScaleIndex:
+    """Index of the scale data, memoizing lookups in dictionaries.
+
+    The dictionaries aren't built up front, which would mean decoding
+    every scale of every root when the data is loaded. They start empty
+    and each lookup is answered once by :attr:`table` and then kept. A
+    first lookup by name costs a binary search on the scale types and
+    the spelling of the notes on the root, a first lookup by notes a
+    dictionary lookup of their semitones and the spelling of the types
+    found (the very first one also decodes every type, to key them by
+    semitones). Every later lookup of the same name or notes is a
+    dictionary lookup.
+
+    Attributes
+    ----------
+    .. attribute:: table
+       :type: datahelper.DataTable | datahelper.TypeTable
 
-all_scales = datahelper.get_json_file("all_scales.json")
-items = list(all_scales.items())
+       The scale data, keyed by "name (intervals)" with notes as values.
 
-SCALE_NAMES_INTERVALS = [i[0] for i in items]
-SCALE_NOTES = [i[1] for i in items]
+    .. attribute:: names_by_notes
+       :type: dict[str, list[str]]
+
+       Scale names keyed by a string of notes (e.g.: "C D E F G A B").
+
+    .. attribute:: notes_by_name
+       :type: dict[str, str]
+
+       String of scale notes keyed by scale name (e.g.: "C Major").
+
+    .. attribute:: intervals_by_notes
+       :type: dict[str, str]
+
+       String of scale intervals keyed by a string of notes.
+
+    .. attribute:: alternatives_table
+       :type: datahelper.DataTable | None
+
+       The scale and variant types on the rotations of every pattern of
+       notes, keyed by semitones, as precomputed by the scale generator.
+
+    .. attribute:: alternatives_by_notes
+       :type: dict[str, tuple[list[str], list[str]]]
+
+       Alternative scale and variant names keyed by a string of notes.
+
+    Methods
+    -------
+    :meth:`find_notes`: Search the table for a string of notes.
+
+    :meth:`find_alternatives`: Get the names of the rotations of notes.
+
+    :meth:`get_names`: Get the scale names of a string of notes.
+
+    :meth:`get_notes`: Get the string of notes of a scale name.
+
+    :meth:`get_intervals`: Get the string of intervals of some notes.
+
+    :meth:`get_alternative_names`: Get the names of a scale's rotations.
+    """
+
+    def __init__(self, scale_table, alternatives_table=None):
+        """Instantiate the index with empty dictionaries.
+
+        :param scale_table: Passed to :attr:`table`.
+        :type scale_table: datahelper.DataTable | datahelper.TypeTable
+        :param alternatives_table: Passed to :attr:`alternatives_table`.
+        :type alternatives_table: datahelper.DataTable | None
+        """
+        self.table = scale_table
+        self.alternatives_table = alternatives_table
+        self.names_by_notes: dict[str, list[str]] = {}
+        self.notes_by_name: dict[str, str] = {}
+        self.intervals_by_notes: dict[str, str] = {}
+        self.alternatives_by_notes: dict[
+            str, tuple[list[str], list[str]]
+        ] = {}
+
+    def find_notes(self, notes_str: str):
+        """Search the table for a string of notes and memoize its data.
+
+        The intervals kept for the notes are the ones of its first
+        scale.
+        """
+        name_intervals = self.table.find_value(notes_str)
+        if name_intervals:
+            names = [item.split("(")[0][:-1] for item in name_intervals]
+            interval_str = name_intervals[0].split("(")[-1][:-1]
+            self.names_by_notes[notes_str] = names
+            self.intervals_by_notes[notes_str] = interval_str
+
+    def get_names(self, notes_str: str) -> list[str]:
+        """Return a new list with the names of a string of notes."""
+        if notes_str not in self.names_by_notes:
+            self.find_notes(notes_str)
+        return list(self.names_by_notes.get(notes_str, []))
+
+    def get_notes(self, name_str: str) -> str:
+        """Return the string of notes of a scale name, if any."""
+        if name_str not in self.notes_by_name:
+            found = self.table.find_prefix(name_str + " (")
+            if not found:
+                return ""
+            self.notes_by_name[name_str] = found[-1][1]
+        return self.notes_by_name[name_str]
+
+    def get_intervals(self, notes_str: str) -> str:
+        """Return the string of intervals of some notes, if any."""
+        if notes_str not in self.intervals_by_notes:
+            self.find_notes(notes_str)
+        return self.intervals_by_notes.get(notes_str, "")
+
+    def find_alternatives(self, notes_str: str):
+        """Get the names of the rotations of some notes and memoize them.
+
+        With :attr:`alternatives_table`, the names and variant names
+        take a single lookup of the semitones of the notes, with
+        :func:`datahelper.find_rotation_names`. Without it, the names of
+        each rotation are searched for with :meth:`get_names`, then
+        split with :meth:`ScaleNames.filter_variants`.
+        """
+        if self.alternatives_table is not None:
+            name_groups = datahelper.find_rotation_names(
+                notes_str, self.alternatives_table, " "
+            )
+            names, variant_names = name_groups or ([], [])
+            names = sorted(set(names))
+            variant_names = sorted(set(variant_names))
+        else:
+            all_names = set()
+            for rotation in notes.get_note_rotations(notes_str):
+                all_names.update(self.get_names(rotation))
+            names = sorted(ScaleNames.filter_variants(all_names))
+            variant_names = sorted(all_names.difference(names))
+        self.alternatives_by_notes[notes_str] = (names, variant_names)
+
+    def get_alternative_names(self, notes_str: str, variants=False):
+        """Return a new sorted list with the names of a scale's rotations.
+
+        :param notes_str: A string of the notes of the scale.
+        :type notes_str: str
+        :param variants: Whether to include the scale variants.
+        :type variants: bool
+        :returns: The names of the scales on every mode of the notes.
+        :rtype: list[str]
+        """
+        if notes_str not in self.alternatives_by_notes:
+            self.find_alternatives(notes_str)
+        names, variant_names = self.alternatives_by_notes[notes_str]
+        if variants:
+            return sorted(names + variant_names)
+        return list(names)
+
+
+def _load_scale_data():
+    """Decode all the scale data and store it in the module's globals."""
+    items = list(get_scale_index().table.items())
+    globals().update(
+        all_scales=dict(items),
+        items=items,
+        SCALE_NAMES_INTERVALS=[i[0] for i in items],
+        SCALE_NOTES=[i[1] for i in items],
+    )
+
+
+def __getattr__(name: str):
+    """Load the scale data on first access to one of its globals."""
+    if name in _LAZY_GLOBALS:
+        _load_scale_data()
+        return globals()[name]
+    if name == "SCALE_INDEX":
+        return get_scale_index()
+    if name == "SCALE_IDENTIFIER":
+        return get_scale_identifier()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_scale_index() -> ScaleIndex:
+    """Return :data:`SCALE_INDEX`, loading the scale table if needed."""
+    if "SCALE_INDEX" not in globals():
+        type_table = datahelper.get_data_table("scaletypes.json")
+        scale_table = datahelper.TypeTable(type_table, " ")
+        alternatives_table = datahelper.get_data_table(
+            "scalealternatives.json"
+        )
+        globals()["SCALE_INDEX"] = ScaleIndex(scale_table, alternatives_table)
+    return globals()["SCALE_INDEX"]
+
+
+class ScaleIdentifier:
+    """Identify and search scales by their pitch classes.
+
+    Every scale is keyed by its root's pitch class and its pitch-class
+    set (from :func:`notes.get_pitch_class_set`), so a scale is found
+    with a single lookup whatever the order or spelling of its notes,
+    and the scales containing some notes are found by comparing masks.
+
+    Attributes
+    ----------
+    .. attribute:: names_by_root_set
+       :type: dict[tuple[int, int], list[str]]
+
+       Scale names keyed by root pitch class and pitch-class set.
+
+    .. attribute:: roots_names_by_set
+       :type: dict[int, list[tuple[int, str]]]
+
+       Root pitch classes and names of the scales, keyed by their
+       pitch-class set, from the smallest to the largest sets.
+
+    .. attribute:: names_containing
+       :type: dict[tuple[int, int], list[str]]
+
+       Memoized results of :meth:`find_containing`, keyed by root pitch
+       class (-1 for any root) and pitch-class set.
+
+    Methods
+    -------
+    :meth:`identify`: Get the names of the scale of some notes.
+
+    :meth:`find_containing`: Get the names of scales containing notes.
+    """
+
+    def __init__(self, scale_items):
+        """Build the identifier from the scale data.
+
+        :param scale_items: Pairs of "name (intervals)" and notes.
+        :type scale_items: Iterable[tuple[str, str]]
+        """
+        self.names_by_root_set: dict[tuple[int, int], list[str]] = {}
+        roots_names_by_set: dict[int, list[tuple[int, str]]] = {}
+        self.names_containing: dict[tuple[int, int], list[str]] = {}
+
+        for name_interval, notes_str in scale_items:
+            note_names = notes_str.split()
+            name = name_interval.split("(")[0][:-1]
+            root = notes.PITCH_CLASSES[note_names[0]]
+            pitch_class_set = notes.get_pitch_class_set(note_names)
+            root_set = (root, pitch_class_set)
+            self.names_by_root_set.setdefault(root_set, []).append(name)
+            roots_names = roots_names_by_set.setdefault(pitch_class_set, [])
+            roots_names.append((root, name))
+
+        sets_by_size = sorted(
+            roots_names_by_set, key=lambda s: bin(s).count("1")
+        )
+        self.roots_names_by_set = {
+            pitch_class_set: roots_names_by_set[pitch_class_set]
+            for pitch_class_set in sets_by_size
+        }
+
+    def identify(self, notes_str: str, root_name="") -> list[str]:
+        """Get the names of the scales with the same notes as a string.
+
+        The notes may come in any order or spelling. If no root is
+        given, the names of the scales rooted on the first note come
+        first, followed by the names of its modes.
+
+        :param notes_str: The notes of the scale in a string.
+        :type notes_str: str
+        :param root_name: The root of the scale, if known.
+        :type root_name: str
+        :returns: The names of the scale.
+        :rtype: list[str]
+        """
+        note_names = notes_str.split()
+        if not note_names:
+            return []
+        pitch_class_set = notes.get_pitch_class_set(note_names)
+        if root_name:
+            root_set = (notes.Note(root_name).pitch_class, pitch_class_set)
+            return list(self.names_by_root_set.get(root_set, []))
+
+        first = notes.PITCH_CLASSES[note_names[0]]
+        roots_names = self.roots_names_by_set.get(pitch_class_set, [])
+        names = [name for (root, name) in roots_names if root == first]
+        names += [name for (root, name) in roots_names if root != first]
+        return names
+
+    def find_containing(self, notes_str: str, root_name="") -> list[str]:
+        """Get the names of the scales containing all the given notes.
+
+        Compares the pitch-class set of the notes with the one of every
+        scale, once per query, listing the scales with fewer notes
+        first. The results are memoized in :attr:`names_containing`.
+
+        :param notes_str: The notes in a string, in any order.
+        :type notes_str: str
+        :param root_name: The root the scales must have, if any.
+        :type root_name: str
+        :returns: The names of the scales.
+        :rtype: list[str]
+        """
+        query_set = notes.get_pitch_class_set(notes_str.split())
+        query_root = notes.Note(root_name).pitch_class if root_name else -1
+        query = (query_root, query_set)
+        if query not in self.names_containing:
+            names = []
+            for pitch_class_set in self.roots_names_by_set:
+                if pitch_class_set & query_set != query_set:
+                    continue
+                for root, name in self.roots_names_by_set[pitch_class_set]:
+                    if query_root in (-1, root):
+                        names.append(name)
+            self.names_containing[query] = names
+        return list(self.names_containing[query])
+
+
+def get_scale_identifier() -> ScaleIdentifier:
+    """Return :data:`SCALE_IDENTIFIER`, building it if needed."""
+    if "SCALE_IDENTIFIER" not in globals():
+        scale_items = get_scale_index().table.items()
+        globals()["SCALE_IDENTIFIER"] = ScaleIdentifier(scale_items)
+    return globals()["SCALE_IDENTIFIER"]
 
 
 class ScaleNames:
@@ -110,33 +556,20 @@ class ScaleNames:
     def get_alternative_names(self, notes_str: str, variants=False):
         """Get the alternative names for the scale.
 
-        First declares a list based on the string of notes, then
-        iterates through it, changing places of the notes on the list
-        using list slicing. After that, calls :func:`get_scale_names`
-        and filters out scale variants if the right parameter is passed.
-        Finally, sorts the :attr:`items` list.
+        Adds the names of the scales on every rotation of the string of
+        notes, retrieved with :meth:`ScaleIndex.get_alternative_names`
+        from the types on the rotations precomputed by the scale
+        generator, then sorts :attr:`items`.
 
         :param notes_str: A string of the notes of the scale.
         :type notes_str: str
         :param variants: Whether the method should get scale variants.
         :type variants: bool
         """
-        notes_list = notes_str.split()
-
-        for note in notes_list:
-            index = notes_list.index(note)
-            notes_list = notes_list[index:] + notes_list[:index]
-            notes_str = " ".join(notes_list)
-            alternative_names = get_scale_names(notes_str)
-            if variants is False:
-                names_filtered = ScaleNames.filter_variants(
-                    alternative_names.items
-                )
-                self.items.extend(names_filtered)
-            else:
-                self.items.extend(alternative_names.items)
-        self.items = list(set(self.items))
-        self.items.sort()
+        alternative_names = get_scale_index().get_alternative_names(
+            notes_str, variants
+        )
+        self.items = sorted(set(self.items + alternative_names))
 
     def get_names_information(self) -> str:
         """Return a message containing the scale names.
@@ -280,6 +713,10 @@ class Scale:
        :type: ScaleNotes
 
        The scale's notes in an object.
+
+    Methods
+    -------
+    :meth:`copy`: Copy the scale and its components.
     """
 
     def __init__(
@@ -301,44 +738,139 @@ class Scale:
         self.intervals = scale_intervals
         self.notes = scale_notes
 
+    def copy(self) -> "Scale":
+        """Return a copy of the scale whose components can be changed.
+
+        :returns: The copy of the scale.
+        :rtype: Scale
+        """
+        scale_intervals = [
+            intervals.Interval(interval.name, interval.note1, interval.note2)
+            for interval in self.intervals.items
+        ]
+        return Scale(
+            ScaleNames(list(self.names.items)),
+            ScaleIntervals(scale_intervals),
+            ScaleNotes(list(self.notes.items)),
+        )
+
+
+def identify_scale(scale_notes: str, root_name="") -> ScaleNames:
+    """Get scale names using notes in any order or spelling.
+
+    :param scale_notes: The notes of the scale as a string.
+    :type scale_notes: str
+    :param root_name: The root of the scale, if known.
+    :type root_name: str
+    :returns: An object containing the names.
+    :rtype: ScaleNames
+    """
+    names = get_scale_identifier().identify(scale_notes, root_name)
+    return ScaleNames(names)
+
+
+def find_scales_containing(notes_str: str, root_name="") -> ScaleNames:
+    """Get the names of the scales containing all the given notes.
+
+    :param notes_str: The notes in a string, in any order.
+    :type notes_str: str
+    :param root_name: The root the scales must have, if any.
+    :type root_name: str
+    :returns: An object containing the names, smaller scales first.
+    :rtype: ScaleNames
+    """
+    names = get_scale_identifier().find_containing(notes_str, root_name)
+    return ScaleNames(names)
+
+
+def find_scales_for_chord(chord_name: str, same_root=False) -> ScaleNames:
+    """Get the names of the scales containing all notes of a chord.
+
+    :param chord_name: The name of the chord (e.g.: "Cm7").
+    :type chord_name: str
+    :param same_root: Whether the scales must have the chord's root.
+    :type same_root: bool
+    :returns: An object containing the names, smaller scales first.
+    :rtype: ScaleNames
+    """
+    chord_notes = chords.get_chord_notes(chord_name).items
+    if not chord_notes:
+        return ScaleNames([])
+    notes_str = " ".join(note.name for note in chord_notes)
+    root_name = chord_notes[0].name if same_root else ""
+    return find_scales_containing(notes_str, root_name)
+
 
 def get_scale_names(scale_notes: str) -> ScaleNames:
     """Get scale names based on a string of notes.
 
-    First declares an empty list of names, initializes a counter for
-    indexing and copies :data:`SCALE_NOTES` to a variable. Afterwards,
-    iterates through that variable and checks if the string of notes
-    matches the current item, then uses the index counter to get the
-    corresponding name in :data:`SCALE_NAMES_INTERVALS`, splits it to
-    separate the name from the intervals and appends it to the name
-    list. Finally, returns a :class:`ScaleNames` object with the list.
+    Looks up the string of notes with :func:`get_scale_index` to get the
+    corresponding names and returns a :class:`ScaleNames` object with
+    them.
 
     :param scale_notes: The notes of the scale as a string.
     :type scale_notes: str
     :returns: An object containing the names.
     :rtype: ScaleNames
     """
-    names = []
-    index = 0
-    all_scale_notes = SCALE_NOTES.copy()
-    for item in all_scale_notes:
-        if item == scale_notes:
-            name_interval = SCALE_NAMES_INTERVALS[index]
-            name = name_interval.split("(")[0]
-            name = name[:-1]
-            names.append(name)
-        index += 1
+    names = get_scale_index().get_names(scale_notes)
     return ScaleNames(names)
 
 
+def parse_scale_name(scale_name: str) -> tuple[str, list[str]]:
+    """Get the root and intervals of a scale from its name alone.
+
+    The name is matched against :data:`SCALE_NAME_PATTERN`, then each
+    suffix replaces an interval of the scale as in
+    :data:`SCALE_VARIATIONS`, in the order they're written. Like in the
+    scale generator, "maj7" takes the place of the second degree.
+
+    Raises :exc:`InvalidScaleNameError` if the name can't be parsed or a
+    suffix replaces an interval that isn't in the scale anymore.
+
+    :param scale_name: The name of the scale (e.g.: "C Dorian #4").
+    :type scale_name: str
+    :returns: The root of the scale and its intervals, in order.
+    :rtype: tuple[str, list[str]]
+    """
+    match = SCALE_NAME_PATTERN.fullmatch(scale_name)
+    if match is None:
+        raise InvalidScaleNameError(name=scale_name)
+    scale_intervals = SCALE_FORMULAS[match.group("scale")].split()
+    for variation in match.group("variations").split():
+        natural, altered = SCALE_VARIATIONS[variation]
+        if natural not in scale_intervals:
+            raise InvalidScaleNameError(name=scale_name)
+        scale_intervals[scale_intervals.index(natural)] = altered
+    return match.group("root"), scale_intervals
+
+
+def spell_scale(root_name: str, interval_names: list[str]) -> list[str]:
+    """Get the notes of a scale from its root and intervals.
+
+    Notes are spelled in the key of the root with
+    :func:`intervals.transpose`, as in the scale data.
+
+    :param root_name: The name of the root of the scale.
+    :type root_name: str
+    :param interval_names: The names of the intervals of the scale.
+    :type interval_names: list[str]
+    :returns: The names of the notes of the scale.
+    :rtype: list[str]
+    """
+    root = notes.Note(root_name)
+    return [
+        intervals.transpose(root, interval).name for interval in interval_names
+    ]
+
+
 def get_scale_notes(scale_name: str) -> ScaleNotes:
     """Get a scale's notes using one of its names.
 
-    Iterates through a copy of data:`SCALE_NAMES_INTERVALS`, checking
-    if the name argument matches the name in the item. If so, grabs the
-    index of the item and uses it on :data:`SCALE_NOTES` to get the
-    corresponding notes. Finally, uses a list comprehension on the
-    splitted note string to instantiate :class:`notes.Note` objects for
+    Works the notes out from the name with :func:`parse_scale_name` and
+    :func:`spell_scale`, looking the name up with
+    :func:`get_scale_index` only if it can't be parsed. Then uses a
+    list comprehension to instantiate :class:`notes.Note` objects for
     each one, and returns them all as a single :class:`ScaleNotes`
     object.
 
@@ -347,14 +879,10 @@ def get_scale_notes(scale_name: str) -> ScaleNotes:
     :returns: An object containing the notes.
     :rtype: ScaleNotes
     """
-    note_str = ""
-    scale_names_intervals = SCALE_NAMES_INTERVALS.copy()
-    for item in scale_names_intervals:
-        name = item.split("(")[0][:-1]
-        if scale_name == name:
-            index = scale_names_intervals.index(item)
-            note_str = SCALE_NOTES[index]
-    note_list = note_str.split()
+    try:
+        note_list = spell_scale(*parse_scale_name(scale_name))
+    except InvalidScaleNameError:
+        note_list = get_scale_index().get_notes(scale_name).split()
     scale_notes = [notes.Note(i) for i in note_list]
     return ScaleNotes(scale_notes)
 
@@ -362,10 +890,8 @@ def get_scale_notes(scale_name: str) -> ScaleNotes:
 def get_scale_intervals(scale_notes: str) -> ScaleIntervals:
     """Get a scale's intervals using a string of its notes.
 
-    Iterates through a copy of :data:`SCALE_NOTES` and checks if the
-    current item matches the argument of notes given. Then grabs the
-    index of the item and uses it to retrieve the corresponding scale
-    intervals from :data:`SCALE_NAMES_INTERVALS`. Finally, uses list
+    Looks up the argument of notes given with :func:`get_scale_index` to
+    retrieve the corresponding scale intervals. Then uses list
     comprehension on the splitted intervals string to intantiate each
     one as a :class:`intervals.Interval` object, and returns a
     ScaleIntervals object containing these objects.
@@ -375,25 +901,20 @@ def get_scale_intervals(scale_notes: str) -> ScaleIntervals:
     :returns: An object containing the intervals of the scale.
     :rtype: ScaleIntervals
     """
-    interval_str = ""
-    all_scale_notes = SCALE_NOTES.copy()
-    for item in all_scale_notes:
-        if item == scale_notes:
-            index = all_scale_notes.index(item)
-            name_interval = SCALE_NAMES_INTERVALS[index]
-            interval_str = name_interval.split("(")[-1]
-            interval_str = interval_str[:-1]
+    interval_str = get_scale_index().get_intervals(scale_notes)
     interval_list = interval_str.split()
     scale_intervals = [intervals.Interval(i) for i in interval_list]
     return ScaleIntervals(scale_intervals)
 
 
-def get_scale(notes_param: str) -> Scale:
-    """Return a scale object.
+def build_scale(notes_param: str) -> Scale:
+    """Build a scale object.
 
     Uses the :func:`get_scale_names`, :func:`get_scale_intervals` and
     :func:`get_scale_notes` to get the components of the scale, and then
-    use said components to instantiate a Scale object.
+    use said components to instantiate a Scale object. Notes that don't
+    match a scale exactly are identified with :func:`identify_scale`,
+    and the scale returned has the notes of the first name found.
 
     :param notes_param: A string of scale notes.
     :type notes_param: str
@@ -401,12 +922,40 @@ def get_scale(notes_param: str) -> Scale:
     :rtype: Scale
     """
     scale_names = get_scale_names(notes_param)
+    if not scale_names.items:
+        identified_names = identify_scale(notes_param)
+        scale_notes = get_scale_notes(identified_names.items[0])
+        notes_param = scale_notes.get_notes_str()
+        scale_names = get_scale_names(notes_param)
     scale_intervals = get_scale_intervals(notes_param)
     scale_notes = get_scale_notes(scale_names.items[0])
     scale = Scale(scale_names, scale_intervals, scale_notes)
     return scale
 
 
+def get_scale(notes_param: str) -> Scale:
+    """Return a scale object.
+
+    Returns a copy of the scale in :data:`SCALE_CACHE`, built with
+    :func:`build_scale` the first time it's asked for, so changing it
+    doesn't change the scales returned afterwards.
+
+    Raises :exc:`ValueError` if no notes are given.
+
+    :param notes_param: A string of scale notes.
+    :type notes_param: str
+    :returns: An object representing a scale.
+    :rtype: Scale
+    """
+    notes_param = " ".join(notes_param.split())
+    if not notes_param:
+        raise ValueError("The notes of the scale must be given.")
+    scale = SCALE_CACHE.get_or_build(
+        notes_param, lambda: build_scale(notes_param)
+    )
+    return scale.copy()
+
+
 def scale_input() -> Scale:
     """Handle the input of scales.
 
@@ -418,7 +967,11 @@ def scale_input() -> Scale:
             "Enter the notes of the scale separated by spaces (currently only "
             "diatonic and pentatonic scales supported): "
         )
-        if note_input not in SCALE_NOTES:
+        try:
+            names = identify_scale(note_input).items
+        except notes.InvalidNoteNameError:
+            names = []
+        if not names:
             print(
                 "There is no match in our data of a scale with these notes, "
                 "please try again."
@@ -447,7 +1000,7 @@ def display_scale_information(scale: Scale, variants=False):
         )
 
         if decision == "I":
-            scale.intervals.assign_notes_to_intervals()
+            scale.intervals.assign_notes_to_intervals(scale.notes.items)
             print(scale.intervals.get_intervals_information() + "\n")
         if decision == "O":
             print(scale.notes.get_notes_information() + "\n")
@@ -0,0 +1,41 @@
+import musicinpython.bench as bench
+import musicinpython.chords as chords
+import musicinpython.scales as scales
+
+
+def test_time_function():
+    calls = []
+    ms = bench.time_function(lambda: calls.append(1), repeat=3, number=2)
+    assert len(calls) == 6
+    assert ms >= 0
+
+
+def test_benchmark_lookups():
+    results = bench.benchmark_lookups(repeat=1, number=1)
+    assert list(results) == list(bench.LOOKUP_FUNCTIONS)
+    assert all(ms >= 0 for ms in results.values())
+
+
+def test_lookups_are_uncached():
+    bench.LOOKUP_FUNCTIONS["chords.get_chord by notes"]()
+    assert len(chords.CHORD_CACHE) == 1
+    bench.LOOKUP_FUNCTIONS["scales.get_scale"]()
+    assert len(chords.CHORD_CACHE) == 0
+    assert not chords.get_chord_index().names_by_notes
+    assert len(scales.SCALE_CACHE) == 1
+    assert list(scales.get_scale_index().names_by_notes) == [
+        "C D E F G A B"
+    ]
+
+
+def test_format_results():
+    table = bench.format_results({"a": 1.0, "long name": 2.5})
+    assert table.splitlines() == [
+        "a               1.000 ms",
+        "long name       2.500 ms",
+    ]
+
+
+def test_run_unknown_benchmark(capsys):
+    bench.run(["unknown"])
+    assert "Unknown benchmarks: unknown." in capsys.readouterr().out
@@ -0,0 +1,33 @@
+import pytest
+import musicinpython.cache as cache
+
+
+class TestLRUCacheClass:
+    def test_get_or_build(self):
+        lru_cache = cache.LRUCache(2)
+        assert lru_cache.get_or_build("a", lambda: 1) == 1
+        assert lru_cache.get_or_build("a", lambda: 2) == 1
+        assert (lru_cache.hits, lru_cache.misses) == (1, 1)
+
+    def test_eviction(self):
+        lru_cache = cache.LRUCache(2)
+        lru_cache.get_or_build("a", lambda: 1)
+        lru_cache.get_or_build("b", lambda: 2)
+        lru_cache.get_or_build("a", lambda: 1)
+        lru_cache.get_or_build("c", lambda: 3)
+        assert "a" in lru_cache and "c" in lru_cache
+        assert "b" not in lru_cache
+
+    def test_resize_and_clear(self):
+        lru_cache = cache.LRUCache(3)
+        for key in "abc":
+            lru_cache.get_or_build(key, lambda: key)
+        lru_cache.resize(1)
+        assert len(lru_cache) == 1 and "c" in lru_cache
+        lru_cache.resize(0)
+        lru_cache.get_or_build("d", lambda: 4)
+        assert len(lru_cache) == 0
+        lru_cache.clear()
+        assert "hits=0, misses=0" in lru_cache.get_info()
+        with pytest.raises(ValueError):
+            lru_cache.resize(-1)
@@ -1,3 +1,6 @@
+import os
+import json
+import pytest
 import musicinpython.generators.chordgenerator as chordgen
 
 
@@ -13,6 +16,15 @@ def test_get_all_intervals_index():
     assert chordgen.get_all_intervals_index("bVII") == 10
 
 
+def test_interval_masks():
+    intervals = ["I", "#II", "bIII", "V"]
+    interval_mask = chordgen.get_interval_mask(reversed(intervals))
+    assert chordgen.get_mask_intervals(interval_mask) == intervals
+    chromatic_scale = chordgen.make_chromatic_scale("C")
+    notes = chordgen.get_mask_notes(interval_mask, chromatic_scale)
+    assert notes == "C Eb Eb G"
+
+
 class TestChordClass:
     chord1 = chordgen.Chord("Cm7", {"I", "bIII", "V", "bVII"})
     chord2 = chordgen.Chord("C#7M", {"I", "III", "V", "VII"})
@@ -40,6 +52,9 @@ class TestChordNameFormatterClass:
         formatter = chordgen.ChordNameFormatter()
         formatter.format_triad_name(triad)
         assert triad.name == "Cdim"
+        interval_mask = chordgen.get_interval_mask(["I", "III", "V"])
+        name = formatter.get_triad_name("Cdim", interval_mask)
+        assert name == "Cdim"
 
     def test_format_seventh_chord_name(self):
         seventh_list = [
@@ -62,6 +77,8 @@ class TestChordNameFormatterClass:
             formatter.format_extended_chord_name(chord)
         assert chord1.name == "C9"
         assert chord2.name == "Cm7(11)"
+        name = formatter.get_extended_chord_name("Cm7(b5)/9", "C")
+        assert name == "Cm7(b5)/9"
 
 
 def extract_chord_names(generator):
@@ -79,6 +96,12 @@ class TestTriadChordGeneratorClass:
         name_list = extract_chord_names(self.triadgen)
         assert "C5" in name_list
 
+    def test_is_standard_triad_chord(self):
+        minor_mask = chordgen.get_interval_mask(["I", "bIII", "#V"])
+        triadgen = chordgen.TriadChordGenerator
+        assert triadgen.is_standard_triad_chord(("Cmdim", minor_mask))
+        assert not triadgen.is_standard_triad_chord(("Cmaug", minor_mask))
+
     def test_generate(self):
         self.triadgen.generate()
         name_list = extract_chord_names(self.triadgen)
@@ -96,6 +119,11 @@ class TestTriadChordGeneratorClass:
 class TestSeventhChordGeneratorClass:
     seventhgen = chordgen.SeventhChordGenerator("C")
 
+    def test_is_standard_seventh_chord(self):
+        generator_class = chordgen.SeventhChordGenerator
+        assert generator_class.is_standard_seventh_chord(("Cm7", 0))
+        assert not generator_class.is_standard_seventh_chord(("Cdim7", 0))
+
     def test_generate(self):
         self.seventhgen.generate()
         name_list = extract_chord_names(self.seventhgen)
@@ -112,6 +140,18 @@ class TestSeventhChordGeneratorClass:
 class TestExtendedChordGeneratorClass:
     extendedgen = chordgen.ExtendedChordGenerator("C")
 
+    def test_is_standard_extended_chord(self):
+        assert self.extendedgen.is_standard_extended_chord(("C7/9", 0))
+        assert not self.extendedgen.is_standard_extended_chord(("C7/6", 0))
+
+    def test_iter_chord_extensions(self):
+        chord = ("C7", chordgen.get_interval_mask(["I", "III", "V", "bVII"]))
+        chords = list(self.extendedgen.iter_chord_extensions(chord, 1, 3))
+        names = [name for name, _ in chords]
+        assert names[:3] == ["C7", "C7/b11", "C7/b11/b13"]
+        assert "C7/9" not in names and "C7/#11/13" in names
+        assert len(names) == len(set(names)) == 1 + 3 + 3 + 3 * 3
+
     def test_generate(self):
         self.extendedgen.generate()
         name_list = extract_chord_names(self.extendedgen)
@@ -134,3 +174,81 @@ class TestMainClass:
 
     def test_generate_chords(self):
         assert ("Cm (I bIII V)", "C Eb G") in self.dump.items()
+
+    def test_generate_root_chords(self):
+        root_dump = chordgen.generate_root_chords(
+            chordgen.TriadChordGenerator, "C"
+        )
+        assert ("Cm (I bIII V)", "C Eb G") in root_dump.items()
+        assert all(name.startswith("C") for name in root_dump)
+
+    def test_generate_chords_parallel(self):
+        chord_dump = chordgen.generate_chords_parallel(
+            chordgen.TriadChordGenerator, max_workers=2
+        )
+        assert list(chord_dump.items()) == list(self.dump.items())
+
+    def test_generate_chord_types(self):
+        chord_types = chordgen.generate_chord_types(self.dump)
+        assert len(chord_types) * len(chordgen.ROOTS) == len(self.dump)
+        assert chord_types["m"] == "I bIII V"
+        assert chord_types["sus2"] == "I II V"
+
+    def test_generate_alternative_types(self):
+        chord_types = chordgen.generate_chord_types(self.dump)
+        alternative_types = chordgen.generate_alternative_types(chord_types)
+        assert alternative_types["0 2 7"] == "0:sus2, 2:sus, 2:sus4"
+        assert alternative_types["0 4 8"].startswith("0:5+, 0:aug, 1:5+")
+
+
+def test_iter_chords():
+    chords = chordgen.iter_chords("C", 9)
+    assert next(chords).name == "Cm5-"
+    names = [chord.name for chord in chords]
+    assert "Cm7(9)" in names and "Cm7(11)" not in names
+    triad_names = [chord.name for chord in chordgen.iter_chords("C", 3)]
+    triadgen = chordgen.TriadChordGenerator("C")
+    triadgen.generate()
+    assert triad_names == extract_chord_names(triadgen)
+    with pytest.raises(ValueError):
+        next(chordgen.iter_chords("C", 8))
+
+
+def test_stream_chords_to_json(tmp_path):
+    chords_path = os.path.join(tmp_path, "triadchords.json")
+    count = chordgen.stream_chords_to_json(chords_path, 3)
+    with open(chords_path, "r") as chords_file:
+        chord_dump = json.load(chords_file)
+    assert count == len(chord_dump)
+    triadgen = chordgen.TriadChordGenerator()
+    assert chord_dump == chordgen.generate_chords(triadgen)
+
+    lines_path = os.path.join(tmp_path, "triadchords.jsonl")
+    chordgen.stream_chords_to_json(lines_path, 3, lines=True)
+    with open(lines_path, "r") as lines_file:
+        first_line = json.loads(lines_file.readline())
+    assert list(first_line.items())[0] in chord_dump.items()
+
+
+def test_iter_chord_items():
+    chord_items = list(chordgen.iter_chord_items(7))
+    assert list(chordgen.iter_chord_items(7, max_workers=2)) == chord_items
+    assert chord_items[0] == ("Cm5- (I bIII bV)", "C Eb Gb")
+
+
+def test_dump_chords_to_json_compressed(tmp_path, monkeypatch):
+    monkeypatch.setattr(chordgen, "ProcessPoolExecutor", None)
+    chordgen.dump_chords_to_json("-t", tmp_path, None, True, True)
+    assert os.path.exists(os.path.join(tmp_path, "triadchords.jsonl.gz"))
+    assert os.path.exists(os.path.join(tmp_path, "triadtypes.bin"))
+    assert not os.path.exists(os.path.join(tmp_path, "triadtypes.json"))
+    assert os.path.exists(os.path.join(tmp_path, "triadalternatives.bin"))
+    assert not os.path.exists(os.path.join(tmp_path, "triadchords.bin"))
+    types_table = chordgen.datahelper.get_data_table(
+        os.path.join(tmp_path, "triadtypes.json")
+    )
+    triadgen = chordgen.TriadChordGenerator()
+    chord_types = chordgen.generate_chord_types(
+        chordgen.generate_chords(triadgen)
+    )
+    assert dict(types_table.items()) == chord_types
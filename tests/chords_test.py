@@ -1,4 +1,134 @@
+import subprocess
+import sys
+import pytest
 import musicinpython.chords as chords
+import musicinpython.datahelper as datahelper
+
+
+def test_lazy_loading():
+    code = "import musicinpython.chords as m; print('all_chords' in vars(m))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.stdout.strip() == "False"
+    assert len(chords.CHORD_NOTES) == len(chords.CHORD_NAMES_INTERVALS)
+    assert chords.get_chord_index() is chords.CHORD_INDEX
+
+
+class TestChordIndexClass:
+    chord_table = datahelper.DataTable.from_items(
+        [
+            ("Cm(#13) (I bIII V #VI)", "C Eb G Bb"),
+            ("Cm7 (I bIII V bVII)", "C Eb G Bb"),
+            ("Eb6 (I III V VI)", "Eb G Bb C"),
+        ]
+    )
+    chord_index = chords.ChordIndex(chord_table)
+
+    def test_get_names(self):
+        assert self.chord_index.get_names("C Eb G Bb") == ["Cm(#13)", "Cm7"]
+        assert self.chord_index.get_names("C D") == []
+
+    def test_get_notes(self):
+        assert self.chord_index.get_notes("Cm7") == "C Eb G Bb"
+        assert self.chord_index.get_notes("Cm") == ""
+
+    def test_get_intervals(self):
+        assert self.chord_index.get_intervals("Cm7") == "I bIII V bVII"
+
+    def test_get_alternative_names(self):
+        assert self.chord_index.get_alternative_names("C Eb G Bb") == [
+            "Cm(#13)",
+            "Cm7",
+            "Eb6",
+        ]
+        assert self.chord_index.get_alternative_names("Bb C Eb G") == [
+            "Cm(#13)",
+            "Cm7",
+            "Eb6",
+        ]
+        assert self.chord_index.get_alternative_names("C D") == []
+
+    def test_get_alternative_names_table(self):
+        alternatives_table = datahelper.DataTable.from_items(
+            [("0 3 7 10", "0:m(#13), 0:m7, 1:6"), ("0 4 7 9", "0:6")]
+        )
+        chord_index = chords.ChordIndex(self.chord_table, alternatives_table)
+        assert chord_index.get_alternative_names("C Eb G Bb") == [
+            "Cm(#13)",
+            "Cm7",
+            "Eb6",
+        ]
+        assert chord_index.get_alternative_names("C D") == []
+        chord_index = chords.get_chord_index()
+        assert chord_index.get_alternative_names("Bb C Eb G") == [
+            "Cm(#13)",
+            "Cm7",
+            "Eb13",
+        ]
+
+
+class TestChordIdentifierClass:
+    chord_identifier = chords.ChordIdentifier(
+        [
+            ("Am7 (I bIII V bVII)", "A C E G"),
+            ("C6 (I III V VI)", "C E G A"),
+            ("Cm7 (I bIII V bVII)", "C Eb G Bb"),
+        ]
+    )
+
+    def test_identify(self):
+        assert self.chord_identifier.identify("A C E G") == ["Am7", "C6"]
+        assert self.chord_identifier.identify("C A E G") == ["C6", "Am7"]
+        assert self.chord_identifier.identify("G A# D# C") == ["Cm7"]
+        assert self.chord_identifier.identify("C E G") == []
+
+    def test_identify_with_root(self):
+        assert self.chord_identifier.identify("G C E A", "A") == ["Am7"]
+
+
+def test_identify_chord():
+    assert "Cm7" in chords.identify_chord("Bb G Eb C").items
+    chord = chords.get_chord(notes_param="G C E")
+    assert chord.notes.get_notes_str() == "C E G"
+
+
+def test_parse_chord_name():
+    assert chords.parse_chord_name("Cm7(b5)") == (
+        "C",
+        ["I", "bIII", "bV", "bVII"],
+    )
+    assert chords.parse_chord_name("F#sus2/7")[1] == ["I", "II", "V", "bVII"]
+    assert chords.parse_chord_name("Bb13") == ("Bb", ["I", "III", "V", "VI"])
+    assert chords.parse_chord_name("C7/9/#11")[1] == [
+        "I",
+        "II",
+        "III",
+        "#IV",
+        "V",
+        "bVII",
+    ]
+    assert chords.parse_chord_name("Cm(b5)")[1] == ["I", "bIII", "bV"]
+    invalid_names = ["Cdim7", "Cmsus4", "H7", "C7M9", "C(b5)(b5)", "C5-(b5)"]
+    for name in invalid_names + ["Cm(b5)7"]:
+        with pytest.raises(chords.InvalidChordNameError):
+            chords.parse_chord_name(name)
+
+
+def test_spell_chord():
+    chord_intervals = ["I", "III", "#V", "VII"]
+    assert chords.spell_chord("Eb", chord_intervals) == ["Eb", "G", "B", "D"]
+    assert chords.spell_chord("E", chord_intervals) == ["E", "G#", "C", "D#"]
+
+
+def test_get_chord_without_data():
+    chord_notes = chords.get_chord_notes("Dmmaj7/9")
+    assert chord_notes.get_notes_str() == "D E F A C#"
+    chord = chords.get_chord("Dmmaj7/9")
+    assert chord.intervals.items[-1].name == "VII"
+    unknown_chord = chords.get_chord("Xyz")
+    assert unknown_chord.names.items == []
+    assert unknown_chord.notes.items == []
 
 
 class TestChordNamesClass:
@@ -8,6 +138,8 @@ class TestChordNamesClass:
         notes_str = "C Eb G Bb"
         self.cm7names.get_alternative_names(notes_str)
         assert "Cm(#13)" in self.cm7names.items
+        assert "Eb13" in self.cm7names.items
+        assert self.cm7names.items == sorted(set(self.cm7names.items))
 
     def test_get_names_information(self):
         message = self.cm7names.get_names_information()
@@ -44,3 +176,19 @@ def test_get_chord():
     chord1 = chords.get_chord("Cm7")
     chord2 = chords.get_chord(notes_param="C Eb G Bb")
     assert chord1.names.items == chord2.names.items
+
+
+def test_get_chord_cache():
+    chord = chords.get_chord(notes_param="C Eb G Bb")
+    hits = chords.CHORD_CACHE.hits
+    cached_chord = chords.get_chord(notes_param=" C  Eb G Bb ")
+    assert chords.CHORD_CACHE.hits == hits + 1
+    assert cached_chord is not chord
+    assert cached_chord.names.items == chord.names.items
+    chord.names.items.append("X")
+    chord.intervals.items[1].note2 = chord.notes.items[0]
+    cached_chord = chords.get_chord(notes_param="C Eb G Bb")
+    assert "X" not in cached_chord.names.items
+    assert cached_chord.intervals.items[1].note2.name == "Eb"
+    with pytest.raises(ValueError):
+        chords.get_chord()
@@ -0,0 +1,197 @@
+import os
+import json
+import mmap
+import stat
+import pytest
+import musicinpython.datahelper as datahelper
+
+
+class TestDataTableClass:
+    table = datahelper.DataTable.from_items(
+        [
+            ("Cm7 (I bIII V bVII)", "C Eb G Bb"),
+            ("C (I III V)", "C E G"),
+            ("Cm(#13) (I bIII V #VI)", "C Eb G Bb"),
+        ]
+    )
+
+    def test_invalid_buffer(self):
+        with pytest.raises(ValueError):
+            datahelper.DataTable(b"JSON" + bytes(8))
+
+    def test_items(self):
+        assert len(self.table) == 3
+        assert list(self.table.items())[0] == ("C (I III V)", "C E G")
+
+    def test_get(self):
+        assert self.table.get("Cm7 (I bIII V bVII)") == "C Eb G Bb"
+        assert self.table.get("Cm7") is None
+
+    def test_find_prefix(self):
+        found = self.table.find_prefix("Cm")
+        assert [item[0] for item in found] == [
+            "Cm(#13) (I bIII V #VI)",
+            "Cm7 (I bIII V bVII)",
+        ]
+        assert self.table.find_prefix("D") == []
+
+    def test_find_value(self):
+        assert self.table.find_value("C Eb G Bb") == [
+            "Cm(#13) (I bIII V #VI)",
+            "Cm7 (I bIII V bVII)",
+        ]
+        assert self.table.find_value("C E") == []
+
+
+class TestTypeTableClass:
+    type_table = datahelper.DataTable.from_items(
+        [
+            ("", "I III V"),
+            ("6", "I III V VI"),
+            ("m(#13)", "I bIII V #VI"),
+            ("m7", "I bIII V bVII"),
+        ]
+    )
+    chord_table = datahelper.TypeTable(type_table)
+
+    def test_items(self):
+        assert len(self.chord_table) == 68
+        items = list(self.chord_table.items())
+        assert items[0] == ("A (I III V)", "A C# E")
+        assert items == sorted(items)
+        assert list(self.chord_table.root_items("Eb"))[1] == (
+            "Eb6 (I III V VI)",
+            "Eb G Bb C",
+        )
+
+    def test_get(self):
+        assert self.chord_table.get("Cm7 (I bIII V bVII)") == "C Eb G Bb"
+        assert self.chord_table.get("Cm7 (I bIII V VII)") is None
+        assert self.chord_table.get("Hm7 (I bIII V bVII)") is None
+
+    def test_find_prefix(self):
+        assert self.chord_table.find_prefix("Cm7 (") == [
+            ("Cm7 (I bIII V bVII)", "C Eb G Bb")
+        ]
+        keys = [key for (key, _) in self.chord_table.find_prefix("C")]
+        assert "C#m7 (I bIII V bVII)" in keys and len(keys) == 8
+
+    def test_find_value(self):
+        assert self.chord_table.find_value("C Eb G Bb") == [
+            "Cm(#13) (I bIII V #VI)",
+            "Cm7 (I bIII V bVII)",
+        ]
+        assert self.chord_table.find_value("C D# G Bb") == []
+        assert self.chord_table.find_value("Cb Eb") == []
+
+    def test_scale_types(self):
+        type_table = datahelper.DataTable.from_items(
+            [("Major", "I II III IV V VI VII"), ("Major #2", "I #II III")]
+        )
+        scale_table = datahelper.TypeTable(type_table, " ")
+        keys = [key for (key, _) in scale_table.root_items("A")]
+        assert keys == [
+            "A Major #2 (I #II III)",
+            "A Major (I II III IV V VI VII)",
+        ]
+        assert scale_table.get("A Major #2 (I #II III)") == "A C C#"
+        assert scale_table.find_value("A C C#") == ["A Major #2 (I #II III)"]
+        assert scale_table.find_prefix("A#") == scale_table.find_prefix("A# ")
+        assert scale_table.split_name("Ab Major") == ("Ab", "Major")
+        assert scale_table.split_name("AbMajor") is None
+
+
+def test_get_note_semitones():
+    assert datahelper.get_note_semitones("Eb G Bb C") == (0, 4, 7, 9)
+    assert datahelper.get_note_semitones("C H") is None
+    assert datahelper.get_note_semitones("") is None
+
+
+def test_rotation_types():
+    rotation_types = datahelper.get_rotation_types(
+        [("6", (0, 4, 7, 9)), ("m7", (0, 3, 7, 10))]
+    )
+    assert rotation_types["0 3 7 10"] == [(1, "6"), (0, "m7")]
+    assert rotation_types["0 4 7 9"] == [(0, "6"), (3, "m7")]
+    value = datahelper.format_rotation_types([(1, "6"), (0, "m7")], [])
+    assert value == "1:6, 0:m7; "
+    assert datahelper.parse_rotation_types(value) == [
+        [(1, "6"), (0, "m7")],
+        [],
+    ]
+
+
+def test_find_rotation_names():
+    rotation_table = datahelper.DataTable.from_items(
+        [("0 3 7 10", "1:6, 0:m7"), ("0 4 7 9", "0:6, 3:m7")]
+    )
+    assert datahelper.find_rotation_names(
+        "C Eb G Bb", rotation_table
+    ) == [["Eb6", "Cm7"]]
+    assert datahelper.find_rotation_names(
+        "Eb G Bb C", rotation_table, " "
+    ) == [["Eb 6", "C m7"]]
+    assert datahelper.find_rotation_names("C D# G Bb", rotation_table) == [
+        []
+    ]
+    assert datahelper.find_rotation_names("C E G", rotation_table) == []
+
+
+def test_dump_binary_file(tmp_path):
+    binary_path = os.path.join(tmp_path, "chords.bin")
+    datahelper.dump_binary_file({"C5 (I V)": "C G"}, binary_path)
+    with open(binary_path, "rb") as binary_file:
+        table = datahelper.DataTable(binary_file.read())
+    assert table.get("C5 (I V)") == "C G"
+
+    mapped_table = datahelper.get_binary_file(binary_path)
+    datahelper.dump_binary_file({"D5 (I V)": "D A"}, binary_path)
+    assert mapped_table.get("C5 (I V)") == "C G"
+    assert datahelper.get_binary_file(binary_path).get("D5 (I V)") == "D A"
+    assert os.listdir(tmp_path) == ["chords.bin"]
+    assert stat.S_IMODE(os.stat(binary_path).st_mode) == 0o644
+    os.chmod(binary_path, 0o600)
+    datahelper.dump_binary_file({"E5 (I V)": "E B"}, binary_path)
+    assert stat.S_IMODE(os.stat(binary_path).st_mode) == 0o600
+
+
+def test_dump_json_items(tmp_path):
+    json_path = os.path.join(tmp_path, "chords.json")
+    items = [("C5 (I V)", "C G"), ("Cm (I bIII V)", "C Eb G")]
+    assert datahelper.dump_json_items(iter(items), json_path) == 2
+    with open(json_path, "r") as json_file:
+        assert json_file.read() == json.dumps(dict(items), indent=4)
+    datahelper.dump_json_items([], json_path)
+    with open(json_path, "r") as json_file:
+        assert json.load(json_file) == {}
+
+
+@pytest.mark.parametrize(
+    "indent, lines, compress",
+    [(None, False, False), (None, True, False), (4, True, True)],
+)
+def test_dump_json_items_formats(
+    tmp_path, monkeypatch, indent, lines, compress
+):
+    json_path = os.path.join(tmp_path, "chords.json")
+    json_path = datahelper.get_json_path(json_path, lines, compress)
+    items = [("C5 (I V)", "C G"), ("Cm (I bIII V)", "C Eb G")]
+    datahelper.dump_json_items(items, json_path, indent, lines, compress)
+    monkeypatch.setattr(datahelper, "get_data_folder", lambda: tmp_path)
+    file_name = os.path.basename(json_path)
+    assert datahelper.get_json_file(file_name) == dict(items)
+
+
+def test_get_json_path():
+    assert datahelper.get_json_path("a.json") == "a.json"
+    assert datahelper.get_json_path("a.json", True) == "a.jsonl"
+    assert datahelper.get_json_path("a.json", True, True) == "a.jsonl.gz"
+    assert datahelper.get_json_path("a.json", compress=True) == "a.json.gz"
+
+
+def test_get_data_table():
+    table = datahelper.get_data_table("triadtypes.json")
+    assert isinstance(table.buffer, mmap.mmap)
+    assert table.get("m") == "I bIII V"
+    with pytest.raises(FileNotFoundError):
+        datahelper.get_data_table("triadchords.json")
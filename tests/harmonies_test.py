@@ -1,6 +1,71 @@
+import json
+import subprocess
+import sys
 import musicinpython.harmonies as harmonies
 
 
+def test_lazy_process_pool():
+    code = (
+        "import sys, musicinpython.harmonies; "
+        "print('concurrent.futures' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.stdout.strip() == "False"
+
+
 def test_get_scale_harmony():
     harm = harmonies.get_scale_harmony("B Lydian")
     assert "Fm7(b5)" in harm
+
+
+class TestHarmonizerClass:
+    harmonizer = harmonies.Harmonizer(
+        [
+            ("Cdim(#13) (I bIII bV #VI)", "C Eb Gb Bb"),
+            ("Cm(#13) (I bIII V #VI)", "C Eb G Bb"),
+            ("Cm7 (I bIII V bVII)", "C Eb G Bb"),
+            ("C7M (I III V VII)", "C E G B"),
+        ]
+    )
+
+    def test_qualities(self):
+        assert self.harmonizer.qualities[(3, 6, 10)] == "m7(b5)"
+        assert self.harmonizer.qualities[(3, 7, 10)] == "m7"
+
+    def test_harmonize(self):
+        note_names = "C D E F G A B".split()
+        chord_names = self.harmonizer.harmonize(note_names)
+        assert chord_names == [
+            "C7M",
+            "Dm7",
+            "Em7",
+            "F7M",
+            None,
+            "Am7",
+            "Bm7(b5)",
+        ]
+
+
+def test_harmonize_scales():
+    harmonies_dict = harmonies.harmonize_scales(["C Major", "A Minor"])
+    assert harmonies_dict["C Major"][0] == "C7M"
+    assert harmonies_dict["A Minor"][1] == "Bm7(b5)"
+    assert len(harmonies.harmonize_scales()) == len(
+        harmonies.scales.SCALE_NOTES
+    )
+
+
+def test_dump_scale_harmonies(tmp_path):
+    file_path = tmp_path / "harmonies.jsonl"
+    scale_names = ["C Major", "A Minor", "C Major pentatonic"]
+    count = harmonies.dump_scale_harmonies(
+        file_path, scale_names, max_workers=2, chunk_size=1
+    )
+    with open(file_path, "r") as harmonies_file:
+        lines = [json.loads(line) for line in harmonies_file]
+    assert count == 3
+    assert [line["scale"] for line in lines] == scale_names
+    minor_harmony = harmonies.harmonize_scales(["A Minor"])["A Minor"]
+    assert lines[1]["chords"] == minor_harmony
@@ -66,6 +66,61 @@ class TestIntervalClass:
         assert interv1.name == "bV" and interv2.name == "bIII"
 
 
+def test_interval_between():
+    note_c = notes.Note("C")
+    assert intervals.interval_between(note_c, notes.Note("F#")) == "bV"
+    assert intervals.interval_between(note_c, notes.Note("G#")) == "#V"
+    assert intervals.interval_between(notes.Note("A"), note_c) == "bIII"
+
+
+def test_transpose():
+    assert intervals.transpose(notes.Note("D"), "III").name == "F#"
+    assert intervals.transpose(notes.Note("F"), "#IV").name == "B"
+    assert intervals.transpose(notes.Note("Eb"), "bIV").name == "G"
+    with pytest.raises(intervals.InvalidIntervalAttributeError):
+        intervals.transpose(notes.Note("C"), "IIII")
+
+
+class TestBulkFunctions:
+    @pytest.fixture(autouse=True)
+    def np(self):
+        return pytest.importorskip("numpy")
+
+    def test_get_pitch_classes(self):
+        pitch_classes = intervals.get_pitch_classes([["C", "Eb"], ["B", "C"]])
+        assert pitch_classes.tolist() == [[0, 3], [11, 0]]
+        with pytest.raises(notes.InvalidNoteNameError):
+            intervals.get_pitch_classes(["C", "H"])
+
+    def test_get_interval_classes(self, np):
+        melody = np.array([0, 4, 7, 2])
+        assert intervals.get_interval_classes(melody).tolist() == [4, 3, 7]
+        bass = np.array([9, 0, 0, 7])
+        interval_classes = intervals.get_interval_classes(bass, melody)
+        assert interval_classes.tolist() == [3, 4, 7, 7]
+
+    def test_transpose_pitch_classes(self):
+        melody = [0, 4, 7, 11]
+        transposed = intervals.transpose_pitch_classes(melody, "bIII")
+        assert transposed.tolist() == [3, 7, 10, 2]
+        transposed = intervals.transpose_pitch_classes(melody, -1)
+        assert transposed.tolist() == [11, 3, 6, 10]
+        with pytest.raises(intervals.InvalidIntervalAttributeError):
+            intervals.transpose_pitch_classes(melody, "IIII")
+
+    def test_get_names(self):
+        interval_names = intervals.get_interval_names([0, 6, 8])
+        assert interval_names.tolist() == ["I", "bV", "#V"]
+        note_names = intervals.get_note_names([1, 6], "D")
+        assert note_names.tolist() == ["C#", "F#"]
+        for name in notes.ALL_NOTE_NAMES:
+            note_obj = notes.Note(name)
+            pitch_classes = intervals.get_pitch_classes([name])
+            transposed = intervals.transpose_pitch_classes(pitch_classes, 5)
+            note_names = intervals.get_note_names(transposed, name)
+            assert note_names[0] == note_obj.transpose(5).name
+
+
 def test_all_about_interval():
     message1 = intervals.all_about_interval(intervals.Interval("I"))
     message2 = intervals.all_about_interval(intervals.Interval("II"))
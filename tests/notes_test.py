@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest
 import musicinpython.notes as notes
 
@@ -27,6 +29,32 @@ class TestNoteClass:
         assert self.note_sharp.is_sharp() is True
         assert self.note_flat.is_sharp() is False
 
+    def test_pitch_class(self):
+        assert self.note_natural.pitch_class == 2
+        assert self.note_sharp.pitch_class == 3
+        assert self.note_flat.pitch_class == 1
+        assert notes.Note("B").pitch_class == 11
+
+    def test_equality(self):
+        assert self.note_sharp == notes.Note("D#")
+        assert self.note_sharp != notes.Note("Eb")
+        assert self.note_sharp.is_enharmonic(notes.Note("Eb"))
+        assert len({self.note_sharp, notes.Note("D#")}) == 1
+
+    def test_interning(self):
+        assert notes.Note("D#") is self.note_sharp
+        assert copy.deepcopy(self.note_sharp) is self.note_sharp
+        assert pickle.loads(pickle.dumps(self.note_sharp)) is self.note_sharp
+        with pytest.raises(AttributeError):
+            self.note_sharp.name = "E"
+
+    def test_transpose(self):
+        assert self.note_natural.transpose(1).name == "D#"
+        assert self.note_flat.transpose(-2).name == "B"
+        assert (self.note_flat + 3).name == "E"
+        assert (self.note_natural - 3).name == "B"
+        assert self.note_natural - self.note_sharp == 11
+
     def test_enharmonize(self):
         enharmonized_sharp = notes.enharmonize_note(self.note_sharp)
         enharmonized_flat = notes.enharmonize_note(self.note_flat)
@@ -53,6 +81,21 @@ class TestChromaticScaleGeneratorClass:
         assert self.flat_chroma_gen.notes[11].name == "C"
 
 
+def test_chromatic_tables():
+    scale = notes.make_chromatic_scale("Bb")
+    assert [note.name for note in scale][:3] == ["Bb", "B", "C"]
+    assert notes.CHROMATIC_SCALES["Bb"] == scale
+    assert notes.CHROMATIC_INDEXES["D"]["F#"] == 4
+    assert "Gb" not in notes.CHROMATIC_INDEXES["D"]
+
+
+def test_get_pitch_class_set():
+    assert notes.get_pitch_class_set(["C", "Eb", "G"]) == 0b10001001
+    assert notes.get_pitch_class_set(["G", "D#", "C", "C"]) == 0b10001001
+    with pytest.raises(notes.InvalidNoteNameError):
+        notes.get_pitch_class_set(["C", "H"])
+
+
 def test_display_chromatic_scale():
     note_obj = notes.Note("E")
     chromatic_scale_message = notes.display_chromatic_scale(note_obj)
@@ -69,3 +112,12 @@ def test_all_about_note():
     assert "natural" in note_message1
     assert "sharp" in note_message2 and "Eb" in note_message2
     assert "flat" in note_message3 and "C#" in note_message3
+
+
+def test_get_note_rotations():
+    assert notes.get_note_rotations("C E G") == ["C E G", "E G C", "G C E"]
+    assert notes.get_note_rotations("") == []
+
+
+def test_get_alternation():
+    assert notes.get_alternation(["C", "C#", "(b5)"]) == r"\(b5\)|C\#|C"
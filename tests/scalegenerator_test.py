@@ -2,6 +2,7 @@ import os
 import json
 import musicinpython.generators.scalegenerator as scalegen
 import musicinpython.datahelper as datahelper
+import musicinpython.scales as scales
 
 
 class TestScaleClass:
@@ -55,12 +56,81 @@ def test_generate_all_scales():
     assert "I II III V bVI" in scales_intervals
 
 
-def test_dump_scales():
-    all_scales = scalegen.generate_all_scales()
-    data_folder = datahelper.get_data_folder()
-    scales_path = os.path.join(data_folder, "all_scales.json")
-    scalegen.dump_scales(all_scales, data_folder)
+def test_iter_all_scales():
+    root_scales = scalegen.generate_root_scales("C")
+    all_scales = scalegen.iter_all_scales()
+    for scale in root_scales:
+        assert next(all_scales).name == scale.name
+    assert next(all_scales).name == "C# Major"
+    scale = scalegen.Scale("I II III V VI", "C Major pentatonic")
+    assert scalegen.get_scale_item(scale) == (
+        "C Major pentatonic (I II III V VI)",
+        "C D E G A",
+    )
+
+
+def test_parse_generated_scale_names():
+    scale_formulas = dict(scalegen.DIATONIC_SCALES, **scalegen.PENTATONICS)
+    assert scales.SCALE_FORMULAS == scale_formulas
+    for scale in scalegen.generate_all_scales():
+        scale.get_scale_notes()
+        root, scale_intervals = scales.parse_scale_name(scale.name)
+        assert " ".join(scale_intervals) == scale.intervals
+        assert " ".join(scales.spell_scale(root, scale_intervals)) == (
+            scale.notes
+        )
+
+
+def test_dump_scales(tmp_path):
+    scales_path = os.path.join(tmp_path, "all_scales.json")
+    scalegen.dump_scales(scalegen.iter_all_scales(), tmp_path)
     with open(scales_path, "r") as scales_file:
         scales_str = str(json.load(scales_file))
     assert "A Ionian #6" in scales_str
     assert "A B C# D E G G#" in scales_str
+    types_path = os.path.join(tmp_path, "scaletypes.bin")
+    type_table = datahelper.get_binary_file(types_path)
+    assert type_table.get("Ionian #6") == "I II III IV V #VI VII"
+    assert sorted(os.listdir(tmp_path)) == [
+        "all_scales.json",
+        "scalealternatives.bin",
+        "scaletypes.bin",
+    ]
+    assert dict(type_table.items()) == dict(
+        datahelper.get_data_table("scaletypes.json").items()
+    )
+
+
+def test_dump_scales_lines(tmp_path):
+    scalegen.dump_scales(scalegen.iter_all_scales(), tmp_path, None, True)
+    with open(os.path.join(tmp_path, "all_scales.jsonl"), "r") as lines:
+        first_line = json.loads(lines.readline())
+    assert first_line == {"C Major (I II III IV V VI VII)": "C D E F G A B"}
+
+
+def test_generate_alternative_types():
+    scale_types = {
+        "Major": "I II III IV V VI VII",
+        "Dorian": "I II bIII IV V VI bVII",
+        "Major b7": "I II III IV V VI bVII",
+    }
+    alternative_types = scalegen.generate_alternative_types(scale_types)
+    assert alternative_types["0 2 4 5 7 9 11"] == (
+        "0:Major, 1:Dorian; 4:Major b7"
+    )
+    assert alternative_types["0 2 4 5 7 9 10"] == (
+        "3:Major, 4:Dorian; 0:Major b7"
+    )
+
+
+def test_generate_scale_types():
+    scale_dump = {
+        "C Major (I II III IV V VI VII)": "C D E F G A B",
+        "C# Major (I II III IV V VI VII)": "C# D# F F# G# A# C",
+        "Db Major pentatonic b6 (I II III V bVI)": "Db Eb F Ab A",
+    }
+    scale_types = scalegen.generate_scale_types(scale_dump)
+    assert scale_types == {
+        "Major": "I II III IV V VI VII",
+        "Major pentatonic b6": "I II III V bVI",
+    }
@@ -1,4 +1,70 @@
+import subprocess
+import sys
+import pytest
 import musicinpython.scales as scales
+import musicinpython.datahelper as datahelper
+
+
+def test_lazy_loading():
+    code = "import musicinpython.scales as m; print('all_scales' in vars(m))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.stdout.strip() == "False"
+    assert len(scales.SCALE_NOTES) == len(scales.SCALE_NAMES_INTERVALS)
+    assert scales.get_scale_index() is scales.SCALE_INDEX
+
+
+class TestScaleIndexClass:
+    scale_table = datahelper.DataTable.from_items(
+        [
+            ("C Ionian (I II III IV V VI VII)", "C D E F G A B"),
+            ("C Major (I II III IV V VI VII)", "C D E F G A B"),
+        ]
+    )
+    scale_index = scales.ScaleIndex(scale_table)
+
+    def test_get_names(self):
+        names = self.scale_index.get_names("C D E F G A B")
+        assert names == ["C Ionian", "C Major"]
+        assert self.scale_index.get_names("C D") == []
+
+    def test_get_notes(self):
+        assert self.scale_index.get_notes("C Major") == "C D E F G A B"
+        assert self.scale_index.get_notes("C Minor") == ""
+
+    def test_get_intervals(self):
+        intervals = self.scale_index.get_intervals("C D E F G A B")
+        assert intervals == "I II III IV V VI VII"
+
+    def test_get_alternative_names(self):
+        scale_table = datahelper.DataTable.from_items(
+            [
+                ("C Major (I II III IV V VI VII)", "C D E F G A B"),
+                ("D Dorian (I II bIII IV V VI bVII)", "D E F G A B C"),
+                ("D Minor #6 (I II bIII IV V #VI bVII)", "D E F G A B C"),
+            ]
+        )
+        scale_index = scales.ScaleIndex(scale_table)
+        names = scale_index.get_alternative_names("C D E F G A B")
+        assert names == ["C Major", "D Dorian"]
+        names = scale_index.get_alternative_names("C D E F G A B", True)
+        assert names == ["C Major", "D Dorian", "D Minor #6"]
+        names = self.scale_index.get_alternative_names("D E F G A B C")
+        assert names == ["C Ionian", "C Major"]
+
+    def test_get_alternative_names_table(self):
+        alternatives_table = datahelper.DataTable.from_items(
+            [("0 2 4 5 7 9 11", "0:Ionian, 0:Major, 1:Dorian; 1:Minor #6")]
+        )
+        scale_index = scales.ScaleIndex(self.scale_table, alternatives_table)
+        names = scale_index.get_alternative_names("C D E F G A B")
+        assert names == ["C Ionian", "C Major", "D Dorian"]
+        names = scale_index.get_alternative_names("C D E F G A B", True)
+        assert names == ["C Ionian", "C Major", "D Dorian", "D Minor #6"]
+        assert scale_index.get_alternative_names("C D") == []
+        names = scales.get_scale_index().get_alternative_names("C D E F G A B")
+        assert "A Aeolian" in names and "A Minor #6" not in names
 
 
 def test_get_scale_names():
@@ -11,9 +77,64 @@ def test_get_scale_intervals():
     assert scale_intervals.items[6].name == "VII"
 
 
+def test_parse_scale_name():
+    assert scales.parse_scale_name("F# Major pentatonic b6") == (
+        "F#",
+        ["I", "II", "III", "V", "bVI"],
+    )
+    scale_intervals = scales.parse_scale_name("Bb Dorian #4 maj7")[1]
+    assert scale_intervals == ["I", "VII", "bIII", "#IV", "V", "VI", "bVII"]
+    for name in ["C Major b2 #2", "C Dorian b7", "H Major", "C major"]:
+        with pytest.raises(scales.InvalidScaleNameError):
+            scales.parse_scale_name(name)
+
+
+def test_spell_scale():
+    scale_intervals = ["I", "II", "bIII", "IV", "V", "bVI", "VII"]
+    scale_notes = scales.spell_scale("A", scale_intervals)
+    assert scale_notes == ["A", "B", "C", "D", "E", "F", "G#"]
+
+
 def test_get_scale_notes():
     scale_notes = scales.get_scale_notes("C Major")
     assert scale_notes.items[6].name == "B"
+    scale_notes = scales.get_scale_notes("C Major b7 #4")
+    assert scale_notes.get_notes_str() == "C D E Gb G A Bb"
+
+
+class TestScaleIdentifierClass:
+    scale_identifier = scales.ScaleIdentifier(
+        [
+            ("A Minor (I II bIII IV V bVI bVII)", "A B C D E F G"),
+            ("C Major (I II III IV V VI VII)", "C D E F G A B"),
+            ("C Major pentatonic (I II III V VI)", "C D E G A"),
+        ]
+    )
+
+    def test_identify(self):
+        names = self.scale_identifier.identify("C D E F G A B")
+        assert names == ["C Major", "A Minor"]
+        assert self.scale_identifier.identify("A G F E D C B", "C") == [
+            "C Major"
+        ]
+        assert self.scale_identifier.identify("C D E") == []
+
+    def test_find_containing(self):
+        names = self.scale_identifier.find_containing("E C G")
+        assert names == ["C Major pentatonic", "A Minor", "C Major"]
+        names = self.scale_identifier.find_containing("E C G", "A")
+        assert names == ["A Minor"]
+        assert self.scale_identifier.find_containing("C Db") == []
+
+
+def test_find_scales():
+    assert "G Mixolydian" in scales.identify_scale("G A B C D E F").items
+    names = scales.find_scales_for_chord("Cm7", same_root=True).items
+    assert "C Dorian" in names and "C Minor pentatonic" in names
+    assert "Eb Major" not in names
+    assert "Eb Major" in scales.find_scales_for_chord("Cm7").items
+    scale = scales.get_scale("B A G F E D C")
+    assert scale.notes.get_notes_str() == "B C D E F G A"
 
 
 class TestScaleNamesClass:
@@ -24,11 +145,14 @@ class TestScaleNamesClass:
         notes_str = "C D E F G A B"
         self.cmaj_names.get_alternative_names(notes_str)
         assert "C Ionian" in self.cmaj_names.items
+        assert "D Dorian" in self.cmaj_names.items
+        assert "F Ionian #4" not in self.cmaj_names.items
 
     def test_get_alternative_names_variants(self):
         notes_str = "D E F G A B C"
         self.ddor_names.get_alternative_names(notes_str, True)
         assert "D Dorian" in self.ddor_names.items
+        assert "F Ionian #4" in self.ddor_names.items
 
     def test_get_names_information(self):
         message = self.cmaj_names.get_names_information()
@@ -65,3 +189,18 @@ def test_get_scale():
     assert scale.names is not None
     assert scale.intervals is not None
     assert scale.notes is not None
+    assert scales.get_scale("C D E F G A B ") is not scale
+    assert scales.SCALE_CACHE.hits >= 1
+
+
+def test_get_scale_copies():
+    scale = scales.get_scale("C D E F G A B")
+    scale_names = list(scale.names.items)
+    scale.names.get_alternative_names(scale.notes.get_notes_str())
+    assert scale.names.items != scale_names
+    scale.intervals.assign_notes_to_intervals(scale.notes.items[::-1])
+    new_scale = scales.get_scale("C D E F G A B")
+    assert new_scale.names.items == scale_names
+    assert new_scale.intervals.items[1].note2 == ""
+    with pytest.raises(ValueError):
+        scales.get_scale(" ")